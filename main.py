@@ -1,13 +1,26 @@
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 import logging
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
-from routes import base, data, nlp
+from routes import base, data, nlp, jobs
 from utils import get_settings
+from utils.single_flight import SingleFlight
+from utils.job_runner import JobRunner
 from stores.llm import LLMProviderFactory
+from stores.llm.wrappers import (
+    CachedEmbeddingClient,
+    BatchedEmbeddingClient,
+    RateLimitedEmbeddingClient,
+)
 from stores.vectordb import VectorDBProviderFactory
+from stores.vectordb.wrappers import VersionedVectorDBClient
+from stores.embedding_cache import EmbeddingCacheProviderFactory
+from stores.cache import SemanticAnswerCache, CacheProviderFactory, CacheEnum
+from models.enums import JobBackendEnum
 from stores.llm.templates.template_parser import TemplateParser
 
 logger = logging.getLogger("uvicorn")
@@ -19,6 +32,27 @@ async def lifespan(app: FastAPI):  # pylint: disable=[W0621]
     settings = get_settings()
     app.state.settings = settings
 
+    # Jobs queued in Postgres write the collections from the worker processes, their
+    # version bumps would never reach the API's in-memory search cache
+    is_postgres_jobs = settings.JOBS_BACKEND == JobBackendEnum.POSTGRES.value
+    if (
+        is_postgres_jobs
+        and settings.SEARCH_CACHE_ENABLED
+        and settings.SEARCH_CACHE_BACKEND == CacheEnum.MEMORY.value
+    ):
+        raise RuntimeError(
+            "SEARCH_CACHE_BACKEND: REDIS is required with JOBS_BACKEND: POSTGRES"
+        )
+    if (
+        is_postgres_jobs
+        and settings.ANSWER_CACHE_ENABLED
+        and not settings.SEARCH_CACHE_ENABLED
+    ):
+        # Answers are keyed on the collection versions the workers bump in the shared cache
+        raise RuntimeError(
+            "SEARCH_CACHE_ENABLED is required for ANSWER_CACHE_ENABLED with JOBS_BACKEND: POSTGRES"
+        )
+
     postgres_conn_url = f"postgresql+asyncpg://{settings.POSTGRES_USERNAME}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_MAIN_DATABASE}"
     app.state.db_engine = create_async_engine(postgres_conn_url)
     app.state.db_client = sessionmaker(
@@ -49,6 +83,50 @@ async def lifespan(app: FastAPI):  # pylint: disable=[W0621]
     app.state.embedding_client.set_embedding_model(  # type: ignore
         app.state.settings.EMBEDDING_MODEL_ID, app.state.settings.EMBEDDING_MODEL_SIZE
     )
+    embedding_provider = app.state.embedding_client
+    app.state.embedding_client = RateLimitedEmbeddingClient(
+        client=embedding_provider,  # type: ignore
+        max_batch_size=embedding_provider.embedding_max_batch_size,  # type: ignore
+        max_batch_tokens=embedding_provider.embedding_max_batch_tokens,  # type: ignore
+        requests_per_minute=embedding_provider.embedding_requests_per_minute,  # type: ignore
+        tokens_per_minute=embedding_provider.embedding_tokens_per_minute,  # type: ignore
+        max_concurrency=app.state.settings.EMBEDDING_MAX_CONCURRENCY,
+        max_retries=app.state.settings.EMBEDDING_MAX_RETRIES,
+        retry_base_delay=app.state.settings.EMBEDDING_RETRY_BASE_DELAY,
+        retry_max_delay=app.state.settings.EMBEDDING_RETRY_MAX_DELAY,
+    )
+
+    app.state.embedding_cache = None
+    if app.state.settings.EMBEDDING_CACHE_ENABLED:
+        embedding_cache_factory = EmbeddingCacheProviderFactory(
+            config=app.state.settings, db_client=app.state.db_client  # type: ignore
+        )
+        app.state.embedding_cache = embedding_cache_factory.create(
+            app.state.settings.EMBEDDING_CACHE_BACKEND
+        )
+        if app.state.embedding_cache is None:
+            logger.error("Can't Create Embedding Cache Client")
+        else:
+            await app.state.embedding_cache.connect()
+            app.state.embedding_client = CachedEmbeddingClient(
+                client=app.state.embedding_client,  # type: ignore
+                embedding_cache=app.state.embedding_cache,
+            )
+
+    if app.state.settings.QUERY_EMBEDDING_BATCH_ENABLED:
+        app.state.embedding_client = BatchedEmbeddingClient(
+            client=app.state.embedding_client,  # type: ignore
+            max_batch_size=app.state.settings.QUERY_EMBEDDING_BATCH_MAX_SIZE,
+            max_wait_ms=app.state.settings.QUERY_EMBEDDING_BATCH_MAX_WAIT_MS,
+        )
+
+    app.state.answer_cache = None
+    if app.state.settings.ANSWER_CACHE_ENABLED:
+        app.state.answer_cache = SemanticAnswerCache(
+            similarity_threshold=app.state.settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+            max_entries_per_project=app.state.settings.ANSWER_CACHE_MAX_ENTRIES_PER_PROJECT,
+            ttl_seconds=app.state.settings.ANSWER_CACHE_TTL_SECONDS,
+        )
 
     app.state.vectordb_client = vectordb_provider_factory.creat(
         app.state.settings.VECTOR_DB_BACKEND
@@ -59,6 +137,39 @@ async def lifespan(app: FastAPI):  # pylint: disable=[W0621]
 
     await app.state.vectordb_client.connect()  # type: ignore
 
+    app.state.search_cache = None
+    if app.state.settings.SEARCH_CACHE_ENABLED:
+        app.state.search_cache = CacheProviderFactory(app.state.settings).create(
+            app.state.settings.SEARCH_CACHE_BACKEND
+        )
+        if app.state.search_cache is None:
+            logger.error("Can't Create Search Cache Client")
+        else:
+            await app.state.search_cache.connect()
+            app.state.vectordb_client = VersionedVectorDBClient(
+                client=app.state.vectordb_client,  # type: ignore
+                cache=app.state.search_cache,
+            )
+
+    # Spawned (not forked) workers, the server process already runs threads
+    app.state.process_pool = (
+        ProcessPoolExecutor(
+            max_workers=app.state.settings.PROCESSING_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        if app.state.settings.PROCESSING_MAX_WORKERS > 0
+        else None
+    )
+
+    app.state.single_flight = (
+        SingleFlight() if app.state.settings.SINGLE_FLIGHT_ENABLED else None
+    )
+
+    app.state.job_runner = JobRunner(
+        max_concurrent_jobs=app.state.settings.JOBS_MAX_CONCURRENT,
+        max_finished_jobs=app.state.settings.JOBS_MAX_FINISHED,
+    )
+
     app.state.template_parser = TemplateParser(
         language=app.state.settings.PRIMARY_LANGUAGE
     )
@@ -66,8 +177,17 @@ async def lifespan(app: FastAPI):  # pylint: disable=[W0621]
     yield  # The application runs here
 
     # Shutdown
+    await app.state.job_runner.shutdown()
+    if app.state.process_pool is not None:
+        app.state.process_pool.shutdown(wait=False, cancel_futures=True)
     await app.state.db_engine.dispose()
     await app.state.vectordb_client.disconnect()  # type: ignore
+    await app.state.generation_client.aclose()  # type: ignore
+    await app.state.embedding_client.aclose()  # type: ignore
+    if app.state.embedding_cache is not None:
+        await app.state.embedding_cache.disconnect()
+    if app.state.search_cache is not None:
+        await app.state.search_cache.disconnect()
     logger.info("Postgresql connection closed.")
 
 
@@ -76,6 +196,7 @@ app = FastAPI(lifespan=lifespan)
 app.include_router(base.base_router)
 app.include_router(data.data_router)
 app.include_router(nlp.nlp_router)
+app.include_router(jobs.jobs_router)
 
 
 def main():
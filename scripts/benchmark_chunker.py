@@ -0,0 +1,125 @@
+"""
+Micro-benchmark for the chunking strategies against the previous line splitter.
+
+Run from the repository root (after `pip install -e .`):
+    python scripts/benchmark_chunker.py --scale 2000 --chunk-size 512 --overlap-size 64
+"""
+
+import os
+import time
+import argparse
+import tracemalloc
+from typing import Callable, Iterable, List
+from stores.chunkers import ChunkerEnum, ChunkerProviderFactory, Document
+
+
+def legacy_simple_splitter(pages: Iterable[Document], chunk_size: int):
+    # `ProcessController.process_simpler_splitter` before the chunking engine
+    full_text = " ".join(page.page_content for page in pages)
+    lines = [doc for doc in full_text.split("\n") if len(doc.strip()) > 1]
+    chunks = []
+    current_chunk = ""
+    for line in lines:
+        current_chunk += line + "\n"
+        if len(current_chunk) >= chunk_size:
+            chunks.append(Document(page_content=current_chunk.strip(), metadata={}))
+            current_chunk = ""
+
+    if len(current_chunk) > 0:
+        chunks.append(Document(page_content=current_chunk.strip(), metadata={}))
+
+    return chunks
+
+
+def build_pages(text: str, scale: int, lines_per_page: int) -> List[Document]:
+    lines = (text.rstrip("\n") + "\n").splitlines(keepends=True) * scale
+    return [
+        Document(
+            page_content="".join(lines[start : start + lines_per_page]),
+            metadata={"page": page_number},
+        )
+        for page_number, start in enumerate(range(0, len(lines), lines_per_page))
+    ]
+
+
+def check_chunks(chunks: List[Document], chunk_size: int, overlap_size: int) -> bool:
+    return all(len(chunk.page_content) <= chunk_size for chunk in chunks) and all(
+        current.page_content.startswith(previous.page_content[-overlap_size:])
+        for previous, current in zip(chunks, chunks[1:])
+    )
+
+
+def run_case(
+    name: str, split: Callable[[], List[Document]], text_size: int, repeats: int
+):
+    timings = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        chunks = split()
+        timings.append(time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    split()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best_seconds = min(timings)
+    print(
+        f"{name:<10} chunks={len(chunks):<8} best={best_seconds * 1000:9.2f} ms  "
+        f"throughput={text_size / best_seconds / 1e6:8.2f} MB/s  "
+        f"peak_memory={peak_memory / 1e6:8.2f} MB"
+    )
+    return chunks
+
+
+def main():
+    """Entry Point for the Program."""
+    parser = argparse.ArgumentParser(description="Benchmark the chunking strategies.")
+    parser.add_argument(
+        "--file",
+        default=os.path.join("assets", "wiki_article.txt"),
+        help="Source text, repeated `--scale` times",
+    )
+    parser.add_argument("--scale", type=int, default=2000)
+    parser.add_argument("--lines-per-page", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--overlap-size", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.file, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    pages = build_pages(text, args.scale, args.lines_per_page)
+    text_size = sum(len(page.page_content) for page in pages)
+    print(
+        f"{len(pages)} pages, {text_size / 1e6:.2f} MB of text, "
+        f"chunk_size={args.chunk_size}, overlap_size={args.overlap_size}\n"
+    )
+
+    run_case(
+        "legacy",
+        lambda: legacy_simple_splitter(pages, args.chunk_size),
+        text_size,
+        args.repeats,
+    )
+
+    chunker_factory = ChunkerProviderFactory()
+    for strategy in ChunkerEnum:
+        chunker = chunker_factory.create(
+            provider=strategy.value,
+            chunk_size=args.chunk_size,
+            overlap_size=args.overlap_size,
+        )
+        chunks = run_case(
+            strategy.value.lower(),
+            lambda: list(chunker.split_pages(pages)),  # type: ignore # pylint: disable=[W0640]
+            text_size,
+            args.repeats,
+        )
+        if not check_chunks(chunks, args.chunk_size, chunker.overlap_size):  # type: ignore
+            print(f"  !! {strategy.value} violated the chunk size or overlap")
+
+
+if __name__ == "__main__":
+    main()
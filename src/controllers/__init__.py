@@ -1,4 +1,7 @@
 from controllers.data_controller import DataController
+from controllers.upload_controller import UploadController
 from controllers.project_controller import ProjectController
 from controllers.process_controller import ProcessController
 from controllers.nlp_controller import NLPController
+from controllers.pipeline_controller import PipelineController
+from controllers.worker_controller import WorkerController
@@ -1,9 +1,29 @@
 import os
 import re
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import tarfile
+import zipfile
+from typing import IO, Callable, Dict, List, Optional, Set, Tuple
+import aiofiles
+import aiofiles.os
 from fastapi import UploadFile
 from controllers.base_controller import BaseController
 from controllers.project_controller import ProjectController
-from models import ResponseSignalEnum
+from models import (
+    ResponseSignalEnum,
+    AssetTypeEnum,
+    AssetDedupPolicyEnum,
+    AssetModel,
+    DataChunkModel,
+)
+from models.db_schemas import Asset, Project
+
+logger = logging.getLogger("uvicorn")
+
+ARCHIVE_EXTENSIONS = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
 
 
 class DataController(BaseController):
@@ -19,6 +39,29 @@ class DataController(BaseController):
 
         return True, ResponseSignalEnum.FILE_UPLOAD_SUCCESS.value
 
+    def validate_archive_file(self, file: UploadFile):
+        max_size = self.app_settings.FILE_BULK_MAX_SIZE * self.size_scale
+        if file.size > max_size:  # type: ignore
+            return False, ResponseSignalEnum.FILE_SIZE_EXCEEDED.value
+
+        return True, ResponseSignalEnum.FILE_UPLOAD_SUCCESS.value
+
+    def is_archive_file(self, file_name: str) -> bool:
+        return file_name.lower().endswith(ARCHIVE_EXTENSIONS)
+
+    def is_allowed_entry(self, entry_name: str) -> bool:
+        # Archive entries carry no content type, it is guessed from their extension
+        base_name = os.path.basename(entry_name)
+        if (
+            not base_name
+            or base_name.startswith(".")
+            or entry_name.startswith("__MACOSX/")
+        ):
+            return False
+        return (
+            mimetypes.guess_type(base_name)[0] in self.app_settings.FILE_ALLOWED_TYPES
+        )
+
     def clean_file_name(self, file_name: str):
         cleaned_file_name = re.sub(r"[^\w.]", "", file_name)
         cleaned_file_name = cleaned_file_name.replace(" ", "_")
@@ -38,6 +81,356 @@ class DataController(BaseController):
 
         return new_file_path, new_filename
 
+    async def save_uploaded_file(self, file: UploadFile, project_id: int) -> dict:
+        file_path, file_name = self.generate_unique_filepath(
+            original_file_name=file.filename, project_id=project_id  # type: ignore
+        )
+
+        # Hashed while it streams to disk, so deduplication needs no second read
+        file_hash = hashlib.sha256()
+        async with aiofiles.open(file_path, mode="wb") as f:  # type: ignore
+            while chunk := await file.read(self.app_settings.FILE_DEFAULT_CHUNK_SIZE):
+                file_hash.update(chunk)
+                await f.write(chunk)
+
+        return {
+            "original_file_name": file.filename,
+            "file_path": file_path,
+            "file_name": file_name,
+            "file_hash": file_hash.hexdigest(),
+        }
+
+    def save_archive_entry(
+        self, entry_file: IO[bytes], entry_name: str, project_id: int
+    ) -> dict:
+        # Runs in a thread; the declared entry size is not trusted, the written bytes are
+        entry_result = {"original_file_name": entry_name}
+        file_path, file_name = self.generate_unique_filepath(
+            original_file_name=os.path.basename(entry_name), project_id=project_id
+        )
+        max_size = self.app_settings.FILE_MAX_SIZE * self.size_scale
+        file_hash = hashlib.sha256()
+        file_size = 0
+        with open(file_path, mode="wb") as f:
+            while chunk := entry_file.read(self.app_settings.FILE_DEFAULT_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    break
+                file_hash.update(chunk)
+                f.write(chunk)
+
+        if file_size > max_size:
+            os.remove(file_path)
+            entry_result["signal"] = ResponseSignalEnum.FILE_SIZE_EXCEEDED.value
+            return entry_result
+
+        entry_result.update(
+            file_path=file_path, file_name=file_name, file_hash=file_hash.hexdigest()
+        )
+        return entry_result
+
+    def extract_zip_entries(
+        self, archive_path: str, entry_names: List[str], project_id: int
+    ) -> List[dict]:
+        # Each thread opens its own handle, a ZipFile is not shared across threads
+        entries_results = []
+        with zipfile.ZipFile(archive_path) as archive:
+            for entry_name in entry_names:
+                with archive.open(entry_name) as entry_file:
+                    entries_results.append(
+                        self.save_archive_entry(entry_file, entry_name, project_id)
+                    )
+        return entries_results
+
+    def extract_tar_entries(
+        self, archive_path: str, project_id: int, max_entries: int
+    ) -> List[dict]:
+        # A (compressed) tar is a stream, its entries are extracted in order
+        entries_results = []
+        with tarfile.open(archive_path) as archive:
+            for member in archive:
+                if not member.isfile() or not self.is_allowed_entry(member.name):
+                    continue
+                if len(entries_results) >= max_entries:
+                    entries_results.append(
+                        {
+                            "original_file_name": member.name,
+                            "signal": ResponseSignalEnum.BULK_FILES_LIMIT_EXCEEDED.value,
+                        }
+                    )
+                    continue
+                entry_file = archive.extractfile(member)
+                if entry_file is None:
+                    continue
+                with entry_file:
+                    entries_results.append(
+                        self.save_archive_entry(entry_file, member.name, project_id)
+                    )
+        return entries_results
+
+    async def extract_archive(
+        self, archive_path: str, archive_name: str, project_id: int, max_entries: int
+    ) -> List[dict]:
+        loop = asyncio.get_running_loop()
+        if archive_name.lower().endswith(".zip"):
+            with zipfile.ZipFile(archive_path) as archive:
+                entry_names = [
+                    info.filename
+                    for info in archive.infolist()
+                    if not info.is_dir() and self.is_allowed_entry(info.filename)
+                ]
+
+            skipped_results = [
+                {
+                    "original_file_name": entry_name,
+                    "signal": ResponseSignalEnum.BULK_FILES_LIMIT_EXCEEDED.value,
+                }
+                for entry_name in entry_names[max_entries:]
+            ]
+            entry_names = entry_names[:max_entries]
+
+            # The entries are split between FILE_BULK_MAX_CONCURRENCY threads
+            concurrency = max(1, self.app_settings.FILE_BULK_MAX_CONCURRENCY)
+            groups_results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        None,
+                        self.extract_zip_entries,
+                        archive_path,
+                        entry_names[i::concurrency],
+                        project_id,
+                    )
+                    for i in range(min(concurrency, len(entry_names)))
+                ]
+            )
+            return [
+                entry_result
+                for group_results in groups_results
+                for entry_result in group_results
+            ] + skipped_results
+
+        return await loop.run_in_executor(
+            None, self.extract_tar_entries, archive_path, project_id, max_entries
+        )
+
+    async def save_bulk_file(
+        self, file: UploadFile, project_id: int, max_entries: int
+    ) -> List[dict]:
+        if not self.is_archive_file(file.filename or ""):
+            is_valid, signal = self.validate_uploaded_file(file)
+            if not is_valid:
+                return [{"original_file_name": file.filename, "signal": signal}]
+            return [await self.save_uploaded_file(file, project_id)]
+
+        is_valid, signal = self.validate_archive_file(file)
+        if not is_valid:
+            return [{"original_file_name": file.filename, "signal": signal}]
+
+        # zipfile needs a seekable file it can reopen, the archive lands on disk first
+        archive = await self.save_uploaded_file(file, project_id)
+        try:
+            return await self.extract_archive(
+                archive_path=archive["file_path"],
+                archive_name=file.filename or "",
+                project_id=project_id,
+                max_entries=max_entries,
+            )
+        except (zipfile.BadZipFile, tarfile.TarError) as exc:
+            logger.error("Error while extracting archive: %s, %s", file.filename, exc)
+            return [
+                {
+                    "original_file_name": file.filename,
+                    "signal": ResponseSignalEnum.FILE_TYPE_NOT_SUPPORTED.value,
+                }
+            ]
+        finally:
+            await aiofiles.os.remove(archive["file_path"])
+
+    async def save_bulk_files(
+        self, files: List[UploadFile], project_id: int
+    ) -> List[dict]:
+        semaphore = asyncio.Semaphore(
+            max(1, self.app_settings.FILE_BULK_MAX_CONCURRENCY)
+        )
+        max_entries = self.app_settings.FILE_BULK_MAX_FILES
+
+        async def save_file(file: UploadFile):
+            async with semaphore:
+                try:
+                    return await self.save_bulk_file(file, project_id, max_entries)
+                except OSError as exc:
+                    logger.error(
+                        "Error while uploading file: %s, %s", file.filename, exc
+                    )
+                    return [
+                        {
+                            "original_file_name": file.filename,
+                            "signal": ResponseSignalEnum.FILE_UPLOAD_FAILED.value,
+                        }
+                    ]
+
+        files_results = await asyncio.gather(*[save_file(file) for file in files])
+        saved_files = [
+            file_result
+            for file_results in files_results
+            for file_result in file_results
+        ]
+
+        # The limit covers the whole request, archives only enforce it on their own
+        saved_count = 0
+        for saved_file in saved_files:
+            if "file_path" not in saved_file:
+                continue
+            saved_count += 1
+            if saved_count > max_entries:
+                await aiofiles.os.remove(saved_file.pop("file_path"))
+                saved_file["signal"] = (
+                    ResponseSignalEnum.BULK_FILES_LIMIT_EXCEEDED.value
+                )
+
+        return saved_files
+
+    async def create_file_assets(
+        self, db_client: Callable, project: Project, saved_files: List[dict]
+    ) -> List[Tuple[str, Optional[Asset], int]]:
+        # Uploads are content addressed by their SHA-256, a duplicate costs the upload
+        # only; the new assets of a request are inserted in one batch
+        asset_model = await AssetModel.create_instance(db_client=db_client)
+        dedup_policy = self.app_settings.FILE_DEDUP_POLICY
+        files_hashes = list({saved_file["file_hash"] for saved_file in saved_files})
+
+        existing_assets: Dict[str, Asset] = {}
+        for asset in await asset_model.get_assets_by_hashes(
+            asset_hashes=files_hashes, asset_project_id=project.project_id  # type: ignore
+        ):
+            existing_assets.setdefault(asset.asset_hash, asset)  # type: ignore
+
+        new_assets: Dict[str, Asset] = {}
+        duplicate_files = set()
+        for i, saved_file in enumerate(saved_files):
+            file_hash = saved_file["file_hash"]
+            if file_hash in existing_assets or file_hash in new_assets:
+                await aiofiles.os.remove(saved_file["file_path"])
+                duplicate_files.add(i)
+                continue
+
+            new_assets[file_hash] = Asset(  # type: ignore
+                asset_project_id=project.project_id,
+                asset_type=AssetTypeEnum.FILE.value,
+                asset_name=saved_file["file_name"],
+                asset_size=os.path.getsize(saved_file["file_path"]),
+                asset_hash=file_hash,
+            )
+
+        source_assets: Dict[str, Asset] = {}
+        lost_hashes: Set[str] = set()
+        if dedup_policy == AssetDedupPolicyEnum.REUSE.value and new_assets:
+            for asset in await asset_model.get_assets_by_hashes(
+                asset_hashes=list(new_assets)
+            ):
+                source_assets.setdefault(asset.asset_hash, asset)  # type: ignore
+
+        if new_assets:
+            inserted_assets = await asset_model.insert_many_assets(
+                assets=list(new_assets.values())
+            )
+            new_assets = {asset.asset_hash: asset for asset in inserted_assets}  # type: ignore
+            # A concurrent request stored the same content in the meantime: its asset
+            # is the one kept, these files become duplicates of it
+            lost_hashes = set(files_hashes) - set(existing_assets) - set(new_assets)
+            if lost_hashes:
+                for asset in await asset_model.get_assets_by_hashes(
+                    asset_hashes=list(lost_hashes),
+                    asset_project_id=project.project_id,  # type: ignore
+                ):
+                    existing_assets.setdefault(asset.asset_hash, asset)  # type: ignore
+                # A winner deleted before it could be fetched leaves its files on disk
+                for i, saved_file in enumerate(saved_files):
+                    if (
+                        saved_file["file_hash"] in lost_hashes
+                        and saved_file["file_hash"] in existing_assets
+                        and i not in duplicate_files
+                    ):
+                        await aiofiles.os.remove(saved_file["file_path"])
+                        duplicate_files.add(i)
+                for file_hash in lost_hashes:
+                    source_assets.pop(file_hash, None)
+
+        # Same bytes as a file of another project: its chunks are copied instead of
+        # extracted again. Its vectors are not, the copies stay unindexed until an
+        # incremental push embeds them, mostly from the embedding cache
+        reused_chunks: Dict[str, int] = {}
+        if source_assets:
+            chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+            for file_hash, source_asset in source_assets.items():
+                asset_record = new_assets[file_hash]
+                reused_chunks[file_hash] = await chunk_model.copy_asset_chunks(
+                    source_asset_id=source_asset.asset_id,  # type: ignore
+                    target_asset_id=asset_record.asset_id,  # type: ignore
+                    target_project_id=project.project_id,  # type: ignore
+                )
+                processed_hash = (source_asset.asset_config or {}).get("processed_hash")
+                if reused_chunks[file_hash] > 0 and processed_hash is not None:
+                    _ = await asset_model.update_asset_config(
+                        asset_id=asset_record.asset_id,  # type: ignore
+                        asset_config={"processed_hash": processed_hash},
+                    )
+
+        assets_results = []
+        for i, saved_file in enumerate(saved_files):
+            file_hash = saved_file["file_hash"]
+            if file_hash in lost_hashes and file_hash not in existing_assets:
+                assets_results.append(
+                    (ResponseSignalEnum.FILE_UPLOAD_FAILED.value, None, 0)
+                )
+            elif i in duplicate_files:
+                assets_results.append(
+                    (
+                        (
+                            ResponseSignalEnum.FILE_DUPLICATE_REJECTED.value
+                            if dedup_policy == AssetDedupPolicyEnum.REJECT.value
+                            else ResponseSignalEnum.FILE_DUPLICATE_LINKED.value
+                        ),
+                        existing_assets.get(file_hash) or new_assets[file_hash],
+                        0,
+                    )
+                )
+            elif file_hash in source_assets:
+                assets_results.append(
+                    (
+                        ResponseSignalEnum.FILE_DUPLICATE_REUSED.value,
+                        new_assets[file_hash],
+                        reused_chunks[file_hash],
+                    )
+                )
+            else:
+                assets_results.append(
+                    (
+                        ResponseSignalEnum.FILE_UPLOAD_SUCCESS.value,
+                        new_assets[file_hash],
+                        0,
+                    )
+                )
+
+        return assets_results
+
+    async def create_file_asset(
+        self,
+        db_client: Callable,
+        project: Project,
+        file_path: str,
+        file_name: str,
+        file_hash: str,
+    ) -> Tuple[str, Optional[Asset], int]:
+        assets_results = await self.create_file_assets(
+            db_client=db_client,
+            project=project,
+            saved_files=[
+                {"file_path": file_path, "file_name": file_name, "file_hash": file_hash}
+            ],
+        )
+        return assets_results[0]
+
 
 def main():
     """Entry Point for the Program."""
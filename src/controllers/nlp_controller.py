@@ -1,11 +1,17 @@
 import os
-from typing import List, Sequence, cast
+import time
+import hashlib
+import logging
+from typing import List, Optional, Sequence, cast
 import json
+import numpy as np
 from controllers.base_controller import BaseController
-from models.db_schemas import Project, DataChunk
+from models.db_schemas import Project, DataChunk, RetrievedDocument
 from stores.llm import DocumentTypeEnum, LLMInterface
 from stores.llm.templates.template_parser import TemplateParser
 from stores.vectordb import VectorDBInterface
+from stores.cache import SemanticAnswerCache, CacheInterface, CacheKeyEnums
+from utils.single_flight import SingleFlight
 
 
 class NLPController(BaseController):
@@ -15,20 +21,34 @@ class NLPController(BaseController):
         generation_client: LLMInterface,
         embedding_client: LLMInterface,
         template_parser: TemplateParser,
+        answer_cache: Optional[SemanticAnswerCache] = None,
+        search_cache: Optional[CacheInterface] = None,
+        single_flight: Optional[SingleFlight] = None,
     ) -> None:
         super().__init__()
         self.vectordb_client = vectordb_client
         self.generation_client = generation_client
         self.embedding_client = embedding_client
         self.template_parser = template_parser
+        self.answer_cache = answer_cache
+        self.search_cache = search_cache
+        self.single_flight = single_flight
+        self.logger = logging.getLogger("uvicorn")
+        self.embedding_seconds = 0.0
+        self.insert_seconds = 0.0
 
     def create_collection_name(self, project_id: int):
         return f"collection_{self.vectordb_client.default_vector_size}_{str(project_id)}".strip()  # type: ignore
 
+    def invalidate_answer_cache(self, project: Project):
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate(project_id=cast(int, project.project_id))
+
     async def reset_vectordb_collection(self, project: Project):
         collection_name = self.create_collection_name(
             project_id=cast(int, project.project_id)
         )
+        self.invalidate_answer_cache(project=project)
         return await self.vectordb_client.delete_collection(
             collection_name=collection_name
         )
@@ -43,60 +63,237 @@ class NLPController(BaseController):
 
         return json.loads(json.dumps(collection_info, default=lambda x: x.__dict__))
 
+    async def build_vector_index(self, project: Project):
+        collection_name = self.create_collection_name(
+            project_id=cast(int, project.project_id)
+        )
+        return await self.vectordb_client.create_vector_index(
+            collection_name=collection_name
+        )
+
+    async def get_vector_index_progress(self, project: Project):
+        collection_name = self.create_collection_name(
+            project_id=cast(int, project.project_id)
+        )
+        index_progress = await self.vectordb_client.get_vector_index_progress(
+            collection_name=collection_name
+        )
+
+        return json.loads(json.dumps(index_progress, default=lambda x: x.__dict__))
+
     async def index_into_vectordb(
         self,
         project: Project,
         chunks: Sequence[DataChunk],
         chunk_ids: List[int],
+    ):
+        vectors = await self.embed_chunks(chunks)
+        if vectors is None:
+            return False
+
+        return await self.insert_into_vectordb(
+            project=project, chunks=chunks, chunk_ids=chunk_ids, vectors=vectors
+        )
+
+    async def embed_chunks(self, chunks: Sequence[DataChunk]) -> Optional[np.ndarray]:
+        texts = [chunk.chunk_text for chunk in chunks]
+
+        start_time = time.perf_counter()
+        vectors = await self.embedding_client.aembed_text(
+            cast(str, texts), DocumentTypeEnum.DOCUMENT.value
+        )
+        self.embedding_seconds += time.perf_counter() - start_time
+
+        return vectors
+
+    async def insert_into_vectordb(
+        self,
+        project: Project,
+        chunks: Sequence[DataChunk],
+        chunk_ids: List[int],
+        vectors: np.ndarray,
     ):
         collection_name = self.create_collection_name(
             project_id=cast(int, project.project_id)
         )
         texts = [chunk.chunk_text for chunk in chunks]
         metadatas = [chunk.chunk_metadata for chunk in chunks]
-        vectors = self.embedding_client.embed_text(
-            cast(str, texts), DocumentTypeEnum.DOCUMENT.value
-        )
 
-        _ = await self.vectordb_client.insert_many(
+        start_time = time.perf_counter()
+        is_inserted = await self.vectordb_client.insert_many(
             collection_name=collection_name,
             vectors=vectors,
             texts=texts,
             metadatas=metadatas,
             record_ids=chunk_ids,
         )
+        self.insert_seconds += time.perf_counter() - start_time
+
+        return is_inserted
+
+    async def embed_query(self, text: str) -> Optional[np.ndarray]:
+        vectors = await self.embedding_client.aembed_text(
+            text, DocumentTypeEnum.QUERY.value
+        )
+
+        if vectors is None or len(vectors) == 0:
+            return None
+
+        return vectors[0]
 
-        return True
+    def normalize_query_text(self, text: str) -> str:
+        return " ".join(text.lower().split())
 
     async def search_vectordb_collection(
-        self, project: Project, text: str, limit: int = 10
+        self,
+        project: Project,
+        text: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        query_vector: Optional[np.ndarray] = None,
+    ):
+        async def run_search():
+            return await self.run_search_vectordb_collection(
+                project=project,
+                text=text,
+                limit=limit,
+                ef_search=ef_search,
+                probes=probes,
+                query_vector=query_vector,
+            )
+
+        if self.single_flight is None:
+            return await run_search()
+
+        return await self.single_flight.do(
+            "search",
+            (
+                project.project_id,
+                self.normalize_query_text(text),
+                limit,
+                ef_search,
+                probes,
+            ),
+            run_search,
+        )
+
+    async def run_search_vectordb_collection(
+        self,
+        project: Project,
+        text: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        query_vector: Optional[np.ndarray] = None,
     ):
         collection_name = self.create_collection_name(
             project_id=cast(int, project.project_id)
         )
-        vectors = self.embedding_client.embed_text(text, DocumentTypeEnum.QUERY.value)
 
-        if not vectors or len(vectors) == 0:
-            return None
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = await self.get_search_cache_key(
+                collection_name=collection_name,
+                text=text,
+                limit=limit,
+                ef_search=ef_search,
+                probes=probes,
+            )
+            cached_results = None
+            if cache_key is not None:
+                try:
+                    cached_results = await self.search_cache.get(cache_key)
+                except Exception as exc:  # pylint: disable=[W0718]
+                    self.logger.error("Error while reading the search cache: %s", exc)
+            if cached_results is not None:
+                return [
+                    RetrievedDocument(**result) for result in json.loads(cached_results)
+                ]
 
-        query_vector = vectors[0]
+        if query_vector is None:
+            query_vector = await self.embed_query(text=text)
+        if query_vector is None:
+            return None
 
         results = await self.vectordb_client.search_by_vector(
-            collection_name=collection_name, vector=query_vector, limit=limit
+            collection_name=collection_name,
+            vector=query_vector,
+            limit=limit,
+            ef_search=ef_search,
+            probes=probes,
         )
 
         if not results:
             return None
 
+        if cache_key is not None:
+            try:
+                await self.search_cache.set(  # type: ignore
+                    cache_key, json.dumps([result.dict() for result in results])
+                )
+            except Exception as exc:  # pylint: disable=[W0718]
+                self.logger.error("Error while writing the search cache: %s", exc)
+
         return results
 
-    async def answer_rag_question(self, project: Project, query: str, limit: int = 10):
-        answer, full_prompt, chat_history = None, None, None
+    async def get_collection_version(self, collection_name: str) -> Optional[int]:
+        # Bumped through the shared search cache by whichever process writes the collection
+        if self.search_cache is None:
+            return None
+        try:
+            return await self.search_cache.get_version(collection_name)
+        except Exception as exc:  # pylint: disable=[W0718]
+            self.logger.error("Error while reading the collection version: %s", exc)
+            return None
+
+    async def get_search_cache_key(
+        self,
+        collection_name: str,
+        text: str,
+        limit: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> Optional[str]:
+        # The collection version changes on every write, so older entries are never read again
+        version = await self.get_collection_version(collection_name)
+        if version is None:
+            return None
+
+        normalized_text = self.normalize_query_text(text)
+        text_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+        return ":".join(
+            [
+                CacheKeyEnums.PREFIX.value,
+                CacheKeyEnums.SEARCH.value,
+                collection_name,
+                f"v{version}",
+                str(limit),
+                str(ef_search),
+                str(probes),
+                text_hash,
+            ]
+        )
+
+    async def construct_rag_prompt(
+        self,
+        project: Project,
+        query: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        query_vector: Optional[np.ndarray] = None,
+    ):
         retrieved_documents = await self.search_vectordb_collection(
-            project=project, text=query, limit=limit
+            project=project,
+            text=query,
+            limit=limit,
+            ef_search=ef_search,
+            probes=probes,
+            query_vector=query_vector,
         )
         if not retrieved_documents or len(retrieved_documents) == 0:
-            return answer, full_prompt, chat_history
+            return None, None, None
 
         system_prompt = self.template_parser.get("rag", "SYSTEM_PROMPT")
         document_prompts = "\n".join(
@@ -125,12 +322,119 @@ class NLPController(BaseController):
         ]
 
         full_prompt = "\n\n".join([document_prompts, footer_prompt])  # type: ignore
-        answer = self.generation_client.generate_text(
-            prompt=full_prompt, chat_history=chat_history
+
+        return retrieved_documents, full_prompt, chat_history
+
+    async def answer_rag_question(
+        self,
+        project: Project,
+        query: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ):
+        async def run_answer():
+            return await self.run_answer_rag_question(
+                project=project,
+                query=query,
+                limit=limit,
+                ef_search=ef_search,
+                probes=probes,
+            )
+
+        if self.single_flight is None:
+            return await run_answer()
+
+        return await self.single_flight.do(
+            "answer",
+            (
+                project.project_id,
+                query.strip(),
+                limit,
+                ef_search,
+                probes,
+            ),
+            run_answer,
         )
 
+    async def run_answer_rag_question(
+        self,
+        project: Project,
+        query: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ):
+        answer, query_vector, version = None, None, None
+        answer_cache = self.answer_cache
+        if answer_cache is not None and self.search_cache is not None:
+            # Writes made by worker processes only reach this process as a new version
+            version = await self.get_collection_version(
+                self.create_collection_name(project_id=cast(int, project.project_id))
+            )
+            if version is None:
+                answer_cache = None
+
+        if answer_cache is not None:
+            query_vector = await self.embed_query(text=query)
+            if query_vector is None:
+                return answer, None, None
+
+            cached_entry = answer_cache.get(
+                project_id=cast(int, project.project_id),
+                query_vector=query_vector,
+                limit=limit,
+                version=version,
+            )
+            if cached_entry is not None:
+                return (
+                    cached_entry.answer,
+                    cached_entry.full_prompt,
+                    cached_entry.chat_history,
+                )
+
+        retrieved_documents, full_prompt, chat_history = (
+            await self.construct_rag_prompt(
+                project=project,
+                query=query,
+                limit=limit,
+                ef_search=ef_search,
+                probes=probes,
+                query_vector=query_vector,
+            )
+        )
+        if not retrieved_documents:
+            return answer, full_prompt, chat_history
+
+        answer = await self.generation_client.agenerate_text(
+            prompt=full_prompt, chat_history=chat_history  # type: ignore
+        )
+
+        if answer and answer_cache is not None:
+            answer_cache.set(
+                project_id=cast(int, project.project_id),
+                query=query,
+                query_vector=query_vector,  # type: ignore
+                limit=limit,
+                answer=answer,
+                full_prompt=full_prompt,
+                chat_history=chat_history,
+                chunk_ids=[
+                    document.chunk_id
+                    for document in retrieved_documents
+                    if document.chunk_id is not None
+                ],
+                version=version,
+            )
+
         return answer, full_prompt, chat_history
 
+    async def stream_rag_answer(self, full_prompt: str, chat_history: list):
+        async for text in self.generation_client.astream_text(
+            prompt=full_prompt, chat_history=chat_history
+        ):
+            yield text
+
 
 def main():
     """Entry Point for the Program."""
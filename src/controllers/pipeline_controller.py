@@ -0,0 +1,1245 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+from fastapi import BackgroundTasks
+from tqdm.auto import tqdm
+from controllers.base_controller import BaseController
+from controllers.process_controller import ProcessController
+from controllers.nlp_controller import NLPController
+from models import (
+    ResponseSignalEnum,
+    AssetTypeEnum,
+    JobStatusEnum,
+    JobTypeEnum,
+    ProjectModel,
+    DataChunkModel,
+    AssetModel,
+    JobModel,
+)
+from models.db_schemas import Asset, DataChunk, Project, QueuedJob
+from stores.tokenizers import LengthUnitEnum
+from utils.hash_utils import (
+    compute_file_hash,
+    compute_chunk_hash,
+    compute_processing_hash,
+)
+from utils.job_runner import Job, FINISHED_JOB_STATUSES
+from utils.pipeline_utils import run_stage, run_pipeline, STAGE_DONE
+
+logger = logging.getLogger("uvicorn")
+
+PROCESSED_FILE_SIGNALS = {
+    ResponseSignalEnum.PROCESSING_SUCCESS.value,
+    ResponseSignalEnum.FILE_UNCHANGED.value,
+    ResponseSignalEnum.FILE_REMOVED.value,
+}
+
+
+class PipelineController(BaseController):
+    """Processes and indexes a project's files with the shared clients of `app.state`
+    (or a worker's equivalent), either in place or through the Postgres jobs queue.
+    The pipelines return (is_success, response content) and report progress on `job`."""
+
+    def __init__(self, app_state: Any) -> None:
+        super().__init__()
+        self.app_state = app_state
+        self.nlp_controller = NLPController(
+            vectordb_client=app_state.vectordb_client,
+            generation_client=app_state.generation_client,
+            embedding_client=app_state.embedding_client,
+            template_parser=app_state.template_parser,
+            answer_cache=app_state.answer_cache,
+            search_cache=app_state.search_cache,
+            single_flight=app_state.single_flight,
+        )
+
+    async def get_project_assets(
+        self, project: Project, file_id: Optional[str] = None
+    ) -> Tuple[Optional[Sequence[Asset]], Optional[str]]:
+        asset_model = AssetModel(db_client=self.app_state.db_client)
+        if file_id is not None:
+            asset = await asset_model.get_asset_record(
+                asset_project_id=project.project_id, asset_name=file_id  # type: ignore
+            )
+            if asset is None:
+                return None, ResponseSignalEnum.FILE_ID_ERROR.value
+
+            return [asset], None
+
+        project_files = await asset_model.get_all_project_assets(
+            project.project_id, asset_type=AssetTypeEnum.FILE.value  # type: ignore
+        )
+        if len(project_files) == 0:
+            return None, ResponseSignalEnum.NO_FILES_ERROR.value
+
+        return project_files, None
+
+    async def get_project_files(
+        self, project: Project, file_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict[int, str]], Optional[str]]:
+        project_assets, signal = await self.get_project_assets(project, file_id)
+        if project_assets is None:
+            return None, signal
+
+        return {record.asset_id: record.asset_name for record in project_assets}, None  # type: ignore
+
+    def get_processing_params(
+        self, chunk_size: int, overlap_size: int, chunking_strategy: Optional[str]
+    ) -> dict:
+        length_unit = self.app_settings.CHUNKING_LENGTH_UNIT
+        return {
+            "chunk_size": chunk_size,
+            "overlap_size": overlap_size,
+            "chunking_strategy": chunking_strategy
+            or self.app_settings.CHUNKING_STRATEGY,
+            "length_unit": length_unit,
+            "tokenizer_model_id": (
+                self.app_settings.EMBEDDING_MODEL_ID
+                if length_unit == LengthUnitEnum.TOKENS.value
+                else None
+            ),
+        }
+
+    async def delete_chunks_with_vectors(
+        self, project: Project, chunk_model: DataChunkModel, chunk_ids: List[int]
+    ) -> int:
+        if len(chunk_ids) == 0:
+            return 0
+
+        # The vectors reference their chunk rows, they go first
+        _ = await self.app_state.vectordb_client.delete_many(
+            collection_name=self.nlp_controller.create_collection_name(
+                project_id=cast(int, project.project_id)
+            ),
+            record_ids=chunk_ids,
+        )
+        return await chunk_model.delete_chunks_by_ids(chunk_ids=chunk_ids)
+
+    async def process_file_incremental(
+        self,
+        project: Project,
+        chunk_model: DataChunkModel,
+        asset: Asset,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        job: Optional[Job] = None,
+    ) -> dict:
+        # Only the difference between the asset's stored chunks and its new chunks is
+        # written: unchanged chunks keep their rows and vectors, so an incremental push
+        # embeds nothing but the inserted ones
+        asset_model = AssetModel(db_client=self.app_state.db_client)
+        process_controller = ProcessController(cast(int, project.project_id))
+        semaphore = asyncio.Semaphore(1) if semaphore is None else semaphore
+        asset_id = cast(int, asset.asset_id)
+        file_name = cast(str, asset.asset_name)
+        asset_config = dict(asset.asset_config or {})  # type: ignore
+        file_result = {
+            "file_id": file_name,
+            "inserted_chunks": 0,
+            "kept_chunks": 0,
+            "deleted_chunks": 0,
+        }
+        try:
+            existing_chunks = await chunk_model.get_asset_chunks(asset_id=asset_id)
+            file_hash = await asyncio.get_running_loop().run_in_executor(
+                None,
+                compute_file_hash,
+                os.path.join(process_controller.project_path, file_name),
+            )
+            if file_hash is None:
+                file_result["deleted_chunks"] = await self.delete_chunks_with_vectors(
+                    project=project,
+                    chunk_model=chunk_model,
+                    chunk_ids=[chunk_id for chunk_id, _, _ in existing_chunks],
+                )
+                asset_config.pop("processed_hash", None)
+                _ = await asset_model.update_asset_config(asset_id, asset_config)
+                file_result["signal"] = ResponseSignalEnum.FILE_REMOVED.value
+                return file_result
+
+            processed_hash = compute_processing_hash(
+                file_hash,
+                self.get_processing_params(chunk_size, overlap_size, chunking_strategy),
+            )
+            if asset_config.get("processed_hash") == processed_hash and existing_chunks:
+                file_result["kept_chunks"] = len(existing_chunks)
+                file_result["signal"] = ResponseSignalEnum.FILE_UNCHANGED.value
+                return file_result
+
+            async with semaphore:
+                file_chunks = await process_controller.aprocess_file(
+                    file_id=file_name,
+                    chunk_size=chunk_size,
+                    overlap_size=overlap_size,
+                    chunking_strategy=chunking_strategy,
+                    executor=self.app_state.process_pool,
+                )
+            if not file_chunks:
+                file_result["signal"] = ResponseSignalEnum.PROCESSING_FAILED.value
+                return file_result
+
+            # Identical chunks are matched in order, each stored row is reused at most once
+            existing_chunk_ids = defaultdict(deque)
+            for chunk_id, chunk_hash, _ in existing_chunks:
+                existing_chunk_ids[chunk_hash].append(chunk_id)
+            existing_chunk_orders = {
+                chunk_id: chunk_order for chunk_id, _, chunk_order in existing_chunks
+            }
+
+            new_records = []
+            chunk_orders = []
+            kept_chunks = 0
+            for i, chunk in enumerate(file_chunks):
+                chunk_hash = compute_chunk_hash(chunk.page_content, chunk.metadata)
+                if existing_chunk_ids[chunk_hash]:
+                    chunk_id = existing_chunk_ids[chunk_hash].popleft()
+                    if existing_chunk_orders[chunk_id] != i + 1:
+                        chunk_orders.append((chunk_id, i + 1))
+                    kept_chunks += 1
+                    continue
+
+                new_records.append(
+                    DataChunk(  # type: ignore
+                        chunk_text=chunk.page_content,
+                        chunk_metadata=chunk.metadata,
+                        chunk_order=i + 1,
+                        chunk_hash=chunk_hash,
+                        chunk_project_id=project.project_id,
+                        chunk_asset_id=asset_id,
+                    )
+                )
+
+            file_result["deleted_chunks"] = await self.delete_chunks_with_vectors(
+                project=project,
+                chunk_model=chunk_model,
+                chunk_ids=[
+                    chunk_id
+                    for chunk_ids in existing_chunk_ids.values()
+                    for chunk_id in chunk_ids
+                ],
+            )
+            _ = await chunk_model.update_chunk_orders(chunk_orders=chunk_orders)
+            file_result["inserted_chunks"] = await chunk_model.insert_many_chunks(
+                chunks=new_records
+            )
+            file_result["kept_chunks"] = kept_chunks
+
+            asset_config["processed_hash"] = processed_hash
+            _ = await asset_model.update_asset_config(asset_id, asset_config)
+            file_result["signal"] = ResponseSignalEnum.PROCESSING_SUCCESS.value
+        except Exception as exc:  # pylint: disable=[W0718]
+            logger.error("Error while Processing file: %s, %s", file_name, exc)
+            file_result["signal"] = ResponseSignalEnum.PROCESSING_FAILED.value
+            file_result["error"] = f"{type(exc).__name__}: {exc}"
+        finally:
+            if job is not None:
+                job.update_progress(advance=1)
+
+        return file_result
+
+    async def process_file(
+        self,
+        project: Project,
+        chunk_model: DataChunkModel,
+        asset_id: int,
+        file_name: str,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        job: Optional[Job] = None,
+    ) -> dict:
+        process_controller = ProcessController(cast(int, project.project_id))
+        semaphore = asyncio.Semaphore(1) if semaphore is None else semaphore
+        file_result = {"file_id": file_name, "inserted_chunks": 0}
+        try:
+            async with semaphore:
+                file_chunks = await process_controller.aprocess_file(
+                    file_id=file_name,
+                    chunk_size=chunk_size,
+                    overlap_size=overlap_size,
+                    chunking_strategy=chunking_strategy,
+                    executor=self.app_state.process_pool,
+                )
+            if file_chunks is None:
+                logger.error("Error while Processing file: %s", file_name)
+                file_result["signal"] = ResponseSignalEnum.FILE_ID_ERROR.value
+                return file_result
+
+            if len(file_chunks) == 0:
+                file_result["signal"] = ResponseSignalEnum.PROCESSING_FAILED.value
+                return file_result
+
+            file_chunks_records = [
+                DataChunk(  # type: ignore
+                    chunk_text=chunk.page_content,
+                    chunk_metadata=chunk.metadata,
+                    chunk_order=i + 1,
+                    chunk_hash=compute_chunk_hash(chunk.page_content, chunk.metadata),
+                    chunk_project_id=project.project_id,
+                    chunk_asset_id=asset_id,
+                )
+                for i, chunk in enumerate(file_chunks)
+            ]
+            file_result["inserted_chunks"] = await chunk_model.insert_many_chunks(
+                chunks=file_chunks_records
+            )
+            file_result["signal"] = ResponseSignalEnum.PROCESSING_SUCCESS.value
+        except Exception as exc:  # pylint: disable=[W0718]
+            logger.error("Error while Processing file: %s, %s", file_name, exc)
+            file_result["signal"] = ResponseSignalEnum.PROCESSING_FAILED.value
+            file_result["error"] = f"{type(exc).__name__}: {exc}"
+        finally:
+            if job is not None:
+                job.update_progress(advance=1)
+
+        return file_result
+
+    async def process_project(
+        self,
+        project_id: int,
+        file_id: Optional[str] = None,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        do_reset: int = 0,
+        incremental: bool = False,
+        job: Optional[Job] = None,
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        project = await project_model.get_or_create_project(project_id=project_id)
+
+        project_assets, signal = await self.get_project_assets(project, file_id)
+        if project_assets is None:
+            return False, {"signal": signal}
+
+        if job is not None:
+            job.update_progress(processed=0, total=len(project_assets))
+
+        if do_reset:
+            _ = await self.nlp_controller.reset_vectordb_collection(project)
+            _ = await chunk_model.delete_chunks_by_project_id(
+                project_id=cast(int, project.project_id)
+            )
+
+        # Files are extracted concurrently, a file's chunks are inserted while the next
+        # ones are still being extracted
+        semaphore = asyncio.Semaphore(
+            max(1, self.app_settings.PROCESSING_MAX_CONCURRENT_FILES)
+        )
+
+        if incremental:
+            files_results = await asyncio.gather(
+                *[
+                    self.process_file_incremental(
+                        project=project,
+                        chunk_model=chunk_model,
+                        asset=asset,
+                        chunk_size=chunk_size,
+                        overlap_size=overlap_size,
+                        chunking_strategy=chunking_strategy,
+                        semaphore=semaphore,
+                        job=job,
+                    )
+                    for asset in project_assets
+                ]
+            )
+        else:
+            files_results = await asyncio.gather(
+                *[
+                    self.process_file(
+                        project=project,
+                        chunk_model=chunk_model,
+                        asset_id=cast(int, asset.asset_id),
+                        file_name=cast(str, asset.asset_name),
+                        chunk_size=chunk_size,
+                        overlap_size=overlap_size,
+                        chunking_strategy=chunking_strategy,
+                        semaphore=semaphore,
+                        job=job,
+                    )
+                    for asset in project_assets
+                ]
+            )
+
+        no_chunk_records = sum(result["inserted_chunks"] for result in files_results)
+        no_files = 0
+        for result in files_results:
+            if result["signal"] in PROCESSED_FILE_SIGNALS:
+                no_files += 1
+            elif job is not None:
+                job.add_error(
+                    f"{result['file_id']}: {result.get('error', result['signal'])}"
+                )
+
+        if no_files == 0:
+            return False, {
+                "signal": ResponseSignalEnum.PROCESSING_FAILED.value,
+                "files": files_results,
+            }
+
+        content = {
+            "signal": ResponseSignalEnum.PROCESSING_SUCCESS.value,
+            "inserted_chunks": no_chunk_records,
+            "processed_files": no_files,
+            "failed_files": len(files_results) - no_files,
+            "files": files_results,
+        }
+        if incremental:
+            content["kept_chunks"] = sum(
+                result["kept_chunks"] for result in files_results
+            )
+            content["deleted_chunks"] = sum(
+                result["deleted_chunks"] for result in files_results
+            )
+            if content["deleted_chunks"] > 0:
+                # Answers cached before this run may rely on the deleted chunks
+                self.nlp_controller.invalidate_answer_cache(project=project)
+
+        return True, content
+
+    async def index_chunks(
+        self,
+        project: Project,
+        chunk_model: DataChunkModel,
+        total_chunks_count: int,
+        job: Optional[Job] = None,
+        min_chunk_id: int = 0,
+        max_chunk_id: Optional[int] = None,
+        only_unindexed: bool = False,
+    ) -> Tuple[bool, int]:
+        nlp_controller = self.nlp_controller
+        total_inserted_items_count = 0
+        page_size = self.app_settings.VECTOR_DB_INDEXING_PAGE_SIZE
+
+        pbar = tqdm(total=total_chunks_count, desc="Vector Inexing", position=0)
+
+        # Keep several pages in flight, the embedding client enforces the provider rate limits
+        max_pages_in_flight = self.app_settings.EMBEDDING_MAX_CONCURRENCY
+        pending_tasks = set()
+        is_inserted = True
+
+        async def index_page(page_chunks):
+            chunk_ids = [chunk.chunk_id for chunk in page_chunks]
+            try:
+                if only_unindexed:
+                    # An interrupted attempt may have inserted the page without marking it
+                    _ = await self.app_state.vectordb_client.delete_many(
+                        collection_name=nlp_controller.create_collection_name(
+                            project_id=cast(int, project.project_id)
+                        ),
+                        record_ids=cast(List[int], chunk_ids),
+                    )
+                is_page_inserted = await nlp_controller.index_into_vectordb(
+                    project=project,
+                    chunks=page_chunks,
+                    chunk_ids=cast(List[int], chunk_ids),
+                )
+                if is_page_inserted:
+                    _ = await chunk_model.mark_chunks_indexed(
+                        chunk_ids=cast(List[int], chunk_ids)
+                    )
+            except Exception as exc:  # pylint: disable=[W0718]
+                logger.error("Error while indexing chunks page: %s", exc)
+                if job is not None:
+                    job.add_error(f"{type(exc).__name__}: {exc}")
+                return False, len(page_chunks)
+            if is_page_inserted:
+                pbar.update(len(page_chunks))
+                if job is not None:
+                    job.update_progress(advance=len(page_chunks))
+            return is_page_inserted, len(page_chunks)
+
+        async def collect_done_tasks(return_when):
+            nonlocal pending_tasks, total_inserted_items_count
+            done_tasks, pending_tasks = await asyncio.wait(
+                pending_tasks, return_when=return_when
+            )
+            for task in done_tasks:
+                is_page_inserted, page_items_count = task.result()
+                if not is_page_inserted:
+                    return False
+                total_inserted_items_count += page_items_count
+            return True
+
+        try:
+            async for page_chunks in chunk_model.iter_project_chunks(
+                project_id=cast(int, project.project_id),
+                page_size=page_size,
+                min_chunk_id=min_chunk_id,
+                max_chunk_id=max_chunk_id,
+                only_unindexed=only_unindexed,
+            ):
+                pending_tasks.add(asyncio.create_task(index_page(page_chunks)))
+                if len(pending_tasks) >= max_pages_in_flight:
+                    is_inserted = await collect_done_tasks(asyncio.FIRST_COMPLETED)
+                    if not is_inserted:
+                        break
+
+            if is_inserted and pending_tasks:
+                is_inserted = await collect_done_tasks(asyncio.ALL_COMPLETED)
+        finally:
+            for task in pending_tasks:
+                task.cancel()
+            pbar.close()
+            # Answers cached before this push may rely on stale or missing chunks
+            nlp_controller.invalidate_answer_cache(project=project)
+
+        if not is_inserted and job is not None:
+            job.add_error("Error while inserting into the vector database")
+
+        return is_inserted, total_inserted_items_count
+
+    async def index_project(
+        self,
+        project_id: int,
+        do_reset: int = 0,
+        incremental: bool = False,
+        job: Optional[Job] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        nlp_controller = self.nlp_controller
+
+        project = await project_model.get_or_create_project(project_id=project_id)
+        if not project:
+            return False, {"signal": ResponseSignalEnum.PROJECT_NOT_FOUND_ERROR.value}
+
+        if do_reset:
+            # The collection is recreated empty, every chunk needs its vector again
+            _ = await chunk_model.reset_chunks_indexed(
+                project_id=cast(int, project.project_id)
+            )
+
+        page_size = self.app_settings.VECTOR_DB_INDEXING_PAGE_SIZE
+
+        collection_name = nlp_controller.create_collection_name(
+            project_id=cast(int, project.project_id)
+        )
+
+        _ = await self.app_state.vectordb_client.create_collection(
+            collection_name=collection_name,
+            embedding_size=self.app_state.embedding_client.embedding_size,
+            do_reset=do_reset,
+        )
+
+        total_chunks_count = await chunk_model.get_total_chunks_count(
+            project_id=cast(int, project.project_id), only_unindexed=incremental
+        )
+        total_pages = -(-total_chunks_count // page_size)
+        if job is not None:
+            job.update_progress(processed=0, total=total_chunks_count)
+
+        start_time = time.perf_counter()
+        is_inserted, total_inserted_items_count = await self.index_chunks(
+            project=project,
+            chunk_model=chunk_model,
+            total_chunks_count=total_chunks_count,
+            job=job,
+            only_unindexed=incremental,
+        )
+        if not is_inserted:
+            return False, {
+                "signal": ResponseSignalEnum.INSERT_INTO_VECTORDB_ERROR.value
+            }
+
+        elapsed_seconds = time.perf_counter() - start_time
+
+        # Build the vector index once, after all vectors are in, without blocking the response.
+        # A job has no response to wait for, the index is part of its work
+        if background_tasks is not None:
+            background_tasks.add_task(
+                nlp_controller.build_vector_index, project=project
+            )
+            vector_index = "scheduled"
+        else:
+            await nlp_controller.build_vector_index(project=project)
+            vector_index = "built"
+
+        return True, {
+            "signal": ResponseSignalEnum.INSERT_INTO_VECTORDB_SUCCESS.value,
+            "total_inserted_items_count": total_inserted_items_count,
+            "total_pages": total_pages,
+            "vector_index": vector_index,
+            "throughput": {
+                "insert_method": self.app_settings.VECTOR_DB_PGVEC_INSERT_METHOD,
+                "elapsed_seconds": round(elapsed_seconds, 3),
+                "embedding_seconds": round(nlp_controller.embedding_seconds, 3),
+                "insert_seconds": round(nlp_controller.insert_seconds, 3),
+                "rows_per_second": (
+                    round(total_inserted_items_count / elapsed_seconds, 2)
+                    if elapsed_seconds > 0
+                    else None
+                ),
+                "insert_rows_per_second": (
+                    round(total_inserted_items_count / nlp_controller.insert_seconds, 2)
+                    if nlp_controller.insert_seconds > 0
+                    else None
+                ),
+            },
+        }
+
+    async def ingest_project(
+        self,
+        project_id: int,
+        file_id: Optional[str] = None,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        do_reset: int = 0,
+        job: Optional[Job] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+        build_vector_index: bool = True,
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        nlp_controller = self.nlp_controller
+        project = await project_model.get_or_create_project(project_id=project_id)
+
+        project_files_ids, signal = await self.get_project_files(project, file_id)
+        if project_files_ids is None:
+            return False, {"signal": signal}
+
+        # The vectors reference their chunk rows, the collection is reset first
+        _ = await self.app_state.vectordb_client.create_collection(
+            collection_name=nlp_controller.create_collection_name(
+                project_id=cast(int, project.project_id)
+            ),
+            embedding_size=self.app_state.embedding_client.embedding_size,
+            do_reset=do_reset,
+        )
+        if do_reset:
+            _ = await chunk_model.delete_chunks_by_project_id(
+                project_id=cast(int, project.project_id)
+            )
+
+        # extract+chunk -> store chunks -> embed -> insert vectors, each stage with its
+        # own concurrency; the bounded queues between them hold at most
+        # INGEST_QUEUE_SIZE batches, so a slow stage throttles the ones before it
+        process_controller = ProcessController(cast(int, project.project_id))
+        batch_size = self.app_settings.VECTOR_DB_INDEXING_PAGE_SIZE
+        queue_size = max(1, self.app_settings.INGEST_QUEUE_SIZE)
+        files_queue: asyncio.Queue = asyncio.Queue()
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        insert_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        for item in project_files_ids.items():
+            files_queue.put_nowait(item)
+        files_queue.put_nowait(STAGE_DONE)
+
+        files_results = {
+            asset_id: {
+                "file_id": file_name,
+                "inserted_chunks": 0,
+                "indexed_chunks": 0,
+                "errors": [],
+            }
+            for asset_id, file_name in project_files_ids.items()
+        }
+        if job is not None:
+            job.update_progress(processed=0, total=0)
+
+        def add_error(asset_id, error):
+            files_results[asset_id]["errors"].append(error)
+            if job is not None:
+                job.add_error(f"{files_results[asset_id]['file_id']}: {error}")
+
+        async def extract_file(item):
+            asset_id, file_name = item
+            chunk_order = 0
+            try:
+                async for range_chunks in process_controller.aiter_file_chunks(
+                    file_id=file_name,
+                    chunk_size=chunk_size,
+                    overlap_size=overlap_size,
+                    chunking_strategy=chunking_strategy,
+                    executor=self.app_state.process_pool,
+                ):
+                    if range_chunks is None:
+                        add_error(asset_id, ResponseSignalEnum.FILE_ID_ERROR.value)
+                        return
+                    for start in range(0, len(range_chunks), batch_size):
+                        records = [
+                            DataChunk(  # type: ignore
+                                chunk_text=chunk.page_content,
+                                chunk_metadata=chunk.metadata,
+                                chunk_order=chunk_order + i + 1,
+                                chunk_hash=compute_chunk_hash(
+                                    chunk.page_content, chunk.metadata
+                                ),
+                                chunk_project_id=project.project_id,
+                                chunk_asset_id=asset_id,
+                            )
+                            for i, chunk in enumerate(
+                                range_chunks[start : start + batch_size]
+                            )
+                        ]
+                        chunk_order += len(records)
+                        if job is not None:
+                            job.update_progress(total=(job.total or 0) + len(records))
+                        await store_queue.put((asset_id, records))
+                if chunk_order == 0:
+                    add_error(asset_id, ResponseSignalEnum.PROCESSING_FAILED.value)
+            except Exception as exc:  # pylint: disable=[W0718]
+                logger.error("Error while extracting file: %s, %s", file_name, exc)
+                add_error(asset_id, f"{type(exc).__name__}: {exc}")
+
+        async def store_batch(item):
+            asset_id, records = item
+            try:
+                # The inserted rows get their chunk_id, it is the vector's record id
+                _ = await chunk_model.insert_many_chunks(chunks=records)
+            except Exception as exc:  # pylint: disable=[W0718]
+                add_error(asset_id, f"{type(exc).__name__}: {exc}")
+                return None
+            files_results[asset_id]["inserted_chunks"] += len(records)
+            return item
+
+        async def embed_batch(item):
+            asset_id, records = item
+            try:
+                vectors = await nlp_controller.embed_chunks(records)
+            except Exception as exc:  # pylint: disable=[W0718]
+                add_error(asset_id, f"{type(exc).__name__}: {exc}")
+                return None
+            if vectors is None:
+                add_error(asset_id, "Error while embedding chunks")
+                return None
+            return asset_id, records, vectors
+
+        async def insert_batch(item):
+            asset_id, records, vectors = item
+            try:
+                is_inserted = await nlp_controller.insert_into_vectordb(
+                    project=project,
+                    chunks=records,
+                    chunk_ids=[record.chunk_id for record in records],
+                    vectors=vectors,
+                )
+                if is_inserted:
+                    _ = await chunk_model.mark_chunks_indexed(
+                        chunk_ids=[record.chunk_id for record in records]
+                    )
+            except Exception as exc:  # pylint: disable=[W0718]
+                add_error(asset_id, f"{type(exc).__name__}: {exc}")
+                return None
+            if not is_inserted:
+                add_error(asset_id, ResponseSignalEnum.INSERT_INTO_VECTORDB_ERROR.value)
+                return None
+            files_results[asset_id]["indexed_chunks"] += len(records)
+            if job is not None:
+                job.update_progress(advance=len(records))
+            return None
+
+        start_time = time.perf_counter()
+        try:
+            await run_pipeline(
+                [
+                    run_stage(
+                        extract_file,
+                        files_queue,
+                        store_queue,
+                        concurrency=self.app_settings.PROCESSING_MAX_CONCURRENT_FILES,
+                    ),
+                    run_stage(
+                        store_batch,
+                        store_queue,
+                        embed_queue,
+                        concurrency=self.app_settings.INGEST_STORE_CONCURRENCY,
+                    ),
+                    run_stage(
+                        embed_batch,
+                        embed_queue,
+                        insert_queue,
+                        concurrency=self.app_settings.EMBEDDING_MAX_CONCURRENCY,
+                    ),
+                    run_stage(
+                        insert_batch,
+                        insert_queue,
+                        concurrency=self.app_settings.INGEST_INSERT_CONCURRENCY,
+                    ),
+                ]
+            )
+        finally:
+            # Answers cached before this ingest may rely on stale or missing chunks
+            nlp_controller.invalidate_answer_cache(project=project)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        no_files = 0
+        for file_result in files_results.values():
+            is_file_ingested = (
+                len(file_result["errors"]) == 0 and file_result["indexed_chunks"] > 0
+            )
+            file_result["signal"] = (
+                ResponseSignalEnum.PROCESSING_SUCCESS.value
+                if is_file_ingested
+                else ResponseSignalEnum.PROCESSING_FAILED.value
+            )
+            no_files += is_file_ingested
+
+        files_results_list = list(files_results.values())
+        if no_files == 0:
+            return False, {
+                "signal": ResponseSignalEnum.INGEST_FAILED.value,
+                "files": files_results_list,
+            }
+
+        if not build_vector_index:
+            # A queued ingest batch builds it once, after its last job
+            vector_index = "deferred"
+        elif background_tasks is not None:
+            background_tasks.add_task(
+                nlp_controller.build_vector_index, project=project
+            )
+            vector_index = "scheduled"
+        else:
+            await nlp_controller.build_vector_index(project=project)
+            vector_index = "built"
+
+        indexed_chunks = sum(result["indexed_chunks"] for result in files_results_list)
+        return True, {
+            "signal": ResponseSignalEnum.INGEST_SUCCESS.value,
+            "inserted_chunks": sum(
+                result["inserted_chunks"] for result in files_results_list
+            ),
+            "indexed_chunks": indexed_chunks,
+            "processed_files": no_files,
+            "failed_files": len(files_results_list) - no_files,
+            "vector_index": vector_index,
+            "files": files_results_list,
+            "throughput": {
+                "elapsed_seconds": round(elapsed_seconds, 3),
+                "embedding_seconds": round(nlp_controller.embedding_seconds, 3),
+                "insert_seconds": round(nlp_controller.insert_seconds, 3),
+                "chunks_per_second": (
+                    round(indexed_chunks / elapsed_seconds, 2)
+                    if elapsed_seconds > 0
+                    else None
+                ),
+            },
+        }
+
+    async def enqueue_project_processing(
+        self,
+        project_id: int,
+        file_id: Optional[str] = None,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        do_reset: int = 0,
+        incremental: bool = False,
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        job_model = await JobModel.create_instance(db_client=db_client)
+        project = await project_model.get_or_create_project(project_id=project_id)
+
+        project_files_ids, signal = await self.get_project_files(project, file_id)
+        if project_files_ids is None:
+            return False, {"signal": signal}
+
+        if do_reset:
+            _ = await self.nlp_controller.reset_vectordb_collection(project)
+            _ = await chunk_model.delete_chunks_by_project_id(
+                project_id=cast(int, project.project_id)
+            )
+
+        # One job per asset, so the files of a project spread over all the workers
+        batch_uuid = uuid.uuid4()
+        queued_jobs = await job_model.enqueue_jobs(
+            [
+                QueuedJob(  # type: ignore
+                    job_batch_uuid=batch_uuid,
+                    job_type=JobTypeEnum.PROCESS.value,
+                    job_status=JobStatusEnum.QUEUED.value,
+                    job_payload={
+                        "asset_id": asset_id,
+                        "file_id": file_name,
+                        "chunk_size": chunk_size,
+                        "overlap_size": overlap_size,
+                        "chunking_strategy": chunking_strategy,
+                        "incremental": incremental,
+                    },
+                    job_processed=0,
+                    job_total=1,
+                    job_attempts=0,
+                    job_project_id=project.project_id,
+                )
+                for asset_id, file_name in project_files_ids.items()
+            ]
+        )
+
+        return True, {
+            "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+            "job_id": str(batch_uuid),
+            "queued_jobs": len(queued_jobs),
+        }
+
+    async def enqueue_project_ingestion(
+        self,
+        project_id: int,
+        file_id: Optional[str] = None,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        do_reset: int = 0,
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        job_model = await JobModel.create_instance(db_client=db_client)
+        project = await project_model.get_or_create_project(project_id=project_id)
+
+        project_files_ids, signal = await self.get_project_files(project, file_id)
+        if project_files_ids is None:
+            return False, {"signal": signal}
+
+        # The vectors reference their chunk rows, the collection is reset first
+        _ = await self.app_state.vectordb_client.create_collection(
+            collection_name=self.nlp_controller.create_collection_name(
+                project_id=cast(int, project.project_id)
+            ),
+            embedding_size=self.app_state.embedding_client.embedding_size,
+            do_reset=do_reset,
+        )
+        if do_reset:
+            _ = await chunk_model.delete_chunks_by_project_id(
+                project_id=cast(int, project.project_id)
+            )
+
+        # One job per asset, the last one to finish builds the vector index
+        batch_uuid = uuid.uuid4()
+        queued_jobs = await job_model.enqueue_jobs(
+            [
+                QueuedJob(  # type: ignore
+                    job_batch_uuid=batch_uuid,
+                    job_type=JobTypeEnum.INGEST.value,
+                    job_status=JobStatusEnum.QUEUED.value,
+                    job_payload={
+                        "asset_id": asset_id,
+                        "file_id": file_name,
+                        "chunk_size": chunk_size,
+                        "overlap_size": overlap_size,
+                        "chunking_strategy": chunking_strategy,
+                    },
+                    job_processed=0,
+                    job_attempts=0,
+                    job_project_id=project.project_id,
+                )
+                for asset_id, file_name in project_files_ids.items()
+            ]
+        )
+
+        return True, {
+            "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+            "job_id": str(batch_uuid),
+            "queued_jobs": len(queued_jobs),
+        }
+
+    async def enqueue_project_indexing(
+        self, project_id: int, do_reset: int = 0, incremental: bool = False
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        job_model = await JobModel.create_instance(db_client=db_client)
+
+        project = await project_model.get_or_create_project(project_id=project_id)
+        if not project:
+            return False, {"signal": ResponseSignalEnum.PROJECT_NOT_FOUND_ERROR.value}
+
+        collection_name = self.nlp_controller.create_collection_name(
+            project_id=cast(int, project.project_id)
+        )
+        _ = await self.app_state.vectordb_client.create_collection(
+            collection_name=collection_name,
+            embedding_size=self.app_state.embedding_client.embedding_size,
+            do_reset=do_reset,
+        )
+        if do_reset:
+            _ = await chunk_model.reset_chunks_indexed(
+                project_id=cast(int, project.project_id)
+            )
+
+        # One job per chunk_id range, an empty project still gets one to report on
+        chunk_id_ranges = await chunk_model.get_chunk_id_ranges(
+            project_id=cast(int, project.project_id),
+            range_size=self.app_settings.WORKER_INDEX_CHUNKS_PER_JOB,
+            only_unindexed=incremental,
+        )
+        batch_uuid = uuid.uuid4()
+        queued_jobs = await job_model.enqueue_jobs(
+            [
+                QueuedJob(  # type: ignore
+                    job_batch_uuid=batch_uuid,
+                    job_type=JobTypeEnum.INDEX.value,
+                    job_status=JobStatusEnum.QUEUED.value,
+                    job_payload={
+                        "min_chunk_id": min_chunk_id,
+                        "max_chunk_id": max_chunk_id,
+                        "only_unindexed": incremental,
+                    },
+                    job_processed=0,
+                    job_attempts=0,
+                    job_project_id=project.project_id,
+                )
+                for min_chunk_id, max_chunk_id in chunk_id_ranges or [(0, None)]
+            ]
+        )
+
+        return True, {
+            "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+            "job_id": str(batch_uuid),
+            "queued_jobs": len(queued_jobs),
+        }
+
+    async def run_queued_job(
+        self, queued_job: QueuedJob, job: Optional[Job] = None
+    ) -> Tuple[bool, dict]:
+        db_client = self.app_state.db_client
+        project_model = await ProjectModel.create_instance(db_client=db_client)
+        chunk_model = await DataChunkModel.create_instance(db_client=db_client)
+        project = await project_model.get_or_create_project(
+            project_id=cast(int, queued_job.job_project_id)
+        )
+        payload = cast(dict, queued_job.job_payload)
+
+        if queued_job.job_type == JobTypeEnum.PROCESS.value:
+            if payload.get("incremental"):
+                # The diff against the stored chunks also absorbs a retried job's leftovers
+                asset_model = await AssetModel.create_instance(db_client=db_client)
+                asset = await asset_model.get_asset_record(
+                    asset_project_id=cast(int, project.project_id),
+                    asset_name=payload["file_id"],
+                )
+                if asset is None:
+                    return False, {"signal": ResponseSignalEnum.FILE_ID_ERROR.value}
+                file_result = await self.process_file_incremental(
+                    project=project,
+                    chunk_model=chunk_model,
+                    asset=asset,
+                    chunk_size=payload["chunk_size"],
+                    overlap_size=payload["overlap_size"],
+                    chunking_strategy=payload["chunking_strategy"],
+                    job=job,
+                )
+            else:
+                # A retried job may have inserted part of its chunks, and an indexed
+                # asset has vectors referencing them
+                asset_chunks = await chunk_model.get_asset_chunks(
+                    asset_id=payload["asset_id"]
+                )
+                _ = await self.delete_chunks_with_vectors(
+                    project=project,
+                    chunk_model=chunk_model,
+                    chunk_ids=[chunk_id for chunk_id, _, _ in asset_chunks],
+                )
+                file_result = await self.process_file(
+                    project=project,
+                    chunk_model=chunk_model,
+                    asset_id=payload["asset_id"],
+                    file_name=payload["file_id"],
+                    chunk_size=payload["chunk_size"],
+                    overlap_size=payload["overlap_size"],
+                    chunking_strategy=payload["chunking_strategy"],
+                    job=job,
+                )
+            is_success = file_result["signal"] in PROCESSED_FILE_SIGNALS
+            if not is_success and job is not None:
+                job.add_error(file_result.get("error", file_result["signal"]))
+            return is_success, file_result
+
+        if queued_job.job_type == JobTypeEnum.INDEX.value:
+            # A retry resumes after the pages an earlier attempt already inserted
+            only_unindexed = (
+                payload.get("only_unindexed", False) or queued_job.job_attempts > 1
+            )
+            total_chunks_count = await chunk_model.get_total_chunks_count(
+                project_id=cast(int, project.project_id),
+                min_chunk_id=payload["min_chunk_id"],
+                max_chunk_id=payload["max_chunk_id"],
+                only_unindexed=only_unindexed,
+            )
+            if job is not None:
+                job.update_progress(processed=0, total=total_chunks_count)
+
+            is_inserted, total_inserted_items_count = await self.index_chunks(
+                project=project,
+                chunk_model=chunk_model,
+                total_chunks_count=total_chunks_count,
+                job=job,
+                min_chunk_id=payload["min_chunk_id"],
+                max_chunk_id=payload["max_chunk_id"],
+                only_unindexed=only_unindexed,
+            )
+            return is_inserted, {
+                "signal": (
+                    ResponseSignalEnum.INSERT_INTO_VECTORDB_SUCCESS.value
+                    if is_inserted
+                    else ResponseSignalEnum.INSERT_INTO_VECTORDB_ERROR.value
+                ),
+                "total_inserted_items_count": total_inserted_items_count,
+            }
+
+        if queued_job.job_type == JobTypeEnum.INGEST.value:
+            # A retried job may have inserted and indexed part of the asset's chunks
+            asset_chunks = await chunk_model.get_asset_chunks(
+                asset_id=payload["asset_id"]
+            )
+            _ = await self.delete_chunks_with_vectors(
+                project=project,
+                chunk_model=chunk_model,
+                chunk_ids=[chunk_id for chunk_id, _, _ in asset_chunks],
+            )
+            return await self.ingest_project(
+                project_id=cast(int, project.project_id),
+                file_id=payload["file_id"],
+                chunk_size=payload["chunk_size"],
+                overlap_size=payload["overlap_size"],
+                chunking_strategy=payload["chunking_strategy"],
+                job=job,
+                build_vector_index=False,
+            )
+
+        return False, {"signal": ResponseSignalEnum.JOB_NOT_FOUND.value}
+
+    async def finalize_queued_job(self, queued_job: QueuedJob):
+        # The worker finishing the last job of an index or ingest batch builds the vector index
+        if queued_job.job_type not in [
+            JobTypeEnum.INDEX.value,
+            JobTypeEnum.INGEST.value,
+        ]:
+            return
+
+        job_model = await JobModel.create_instance(db_client=self.app_state.db_client)
+        is_claimed = await job_model.claim_batch_finalization(
+            cast(uuid.UUID, queued_job.job_batch_uuid)
+        )
+        if is_claimed:
+            project_model = await ProjectModel.create_instance(
+                db_client=self.app_state.db_client
+            )
+            project = await project_model.get_or_create_project(
+                project_id=cast(int, queued_job.job_project_id)
+            )
+            await self.nlp_controller.build_vector_index(project=project)
+
+    async def get_queued_job_batch(self, job_id: str) -> Optional[dict]:
+        try:
+            batch_uuid = uuid.UUID(job_id)
+        except ValueError:
+            return None
+
+        job_model = await JobModel.create_instance(db_client=self.app_state.db_client)
+        queued_jobs = await job_model.get_batch_jobs(batch_uuid)
+        if len(queued_jobs) == 0:
+            return None
+
+        statuses = {queued_job.job_status for queued_job in queued_jobs}
+        status = JobStatusEnum.SUCCEEDED.value
+        for batch_status in [
+            JobStatusEnum.RUNNING,
+            JobStatusEnum.QUEUED,
+            JobStatusEnum.FAILED,
+            JobStatusEnum.CANCELLED,
+        ]:
+            if batch_status.value in statuses:
+                status = batch_status.value
+                break
+
+        processed = sum(
+            cast(int, queued_job.job_processed) for queued_job in queued_jobs
+        )
+        total = sum(cast(int, queued_job.job_total or 0) for queued_job in queued_jobs)
+        started_at = [q.started_at for q in queued_jobs if q.started_at is not None]
+        finished_at = [q.finished_at for q in queued_jobs if q.finished_at is not None]
+        is_finished = status in FINISHED_JOB_STATUSES
+        elapsed_seconds = None
+        if started_at:
+            end_time = max(finished_at) if is_finished and finished_at else None
+            elapsed_seconds = (end_time.timestamp() if end_time else time.time()) - min(
+                started_at
+            ).timestamp()
+        unit = (
+            "files"
+            if queued_jobs[0].job_type == JobTypeEnum.PROCESS.value
+            else "chunks"
+        )
+
+        return {
+            "job_id": job_id,
+            "job_type": queued_jobs[0].job_type,
+            "project_id": queued_jobs[0].job_project_id,
+            "status": status,
+            "progress": {
+                "unit": unit,
+                "processed": processed,
+                "total": total,
+                "percent": round(100 * processed / total, 2) if total else None,
+            },
+            "throughput": {
+                "elapsed_seconds": (
+                    round(elapsed_seconds, 3) if elapsed_seconds is not None else None
+                ),
+                f"{unit}_per_second": (
+                    round(processed / elapsed_seconds, 2) if elapsed_seconds else None
+                ),
+            },
+            "errors": [
+                f"job {queued_job.job_id}: {queued_job.job_error}"
+                for queued_job in queued_jobs
+                if queued_job.job_error
+            ],
+            "result": {
+                "jobs": [
+                    {
+                        "job_id": queued_job.job_id,
+                        "status": queued_job.job_status,
+                        "payload": queued_job.job_payload,
+                        "attempts": queued_job.job_attempts,
+                        "worker_id": queued_job.job_worker_id,
+                        "result": queued_job.job_result,
+                    }
+                    for queued_job in queued_jobs
+                ]
+            },
+            "created_at": min(q.created_at for q in queued_jobs).timestamp(),
+            "started_at": min(started_at).timestamp() if started_at else None,
+            "finished_at": (
+                max(finished_at).timestamp() if is_finished and finished_at else None
+            ),
+        }
+
+    async def cancel_queued_job_batch(self, job_id: str) -> Optional[int]:
+        try:
+            batch_uuid = uuid.UUID(job_id)
+        except ValueError:
+            return None
+
+        job_model = await JobModel.create_instance(db_client=self.app_state.db_client)
+        if len(await job_model.get_batch_jobs(batch_uuid)) == 0:
+            return None
+        return await job_model.cancel_batch(batch_uuid)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
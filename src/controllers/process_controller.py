@@ -1,16 +1,14 @@
 import os
-from typing import List
-from dataclasses import dataclass
-from langchain_community.document_loaders import TextLoader, PyMuPDFLoader
+import asyncio
+from functools import partial
+from concurrent.futures import Executor
+from typing import AsyncIterator, Iterable, List, Optional
 from controllers.base_controller import BaseController
 from controllers import ProjectController
 from models import ProcessingEnum
-
-
-@dataclass
-class Document:
-    page_content: str
-    metadata: dict
+from stores.chunkers import ChunkerProviderFactory, Document
+from stores.loaders import LoaderProviderFactory
+from stores.tokenizers import TokenizerProviderFactory, TokenizerEnum, LengthUnitEnum
 
 
 class ProcessController(BaseController):
@@ -22,58 +20,194 @@ class ProcessController(BaseController):
     def get_file_extension(self, file_name: str):
         return os.path.splitext(file_name)[-1]
 
-    def get_file_loader(self, file_name: str):
-        file_ext = self.get_file_extension(file_name)
+    def get_file_loader(
+        self,
+        file_name: str,
+        page_start: Optional[int] = None,
+        page_end: Optional[int] = None,
+    ):
         file_path = os.path.join(self.project_path, file_name)
         if not os.path.exists(file_path):
             return None
-        if file_ext == ProcessingEnum.TXT.value:
-            return TextLoader(file_path, encoding="utf-8")
-        if file_ext == ProcessingEnum.PDF.value:
-            return PyMuPDFLoader(file_path)
 
-        return None
+        return LoaderProviderFactory(self.app_settings).create(
+            file_path, page_start=page_start, page_end=page_end
+        )
+
+    def get_file_content(
+        self,
+        file_id: str,
+        page_start: Optional[int] = None,
+        page_end: Optional[int] = None,
+    ):
+        # Pages are yielded one at a time so the chunker never sees the whole document
+        loader = self.get_file_loader(file_id, page_start=page_start, page_end=page_end)
+        return loader.lazy_load() if loader is not None else None
 
-    def get_file_content(self, file_id: str):
+    def get_pdf_page_count(self, file_id: str) -> int:
         loader = self.get_file_loader(file_id)
-        return loader.load() if loader is not None else None
+        return loader.get_page_count() if loader is not None else 0
+
+    def get_page_ranges(self, file_id: str):
+        # Large PDFs are split so each range is extracted and chunked on its own core
+        pages_per_task = self.app_settings.PROCESSING_PDF_PAGES_PER_TASK
+        if (
+            self.get_file_extension(file_id) != ProcessingEnum.PDF.value
+            or pages_per_task <= 0
+        ):
+            return [(None, None)]
+
+        page_count = self.get_pdf_page_count(file_id)
+        if page_count <= pages_per_task:
+            return [(None, None)]
+
+        return [
+            (page_start, min(page_start + pages_per_task, page_count))
+            for page_start in range(0, page_count, pages_per_task)
+        ]
+
+    async def aprocess_file(
+        self,
+        file_id: str,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> Optional[List[Document]]:
+        loop = asyncio.get_running_loop()
+        file_path = os.path.join(self.project_path, file_id)
+        if not os.path.exists(file_path):
+            return None
 
-    def process_file_content(
+        page_ranges = await loop.run_in_executor(
+            executor, self.get_page_ranges, file_id
+        )
+        ranges_chunks = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    partial(
+                        process_file_task,
+                        project_id=self.project_id,
+                        file_id=file_id,
+                        chunk_size=chunk_size,
+                        overlap_size=overlap_size,
+                        chunking_strategy=chunking_strategy,
+                        page_start=page_start,
+                        page_end=page_end,
+                    ),
+                )
+                for page_start, page_end in page_ranges
+            ]
+        )
+
+        if any(range_chunks is None for range_chunks in ranges_chunks):
+            return None
+
+        return [chunk for range_chunks in ranges_chunks for chunk in range_chunks]  # type: ignore
+
+    async def aiter_file_chunks(
         self,
-        file_content: list,
         file_id: str,
         chunk_size: int = 100,
         overlap_size: int = 20,
-    ):
-        file_content_text = [rec.page_content for rec in file_content]
-        file_metadata = [rec.metadata for rec in file_content]
+        chunking_strategy: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Optional[List[Document]]]:
+        # One page range at a time in page order, the next range is extracted while the
+        # caller consumes the current one
+        loop = asyncio.get_running_loop()
+        file_path = os.path.join(self.project_path, file_id)
+        if not os.path.exists(file_path):
+            yield None
+            return
 
-        chunks = self.process_simpler_splitter(
-            texts=file_content_text, metadatas=file_metadata, chunk_size=chunk_size
+        page_ranges = await loop.run_in_executor(
+            executor, self.get_page_ranges, file_id
         )
-        return chunks
 
-    def process_simpler_splitter(
+        def submit(page_start, page_end):
+            return loop.run_in_executor(
+                executor,
+                partial(
+                    process_file_task,
+                    project_id=self.project_id,
+                    file_id=file_id,
+                    chunk_size=chunk_size,
+                    overlap_size=overlap_size,
+                    chunking_strategy=chunking_strategy,
+                    page_start=page_start,
+                    page_end=page_end,
+                ),
+            )
+
+        next_future = submit(*page_ranges[0])
+        try:
+            for range_index in range(len(page_ranges)):
+                future = next_future
+                if range_index + 1 < len(page_ranges):
+                    next_future = submit(*page_ranges[range_index + 1])
+                yield await future
+        finally:
+            next_future.cancel()
+
+    def get_chunk_tokenizer(self):
+        # Chunks are budgeted in the embedding model's tokens
+        if self.app_settings.CHUNKING_LENGTH_UNIT == LengthUnitEnum.TOKENS.value:
+            return TokenizerProviderFactory(self.app_settings).create(
+                TokenizerEnum.TIKTOKEN.value,
+                model_id=self.app_settings.EMBEDDING_MODEL_ID,
+            )
+        return None
+
+    def process_file_content(
         self,
-        texts: List[str],
-        metadatas: List[dict],
-        chunk_size: int,
-        splitter_tag: str = "\n",
+        file_content: Iterable,
+        file_id: str,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        chunking_strategy: Optional[str] = None,
     ):
-        full_text = " ".join(texts)
-        lines = [doc for doc in full_text.split(splitter_tag) if len(doc.strip()) > 1]
-        chunks = []
-        current_chunk = ""
-        for line in lines:
-            current_chunk += line + splitter_tag
-            if len(current_chunk) >= chunk_size:
-                chunks.append(Document(page_content=current_chunk.strip(), metadata={}))
-                current_chunk = ""
-
-        if len(current_chunk) > 0:
-            chunks.append(Document(page_content=current_chunk.strip(), metadata={}))
-
-        return chunks
+        chunker = ChunkerProviderFactory(self.app_settings).create(
+            provider=chunking_strategy,
+            chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            tokenizer=self.get_chunk_tokenizer(),
+        )
+        if chunker is None:
+            return None
+
+        pages = (
+            Document(page_content=rec.page_content, metadata=rec.metadata)
+            for rec in file_content
+        )
+        return list(chunker.split_pages(pages))
+
+
+def process_file_task(
+    project_id: int,
+    file_id: str,
+    chunk_size: int = 100,
+    overlap_size: int = 20,
+    chunking_strategy: Optional[str] = None,
+    page_start: Optional[int] = None,
+    page_end: Optional[int] = None,
+) -> Optional[List[Document]]:
+    # Module level so it can be pickled into the processing pool's workers
+    process_controller = ProcessController(project_id)
+    file_content = process_controller.get_file_content(
+        file_id, page_start=page_start, page_end=page_end
+    )
+    if file_content is None:
+        return None
+
+    return process_controller.process_file_content(
+        file_content=file_content,
+        file_id=file_id,
+        chunk_size=chunk_size,
+        overlap_size=overlap_size,
+        chunking_strategy=chunking_strategy,
+    )
 
 
 def main():
@@ -0,0 +1,231 @@
+import os
+import uuid
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Optional, Tuple, cast
+import aiofiles
+import aiofiles.os
+from controllers.base_controller import BaseController
+from controllers.data_controller import DataController
+from controllers.project_controller import ProjectController
+from models import ResponseSignalEnum, UploadStatusEnum, UploadModel
+from models.db_schemas import Project, Upload
+from utils.byte_range_utils import parse_content_range, get_missing_byte_ranges
+from utils.hash_utils import compute_file_hash
+
+logger = logging.getLogger("uvicorn")
+
+
+class UploadController(BaseController):
+    """Resumable uploads: a file is initiated with its size, its byte ranges are PUT in
+    any order (in parallel too) into a preallocated `.part` file, and the asset is
+    created on finalize once every byte was received."""
+
+    def __init__(self, app_state: Any) -> None:
+        super().__init__()
+        self.app_state = app_state
+        self.size_scale = 1024 * 1024
+
+    def get_part_path(self, project_id: int, upload_uuid: uuid.UUID) -> str:
+        project_dir = ProjectController().get_project_path(project_id)
+        return os.path.join(project_dir, f".{upload_uuid}.part")
+
+    def get_upload_info(self, upload: Upload) -> dict:
+        return {
+            "upload_id": str(upload.upload_uuid),
+            "status": upload.upload_status,
+            "file_name": upload.upload_file_name,
+            "file_size": upload.upload_file_size,
+            "part_size": self.app_settings.FILE_RESUMABLE_PART_SIZE,
+            "received_bytes": upload.upload_received_bytes,
+            "received_ranges": upload.upload_received_ranges,
+            "missing_ranges": get_missing_byte_ranges(
+                upload.upload_received_ranges, upload.upload_file_size  # type: ignore
+            ),
+        }
+
+    async def get_upload(self, project: Project, upload_id: str) -> Optional[Upload]:
+        try:
+            upload_uuid = uuid.UUID(upload_id)
+        except ValueError:
+            return None
+
+        upload_model = await UploadModel.create_instance(
+            db_client=self.app_state.db_client
+        )
+        return await upload_model.get_upload(
+            upload_uuid=upload_uuid, project_id=cast(int, project.project_id)
+        )
+
+    async def initiate_upload(
+        self, project: Project, file_name: str, file_size: int, content_type: str
+    ) -> Tuple[bool, dict]:
+        if content_type not in self.app_settings.FILE_ALLOWED_TYPES:
+            return False, {"signal": ResponseSignalEnum.FILE_TYPE_NOT_SUPPORTED.value}
+        if file_size > self.app_settings.FILE_RESUMABLE_MAX_SIZE * self.size_scale:
+            return False, {"signal": ResponseSignalEnum.FILE_SIZE_EXCEEDED.value}
+
+        upload_model = await UploadModel.create_instance(
+            db_client=self.app_state.db_client
+        )
+        upload = await upload_model.create_upload(
+            Upload(  # type: ignore
+                upload_uuid=uuid.uuid4(),
+                upload_status=UploadStatusEnum.PENDING.value,
+                upload_file_name=file_name,
+                upload_content_type=content_type,
+                upload_file_size=file_size,
+                upload_received_ranges=[],
+                upload_received_bytes=0,
+                upload_project_id=project.project_id,
+            )
+        )
+
+        # Sized up front, every part is written at its own offset
+        async with aiofiles.open(
+            self.get_part_path(cast(int, project.project_id), upload.upload_uuid), mode="wb"  # type: ignore
+        ) as f:
+            await f.truncate(file_size)
+
+        return True, {
+            "signal": ResponseSignalEnum.UPLOAD_INITIATED.value,
+            **self.get_upload_info(upload),
+        }
+
+    async def upload_part(
+        self,
+        project: Project,
+        upload: Upload,
+        content_range: str,
+        part_stream: AsyncIterator[bytes],
+    ) -> Tuple[bool, dict]:
+        if upload.upload_status != UploadStatusEnum.PENDING.value:
+            return False, {"signal": ResponseSignalEnum.UPLOAD_ALREADY_FINALIZED.value}
+
+        byte_range = parse_content_range(
+            content_range, cast(int, upload.upload_file_size)
+        )
+        if (
+            byte_range is None
+            or byte_range[1] - byte_range[0]
+            > self.app_settings.FILE_RESUMABLE_PART_SIZE
+        ):
+            return False, {"signal": ResponseSignalEnum.UPLOAD_RANGE_INVALID.value}
+
+        start, end = byte_range
+        part_path = self.get_part_path(cast(int, project.project_id), upload.upload_uuid)  # type: ignore
+        received_bytes = 0
+        try:
+            async with aiofiles.open(part_path, mode="r+b") as f:
+                await f.seek(start)
+                async for chunk in part_stream:
+                    received_bytes += len(chunk)
+                    if received_bytes > end - start:
+                        break
+                    await f.write(chunk)
+        except OSError as exc:
+            logger.error("Error while writing upload part: %s", exc)
+            return False, {"signal": ResponseSignalEnum.FILE_UPLOAD_FAILED.value}
+
+        # A dropped connection leaves the range unrecorded, the client sends it again
+        if received_bytes != end - start:
+            return False, {"signal": ResponseSignalEnum.UPLOAD_RANGE_INVALID.value}
+
+        upload_model = await UploadModel.create_instance(
+            db_client=self.app_state.db_client
+        )
+        upload = await upload_model.add_received_range(
+            upload_id=cast(int, upload.upload_id), start=start, end=end
+        )
+        return True, {
+            "signal": ResponseSignalEnum.UPLOAD_PART_RECEIVED.value,
+            **self.get_upload_info(upload),
+        }
+
+    async def finalize_upload(
+        self, project: Project, upload: Upload
+    ) -> Tuple[bool, dict]:
+        if upload.upload_status != UploadStatusEnum.PENDING.value:
+            return False, {"signal": ResponseSignalEnum.UPLOAD_ALREADY_FINALIZED.value}
+
+        upload_info = self.get_upload_info(upload)
+        if upload_info["missing_ranges"]:
+            return False, {
+                "signal": ResponseSignalEnum.UPLOAD_INCOMPLETE.value,
+                **upload_info,
+            }
+
+        upload_model = await UploadModel.create_instance(
+            db_client=self.app_state.db_client
+        )
+        is_claimed = await upload_model.set_upload_status(
+            upload_id=cast(int, upload.upload_id),
+            from_status=UploadStatusEnum.PENDING.value,
+            to_status=UploadStatusEnum.FINALIZING.value,
+        )
+        if not is_claimed:
+            return False, {"signal": ResponseSignalEnum.UPLOAD_ALREADY_FINALIZED.value}
+
+        data_controller = DataController()
+        part_path = self.get_part_path(cast(int, project.project_id), upload.upload_uuid)  # type: ignore
+        file_path = None
+
+        async def restore_pending_upload():
+            # Back to a pending upload the client can finalize again
+            if file_path is not None and os.path.exists(file_path):
+                await aiofiles.os.rename(file_path, part_path)
+            _ = await upload_model.set_upload_status(
+                upload_id=cast(int, upload.upload_id),
+                from_status=UploadStatusEnum.FINALIZING.value,
+                to_status=UploadStatusEnum.PENDING.value,
+            )
+
+        try:
+            # Parts arrive out of order, the file is hashed once it is whole
+            file_hash = await asyncio.get_running_loop().run_in_executor(
+                None, compute_file_hash, part_path
+            )
+            file_path, file_name = data_controller.generate_unique_filepath(
+                original_file_name=cast(str, upload.upload_file_name),
+                project_id=cast(int, project.project_id),
+            )
+            await aiofiles.os.rename(part_path, file_path)
+            signal, asset_record, reused_chunks = (
+                await data_controller.create_file_asset(
+                    db_client=self.app_state.db_client,
+                    project=project,
+                    file_path=file_path,
+                    file_name=file_name,
+                    file_hash=cast(str, file_hash),
+                )
+            )
+        except Exception:
+            await restore_pending_upload()
+            raise
+        if asset_record is None:
+            await restore_pending_upload()
+            return False, {"signal": signal}
+
+        _ = await upload_model.set_upload_status(
+            upload_id=cast(int, upload.upload_id),
+            from_status=UploadStatusEnum.FINALIZING.value,
+            to_status=UploadStatusEnum.FINALIZED.value,
+            asset_id=cast(int, asset_record.asset_id),
+        )
+        return signal != ResponseSignalEnum.FILE_DUPLICATE_REJECTED.value, {
+            "signal": signal,
+            "file_id": str(asset_record.asset_id),
+            "file_hash": asset_record.asset_hash,
+            "reused_chunks": reused_chunks,
+        }
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
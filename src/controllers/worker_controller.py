@@ -0,0 +1,159 @@
+import os
+import asyncio
+import logging
+from typing import Any
+from controllers.base_controller import BaseController
+from controllers.pipeline_controller import PipelineController
+from models import JobModel, JobStatusEnum, JobTypeEnum
+from models.db_schemas import QueuedJob
+from utils.job_runner import Job
+
+logger = logging.getLogger("uvicorn")
+
+
+class WorkerController(BaseController):
+    """Claims jobs from the Postgres queue and runs them until `stop_event` is set."""
+
+    def __init__(self, app_state: Any, worker_id: str) -> None:
+        super().__init__()
+        self.app_state = app_state
+        self.worker_id = worker_id
+        self.pipeline_controller = PipelineController(app_state)
+
+    async def run(self, stop_event: asyncio.Event):
+        job_model = await JobModel.create_instance(db_client=self.app_state.db_client)
+        logger.info("Worker %s is polling for jobs", self.worker_id)
+
+        while not stop_event.is_set():
+            queued_job = await job_model.claim_job(
+                worker_id=self.worker_id,
+                lease_seconds=self.app_settings.WORKER_LEASE_SECONDS,
+            )
+            if queued_job is None:
+                try:
+                    await asyncio.wait_for(
+                        stop_event.wait(),
+                        timeout=self.app_settings.WORKER_POLL_INTERVAL_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.run_job(job_model, queued_job)
+
+    async def heartbeat(
+        self, job_model: JobModel, queued_job: QueuedJob, job: Job, task: asyncio.Task
+    ):
+        while not task.done():
+            await asyncio.sleep(self.app_settings.WORKER_HEARTBEAT_SECONDS)
+            job_status = await job_model.update_job_progress(
+                job_id=queued_job.job_id,  # type: ignore
+                processed=job.processed,
+                total=job.total,
+            )
+            if job_status == JobStatusEnum.CANCELLED.value:
+                job.status = JobStatusEnum.CANCELLED.value
+                task.cancel()
+
+    async def run_job(self, job_model: JobModel, queued_job: QueuedJob):
+        logger.info(
+            "Worker %s running %s job %s (attempt %d)",
+            self.worker_id,
+            queued_job.job_type,
+            queued_job.job_id,
+            queued_job.job_attempts,
+        )
+        if queued_job.job_attempts > self.app_settings.WORKER_MAX_ATTEMPTS:  # type: ignore
+            # Its previous workers died without finishing it, don't let it take down more
+            await job_model.finish_job(
+                job_id=queued_job.job_id,  # type: ignore
+                worker_id=self.worker_id,
+                job_status=JobStatusEnum.FAILED.value,
+                error="Attempts exhausted",
+            )
+            return
+
+        job = Job(
+            job_type=queued_job.job_type,  # type: ignore
+            project_id=queued_job.job_project_id,  # type: ignore
+            unit=(
+                "files"
+                if queued_job.job_type == JobTypeEnum.PROCESS.value
+                else "chunks"
+            ),
+        )
+        task = asyncio.create_task(
+            self.pipeline_controller.run_queued_job(queued_job, job=job)
+        )
+        heartbeat_task = asyncio.create_task(
+            self.heartbeat(job_model, queued_job, job, task)
+        )
+        try:
+            is_success, result = await task
+        except asyncio.CancelledError:
+            if job.status != JobStatusEnum.CANCELLED.value:
+                # The worker is shutting down, hand the job back to the queue
+                await job_model.requeue_job(
+                    job_id=queued_job.job_id,  # type: ignore
+                    worker_id=self.worker_id,
+                    error=f"Worker {self.worker_id} stopped",
+                )
+                raise
+            logger.info("Job %s was cancelled", queued_job.job_id)
+            return
+        except Exception as exc:  # pylint: disable=[W0718]
+            error = f"{type(exc).__name__}: {exc}"
+            logger.error("Job %s failed: %s", queued_job.job_id, error)
+            if queued_job.job_attempts < self.app_settings.WORKER_MAX_ATTEMPTS:  # type: ignore
+                await job_model.requeue_job(
+                    job_id=queued_job.job_id,  # type: ignore
+                    worker_id=self.worker_id,
+                    error=error,
+                )
+            else:
+                await job_model.finish_job(
+                    job_id=queued_job.job_id,  # type: ignore
+                    worker_id=self.worker_id,
+                    job_status=JobStatusEnum.FAILED.value,
+                    error=error,
+                )
+            return
+        finally:
+            heartbeat_task.cancel()
+
+        await job_model.update_job_progress(
+            job_id=queued_job.job_id,  # type: ignore
+            processed=job.processed,
+            total=job.total,
+        )
+        is_finished = await job_model.finish_job(
+            job_id=queued_job.job_id,  # type: ignore
+            worker_id=self.worker_id,
+            job_status=(
+                JobStatusEnum.SUCCEEDED.value
+                if is_success
+                else JobStatusEnum.FAILED.value
+            ),
+            result=result,
+            error="; ".join(job.errors) or None,
+        )
+        if not is_finished:
+            # The lease expired and the job went to another worker, which finishes it
+            logger.warning(
+                "Worker %s lost job %s to another worker",
+                self.worker_id,
+                queued_job.job_id,
+            )
+            return
+        await self.pipeline_controller.finalize_queued_job(queued_job)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 from models.enums.response_enums import ResponseSignalEnum
 from models.enums.processing_enum import ProcessingEnum
 from models.enums.database_enum import DataBaseEnum
-from models.enums.asset_enum import AssetTypeEnum
+from models.enums.asset_enum import AssetTypeEnum, AssetDedupPolicyEnum
+from models.enums.stream_enum import StreamEventEnum
+from models.enums.job_enum import JobStatusEnum, JobTypeEnum, JobBackendEnum
+from models.enums.upload_enum import UploadStatusEnum
 from models.project_model import ProjectModel
 from models.data_chunk_model import DataChunkModel
 from models.asset_model import AssetModel
+from models.job_model import JobModel
+from models.upload_model import UploadModel
@@ -1,6 +1,8 @@
 import os
-from typing import Callable, Sequence
+from typing import Callable, List, Optional, Sequence
 from sqlalchemy.future import select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.base_data_model import BaseDataModel
 from models.db_schemas import Asset
@@ -40,6 +42,59 @@ class AssetModel(BaseDataModel):
 
         return asset
 
+    async def insert_many_assets(self, assets: List[Asset]) -> Sequence[Asset]:
+        if len(assets) == 0:
+            return []
+
+        # An asset whose content is already in its project (a concurrent upload of the
+        # same file) is skipped, only the inserted rows come back
+        columns = [
+            column.key
+            for column in Asset.__table__.columns
+            if any(getattr(asset, column.key) is not None for asset in assets)
+        ]
+        query = (
+            insert(Asset)
+            .values([{key: getattr(asset, key) for key in columns} for asset in assets])
+            .on_conflict_do_nothing(
+                index_elements=[Asset.asset_project_id, Asset.asset_hash],
+                index_where=Asset.asset_hash.is_not(None),
+            )
+            .returning(Asset)
+        )
+        async with self.db_client() as session:
+            async with session.begin():
+                result = await session.scalars(query)
+                inserted_assets = result.all()
+            await session.commit()
+        return inserted_assets
+
+    async def get_assets_by_hashes(
+        self, asset_hashes: List[str], asset_project_id: Optional[int] = None
+    ) -> Sequence[Asset]:
+        if len(asset_hashes) == 0:
+            return []
+
+        async with self.db_client() as session:
+            query = select(Asset).where(Asset.asset_hash.in_(asset_hashes))
+            if asset_project_id is not None:
+                query = query.where(Asset.asset_project_id == asset_project_id)
+            result = await session.execute(query.order_by(Asset.asset_id))
+            assets = result.scalars().all()
+
+        return assets
+
+    async def update_asset_config(self, asset_id: int, asset_config: dict) -> int:
+        async with self.db_client() as session:
+            query = (
+                update(Asset)
+                .where(Asset.asset_id == asset_id)
+                .values(asset_config=asset_config)
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
     async def get_all_project_assets(
         self, asset_project_id: int, asset_type: str
     ) -> Sequence[Asset]:
@@ -1,7 +1,8 @@
 import os
-from typing import Callable, Sequence, Tuple
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, List, Optional, Sequence, Tuple
 from sqlalchemy.future import select
-from sqlalchemy import delete, func
+from sqlalchemy import delete, func, update, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.base_data_model import BaseDataModel
 from models.db_schemas import DataChunk
@@ -51,15 +52,130 @@ class DataChunkModel(BaseDataModel):
             await session.commit()
         return result.rowcount
 
+    async def delete_chunks_by_ids(self, chunk_ids: List[int]) -> int:
+        async with self.db_client() as session:
+            query = delete(DataChunk).where(DataChunk.chunk_id.in_(chunk_ids))
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+    async def copy_asset_chunks(
+        self, source_asset_id: int, target_asset_id: int, target_project_id: int
+    ) -> int:
+        # INSERT ... SELECT, the chunk texts never leave the database
+        async with self.db_client() as session:
+            query = insert(DataChunk).from_select(
+                [
+                    DataChunk.chunk_uuid,
+                    DataChunk.chunk_text,
+                    DataChunk.chunk_metadata,
+                    DataChunk.chunk_order,
+                    DataChunk.chunk_hash,
+                    DataChunk.chunk_project_id,
+                    DataChunk.chunk_asset_id,
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    DataChunk.chunk_text,
+                    DataChunk.chunk_metadata,
+                    DataChunk.chunk_order,
+                    DataChunk.chunk_hash,
+                    literal(target_project_id),
+                    literal(target_asset_id),
+                ).where(DataChunk.chunk_asset_id == source_asset_id),
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+    async def get_asset_chunks(self, asset_id: int) -> Sequence[Tuple[int, str, int]]:
+        # Only what the incremental diff needs, the texts stay in the database
+        async with self.db_client() as session:
+            query = (
+                select(DataChunk.chunk_id, DataChunk.chunk_hash, DataChunk.chunk_order)
+                .where(DataChunk.chunk_asset_id == asset_id)
+                .order_by(DataChunk.chunk_order)
+            )
+            result = await session.execute(query)
+            chunks = result.tuples().all()
+        return chunks
+
+    async def update_chunk_orders(self, chunk_orders: List[Tuple[int, int]]) -> int:
+        if len(chunk_orders) == 0:
+            return 0
+
+        async with self.db_client() as session:
+            # ORM bulk UPDATE by primary key, one executemany round trip
+            await session.execute(
+                update(DataChunk),
+                [
+                    {"chunk_id": chunk_id, "chunk_order": chunk_order}
+                    for chunk_id, chunk_order in chunk_orders
+                ],
+            )
+            await session.commit()
+        return len(chunk_orders)
+
+    async def mark_chunks_indexed(self, chunk_ids: List[int]) -> int:
+        async with self.db_client() as session:
+            query = (
+                update(DataChunk)
+                .where(DataChunk.chunk_id.in_(chunk_ids))
+                .values(chunk_indexed_at=datetime.now(timezone.utc))
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+    async def reset_chunks_indexed(self, project_id: int) -> int:
+        async with self.db_client() as session:
+            query = (
+                update(DataChunk)
+                .where(
+                    DataChunk.chunk_project_id == project_id,
+                    DataChunk.chunk_indexed_at.is_not(None),
+                )
+                .values(chunk_indexed_at=None)
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+    async def get_chunk_id_ranges(
+        self, project_id: int, range_size: int = 5000, only_unindexed: bool = False
+    ) -> List[Tuple[int, int]]:
+        # Every `range_size`-th chunk_id starts a range, only the boundaries leave the database
+        async with self.db_client() as session:
+            query = select(
+                DataChunk.chunk_id,
+                func.row_number()  # pylint: disable=[E1102]
+                .over(order_by=DataChunk.chunk_id)
+                .label("chunk_number"),
+            ).where(DataChunk.chunk_project_id == project_id)
+            if only_unindexed:
+                query = query.where(DataChunk.chunk_indexed_at.is_(None))
+            numbered_chunks = query.subquery()
+            result = await session.execute(
+                select(numbered_chunks.c.chunk_id)
+                .where((numbered_chunks.c.chunk_number - 1) % range_size == 0)
+                .order_by(numbered_chunks.c.chunk_id)
+            )
+            range_starts = result.scalars().all()
+
+        return [
+            (range_start, range_end - 1)
+            for range_start, range_end in zip(range_starts, range_starts[1:])
+        ] + (
+            [(range_starts[-1], None)] if range_starts else []
+        )  # type: ignore
+
     async def get_project_chunks(
         self, project_id: int, page_number: int = 1, page_size: int = 50
     ) -> Tuple[Sequence[DataChunk], int]:
         async with self.db_client() as session:
             total_chunks = await session.execute(
-                select(
-                    func.count(  # pylint: disable=[E1102]
-                        DataChunk.chunk_project_id == project_id
-                    )
+                select(func.count(DataChunk.chunk_id)).where(  # pylint: disable=[E1102]
+                    DataChunk.chunk_project_id == project_id
                 )
             )
             total_chunks = total_chunks.scalar_one()
@@ -77,16 +193,63 @@ class DataChunkModel(BaseDataModel):
             chunks = result.scalars().all()
         return chunks, total_pages
 
-    async def get_total_chunks_count(self, project_id: int) -> int:
+    async def iter_project_chunks(
+        self,
+        project_id: int,
+        page_size: int = 100,
+        min_chunk_id: int = 0,
+        max_chunk_id: Optional[int] = None,
+        only_unindexed: bool = False,
+    ) -> AsyncIterator[Sequence[DataChunk]]:
+        # Keyset pagination: each page seeks past the last chunk_id instead of OFFSET
+        last_chunk_id = min_chunk_id - 1
+        while True:
+            async with self.db_client() as session:
+                query = (
+                    select(DataChunk)
+                    .where(
+                        DataChunk.chunk_project_id == project_id,
+                        DataChunk.chunk_id > last_chunk_id,
+                    )
+                    .order_by(DataChunk.chunk_id)
+                    .limit(page_size)
+                )
+                if max_chunk_id is not None:
+                    query = query.where(DataChunk.chunk_id <= max_chunk_id)
+                if only_unindexed:
+                    query = query.where(DataChunk.chunk_indexed_at.is_(None))
+                result = await session.execute(query)
+                chunks = result.scalars().all()
+
+            if len(chunks) == 0:
+                break
+
+            yield chunks
+            last_chunk_id = chunks[-1].chunk_id
+
+            if len(chunks) < page_size:
+                break
+
+    async def get_total_chunks_count(
+        self,
+        project_id: int,
+        min_chunk_id: int = 0,
+        max_chunk_id: Optional[int] = None,
+        only_unindexed: bool = False,
+    ) -> int:
         total_chunks = 0
         async with self.db_client() as session:
-            total_chunks = await session.execute(
-                select(
-                    func.count(  # pylint: disable=[E1102]
-                        DataChunk.chunk_project_id
-                    )
-                ).where(DataChunk.chunk_project_id == project_id)
+            query = select(
+                func.count(DataChunk.chunk_project_id)  # pylint: disable=[E1102]
+            ).where(
+                DataChunk.chunk_project_id == project_id,
+                DataChunk.chunk_id >= min_chunk_id,
             )
+            if max_chunk_id is not None:
+                query = query.where(DataChunk.chunk_id <= max_chunk_id)
+            if only_unindexed:
+                query = query.where(DataChunk.chunk_indexed_at.is_(None))
+            total_chunks = await session.execute(query)
             total_chunks = total_chunks.scalar_one()
 
         return total_chunks
@@ -3,4 +3,7 @@ from models.db_schemas.minirag.schemas import (
     DataChunk,
     RetrievedDocument,
     Asset,
+    EmbeddingCache,
+    QueuedJob,
+    Upload,
 )
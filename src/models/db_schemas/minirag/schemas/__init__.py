@@ -2,3 +2,6 @@ from models.db_schemas.minirag.schemas.minirag_base import SQLAlchemyBase
 from models.db_schemas.minirag.schemas.asset import Asset
 from models.db_schemas.minirag.schemas.data_chunk import DataChunk, RetrievedDocument
 from models.db_schemas.minirag.schemas.project import Project
+from models.db_schemas.minirag.schemas.embedding_cache import EmbeddingCache
+from models.db_schemas.minirag.schemas.queued_job import QueuedJob
+from models.db_schemas.minirag.schemas.upload import Upload
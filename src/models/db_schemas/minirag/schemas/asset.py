@@ -17,6 +17,7 @@ class Asset(SQLAlchemyBase):
     asset_name = Column(String, nullable=False)
     asset_size = Column(Integer, nullable=False)
     asset_config = Column(JSONB, nullable=True)
+    asset_hash = Column(String(64), nullable=True)
 
     created_at = Column(
         DateTime(timezone=True),
@@ -35,6 +36,15 @@ class Asset(SQLAlchemyBase):
     __table_args__ = (
         Index("ix_asset_project_id", asset_project_id),
         Index("ix_asset_type", asset_type),
+        Index("ix_asset_hash", asset_hash),
+        # One asset per content and project, concurrent uploads of a file can't both win
+        Index(
+            "ix_asset_project_id_hash",
+            asset_project_id,
+            asset_hash,
+            unique=True,
+            postgresql_where=asset_hash.is_not(None),
+        ),
     )
 
 
@@ -1,5 +1,6 @@
 import os
 import uuid
+from typing import Optional
 from pydantic import BaseModel
 from sqlalchemy import Column, Integer, DateTime, func, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
@@ -16,6 +17,8 @@ class DataChunk(SQLAlchemyBase):
     chunk_text = Column(String, nullable=False)
     chunk_metadata = Column(JSONB, nullable=False)
     chunk_order = Column(Integer, nullable=False)
+    chunk_hash = Column(String(64), nullable=True)
+    chunk_indexed_at = Column(DateTime(timezone=True), nullable=True)
 
     chunk_project_id = Column(
         Integer, ForeignKey("projects.project_id"), nullable=False
@@ -39,12 +42,21 @@ class DataChunk(SQLAlchemyBase):
     __table_args__ = (
         Index("ix_chunk_project_id", chunk_project_id),
         Index("ix_chunk_asset_id", chunk_asset_id),
+        Index("ix_chunk_project_id_chunk_id", chunk_project_id, chunk_id),
+        # Incremental indexing scans only the chunks that have no vector yet
+        Index(
+            "ix_chunk_project_id_unindexed",
+            chunk_project_id,
+            chunk_id,
+            postgresql_where=chunk_indexed_at.is_(None),
+        ),
     )
 
 
 class RetrievedDocument(BaseModel):
     text: str
     score: float
+    chunk_id: Optional[int] = None
 
 
 def main():
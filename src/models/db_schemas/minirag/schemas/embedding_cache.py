@@ -0,0 +1,29 @@
+import os
+from sqlalchemy import Column, Integer, DateTime, func, String, LargeBinary
+from .minirag_base import SQLAlchemyBase
+
+
+class EmbeddingCache(SQLAlchemyBase):
+    __tablename__ = "embedding_cache"
+    embedding_model_id = Column(String, primary_key=True)
+    embedding_size = Column(Integer, primary_key=True)
+    embedding_document_type = Column(String, primary_key=True)
+    embedding_text_hash = Column(String(64), primary_key=True)
+    embedding_vector = Column(LargeBinary, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),  # pylint: disable=[E1102]
+        nullable=False,
+    )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import uuid
+from sqlalchemy import Column, Integer, DateTime, func, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from .minirag_base import SQLAlchemyBase
+
+
+class QueuedJob(SQLAlchemyBase):
+    """One unit of work (an asset to process or a chunk range to index); the units
+    submitted by one request share a `job_batch_uuid`, the id returned to the client."""
+
+    __tablename__ = "jobs"
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    job_batch_uuid = Column(UUID(as_uuid=True), default=uuid.uuid4, nullable=False)
+
+    job_type = Column(String, nullable=False)
+    job_status = Column(String, nullable=False)
+    job_payload = Column(JSONB, nullable=False)
+    job_result = Column(JSONB, nullable=True)
+    job_error = Column(String, nullable=True)
+
+    job_processed = Column(Integer, nullable=False, default=0)
+    job_total = Column(Integer, nullable=True)
+    job_attempts = Column(Integer, nullable=False, default=0)
+    job_worker_id = Column(String, nullable=True)
+
+    job_project_id = Column(Integer, ForeignKey("projects.project_id"), nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),  # pylint: disable=[E1102]
+        nullable=False,
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_job_status_job_id", job_status, job_id),
+        Index("ix_job_batch_uuid", job_batch_uuid),
+    )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
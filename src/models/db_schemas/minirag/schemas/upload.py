@@ -0,0 +1,61 @@
+import os
+import uuid
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    DateTime,
+    func,
+    String,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from .minirag_base import SQLAlchemyBase
+
+
+class Upload(SQLAlchemyBase):
+    """A resumable upload; its parts are written into a `.part` file of the project
+    directory and the asset is created once `upload_received_ranges` covers the file."""
+
+    __tablename__ = "uploads"
+    upload_id = Column(Integer, primary_key=True, autoincrement=True)
+    upload_uuid = Column(
+        UUID(as_uuid=True), default=uuid.uuid4, unique=True, nullable=False
+    )
+
+    upload_status = Column(String, nullable=False)
+    upload_file_name = Column(String, nullable=False)
+    upload_content_type = Column(String, nullable=False)
+    upload_file_size = Column(BigInteger, nullable=False)
+    upload_received_ranges = Column(JSONB, nullable=False, default=list)
+    upload_received_bytes = Column(BigInteger, nullable=False, default=0)
+
+    upload_project_id = Column(
+        Integer, ForeignKey("projects.project_id"), nullable=False
+    )
+    upload_asset_id = Column(Integer, ForeignKey("assets.asset_id"), nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),  # pylint: disable=[E1102]
+        nullable=False,
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        onupdate=func.now(),  # pylint: disable=[E1102]
+        nullable=True,
+    )
+
+    __table_args__ = (Index("ix_upload_project_id", upload_project_id),)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
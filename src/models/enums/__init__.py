@@ -0,0 +1,2 @@
+from models.enums.stream_enum import StreamEventEnum
+from models.enums.job_enum import JobStatusEnum, JobTypeEnum, JobBackendEnum
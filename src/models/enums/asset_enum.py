@@ -6,6 +6,12 @@ class AssetTypeEnum(Enum):
     FILE = "file"
 
 
+class AssetDedupPolicyEnum(Enum):
+    REJECT = "REJECT"
+    LINK = "LINK"
+    REUSE = "REUSE"
+
+
 def main():
     """Entry Point for the Program."""
     print(
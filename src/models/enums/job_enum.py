@@ -0,0 +1,32 @@
+import os
+from enum import Enum
+
+
+class JobStatusEnum(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobTypeEnum(Enum):
+    PROCESS = "process"
+    INDEX = "index"
+    INGEST = "ingest"
+
+
+class JobBackendEnum(Enum):
+    MEMORY = "MEMORY"
+    POSTGRES = "POSTGRES"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
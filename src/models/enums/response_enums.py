@@ -8,18 +8,43 @@ class ResponseSignalEnum(Enum):
     FILE_SIZE_EXCEEDED = "file_size_exceeded"
     FILE_UPLOAD_SUCCESS = "file_upload_success"
     FILE_UPLOAD_FAILED = "file_upload_failed"
+    FILE_DUPLICATE_REJECTED = "file_duplicate_rejected"
+    FILE_DUPLICATE_LINKED = "file_duplicate_linked"
+    FILE_DUPLICATE_REUSED = "file_duplicate_reused"
+    BULK_UPLOAD_SUCCESS = "bulk_upload_success"
+    BULK_UPLOAD_FAILED = "bulk_upload_failed"
+    BULK_FILES_LIMIT_EXCEEDED = "bulk_files_limit_exceeded"
+    UPLOAD_INITIATED = "upload_initiated"
+    UPLOAD_RETRIEVED = "upload_retrieved"
+    UPLOAD_NOT_FOUND = "upload_not_found"
+    UPLOAD_PART_RECEIVED = "upload_part_received"
+    UPLOAD_RANGE_INVALID = "upload_range_invalid"
+    UPLOAD_INCOMPLETE = "upload_incomplete"
+    UPLOAD_ALREADY_FINALIZED = "upload_already_finalized"
     PROCESSING_FAILED = "processing_failed"
     PROCESSING_SUCCESS = "processing_success"
+    INGEST_FAILED = "ingest_failed"
+    INGEST_SUCCESS = "ingest_success"
     NO_FILES_ERROR = "no_files_found"
     FILE_ID_ERROR = "no_file_found_with_this_id"
+    FILE_UNCHANGED = "file_unchanged"
+    FILE_REMOVED = "file_removed"
     PROJECT_NOT_FOUND_ERROR = "project_not_found"
     INSERT_INTO_VECTORDB_ERROR = "insert_into_vectordb_error"
     INSERT_INTO_VECTORDB_SUCCESS = "insert_into_vectordb_success"
     VECTORDB_COLLECTION_RETRIEVED = "vectordb_collection_retrieved"
+    VECTORDB_INDEX_PROGRESS_RETRIEVED = "vectordb_index_progress_retrieved"
     VECTORDB_SEARCH_ERROR = "vectordb_search_error"
     VECTORDB_SEARCH_SUCCESS = "vectordb_search_success"
     RAG_ANSWER_ERROR = "rag_answer_error"
     RAG_ANSWER_SUCCESS = "rag_answer_success"
+    RAG_ANSWER_STREAM_STARTED = "rag_answer_stream_started"
+    STATS_RETRIEVED = "stats_retrieved"
+    JOB_SUBMITTED = "job_submitted"
+    JOB_RETRIEVED = "job_retrieved"
+    JOB_NOT_FOUND = "job_not_found"
+    JOB_CANCELLED = "job_cancelled"
+    JOB_NOT_CANCELLABLE = "job_not_cancellable"
 
 
 def main():
@@ -0,0 +1,20 @@
+import os
+from enum import Enum
+
+
+class StreamEventEnum(Enum):
+    METADATA = "metadata"
+    TOKEN = "token"
+    DONE = "done"
+    ERROR = "error"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import os
+from enum import Enum
+
+
+class UploadStatusEnum(Enum):
+    PENDING = "pending"
+    FINALIZING = "finalizing"
+    FINALIZED = "finalized"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy.future import select
+from sqlalchemy import update, func, and_, or_, exists, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.base_data_model import BaseDataModel
+from models.db_schemas import QueuedJob
+from models.enums.job_enum import JobStatusEnum
+
+SessionMaker = Callable[[], AsyncSession]
+
+
+class JobModel(BaseDataModel):
+    def __init__(self, db_client: SessionMaker) -> None:
+        super().__init__(db_client)
+        self.db_client = self.db_client
+
+    @classmethod
+    async def create_instance(cls, db_client: SessionMaker):
+        instance = cls(db_client)
+        return instance
+
+    async def enqueue_jobs(self, jobs: List[QueuedJob]) -> List[QueuedJob]:
+        async with self.db_client() as session:
+            async with session.begin():
+                session.add_all(jobs)
+            await session.commit()
+        return jobs
+
+    async def claim_job(
+        self, worker_id: str, lease_seconds: float = 300
+    ) -> QueuedJob | None:
+        # SKIP LOCKED lets any number of workers poll the same table, each row goes
+        # to exactly one of them. Running jobs whose worker stopped heartbeating are
+        # taken over once their lease expires
+        now = datetime.now(timezone.utc)
+        async with self.db_client() as session:
+            async with session.begin():
+                query = (
+                    select(QueuedJob)
+                    .where(
+                        or_(
+                            QueuedJob.job_status == JobStatusEnum.QUEUED.value,
+                            and_(
+                                QueuedJob.job_status == JobStatusEnum.RUNNING.value,
+                                QueuedJob.heartbeat_at
+                                < now - timedelta(seconds=lease_seconds),
+                            ),
+                        )
+                    )
+                    .order_by(QueuedJob.job_id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                result = await session.execute(query)
+                job = result.scalar_one_or_none()
+                if job is None:
+                    return None
+
+                job.job_status = JobStatusEnum.RUNNING.value  # type: ignore
+                job.job_worker_id = worker_id  # type: ignore
+                job.job_attempts += 1  # type: ignore
+                job.started_at = now  # type: ignore
+                job.heartbeat_at = now  # type: ignore
+
+        return job
+
+    async def update_job_progress(
+        self, job_id: int, processed: int, total: Optional[int] = None
+    ) -> Optional[str]:
+        # Doubles as the heartbeat, the returned status tells the worker about cancellation
+        async with self.db_client() as session:
+            query = (
+                update(QueuedJob)
+                .where(QueuedJob.job_id == job_id)
+                .values(
+                    job_processed=processed,
+                    job_total=func.coalesce(total, QueuedJob.job_total),
+                    heartbeat_at=datetime.now(timezone.utc),
+                )
+                .returning(QueuedJob.job_status)
+            )
+            result = await session.execute(query)
+            job_status = result.scalar_one_or_none()
+            await session.commit()
+        return job_status
+
+    async def finish_job(
+        self,
+        job_id: int,
+        worker_id: str,
+        job_status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> int:
+        # A worker whose lease expired no longer owns the job, its update matches nothing
+        async with self.db_client() as session:
+            query = (
+                update(QueuedJob)
+                .where(
+                    QueuedJob.job_id == job_id,
+                    QueuedJob.job_status == JobStatusEnum.RUNNING.value,
+                    QueuedJob.job_worker_id == worker_id,
+                )
+                .values(
+                    job_status=job_status,
+                    job_result=result,
+                    job_error=error,
+                    finished_at=datetime.now(timezone.utc),
+                )
+            )
+            query_result = await session.execute(query)
+            await session.commit()
+        return query_result.rowcount
+
+    async def requeue_job(self, job_id: int, worker_id: str, error: str) -> int:
+        async with self.db_client() as session:
+            query = (
+                update(QueuedJob)
+                .where(
+                    QueuedJob.job_id == job_id,
+                    QueuedJob.job_status == JobStatusEnum.RUNNING.value,
+                    QueuedJob.job_worker_id == worker_id,
+                )
+                .values(
+                    job_status=JobStatusEnum.QUEUED.value,
+                    job_error=error,
+                    job_worker_id=None,
+                )
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+    async def get_batch_jobs(self, batch_uuid: uuid.UUID) -> Sequence[QueuedJob]:
+        async with self.db_client() as session:
+            query = (
+                select(QueuedJob)
+                .where(QueuedJob.job_batch_uuid == batch_uuid)
+                .order_by(QueuedJob.job_id)
+            )
+            result = await session.execute(query)
+            jobs = result.scalars().all()
+        return jobs
+
+    async def claim_batch_finalization(self, batch_uuid: uuid.UUID) -> bool:
+        # Several workers can finish the batch's last jobs at once: the flag is set on
+        # its first job by exactly one of them, once no job of the batch is left
+        batch_jobs = aliased(QueuedJob)
+        async with self.db_client() as session:
+            query = (
+                update(QueuedJob)
+                .where(
+                    QueuedJob.job_id
+                    == select(func.min(batch_jobs.job_id))
+                    .where(batch_jobs.job_batch_uuid == batch_uuid)
+                    .scalar_subquery(),
+                    ~QueuedJob.job_payload.has_key("finalized"),
+                    ~exists().where(
+                        batch_jobs.job_batch_uuid == batch_uuid,
+                        batch_jobs.job_status.in_(
+                            [JobStatusEnum.QUEUED.value, JobStatusEnum.RUNNING.value]
+                        ),
+                    ),
+                )
+                .values(
+                    job_payload=QueuedJob.job_payload.op("||")(
+                        type_coerce({"finalized": True}, JSONB)
+                    )
+                )
+                .returning(QueuedJob.job_id)
+            )
+            result = await session.execute(query)
+            job_id = result.scalar_one_or_none()
+            await session.commit()
+        return job_id is not None
+
+    async def cancel_batch(self, batch_uuid: uuid.UUID) -> int:
+        # Running jobs are stopped by their worker at its next heartbeat
+        async with self.db_client() as session:
+            query = (
+                update(QueuedJob)
+                .where(
+                    QueuedJob.job_batch_uuid == batch_uuid,
+                    QueuedJob.job_status.in_(
+                        [JobStatusEnum.QUEUED.value, JobStatusEnum.RUNNING.value]
+                    ),
+                )
+                .values(
+                    job_status=JobStatusEnum.CANCELLED.value,
+                    finished_at=datetime.now(timezone.utc),
+                )
+            )
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
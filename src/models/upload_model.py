@@ -0,0 +1,95 @@
+import os
+import uuid
+from typing import Callable, Optional
+from sqlalchemy.future import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.base_data_model import BaseDataModel
+from models.db_schemas import Upload
+from utils.byte_range_utils import merge_byte_ranges
+
+SessionMaker = Callable[[], AsyncSession]
+
+
+class UploadModel(BaseDataModel):
+    def __init__(self, db_client: SessionMaker) -> None:
+        super().__init__(db_client)
+        self.db_client = self.db_client
+
+    @classmethod
+    async def create_instance(cls, db_client: SessionMaker):
+        instance = cls(db_client)
+        return instance
+
+    async def create_upload(self, upload: Upload) -> Upload:
+        async with self.db_client() as session:
+            async with session.begin():
+                session.add(upload)
+            await session.commit()
+            await session.refresh(upload)
+        return upload
+
+    async def get_upload(
+        self, upload_uuid: uuid.UUID, project_id: int
+    ) -> Upload | None:
+        async with self.db_client() as session:
+            query = select(Upload).where(
+                Upload.upload_uuid == upload_uuid,
+                Upload.upload_project_id == project_id,
+            )
+            result = await session.execute(query)
+            upload = result.scalar_one_or_none()
+        return upload
+
+    async def add_received_range(self, upload_id: int, start: int, end: int) -> Upload:
+        # Parts finish concurrently, the row lock serializes their read-merge-write
+        async with self.db_client() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(Upload)
+                    .where(Upload.upload_id == upload_id)
+                    .with_for_update()
+                )
+                upload = result.scalar_one()
+                received_ranges = merge_byte_ranges(
+                    list(upload.upload_received_ranges) + [[start, end]]  # type: ignore
+                )
+                upload.upload_received_ranges = received_ranges  # type: ignore
+                upload.upload_received_bytes = sum(  # type: ignore
+                    range_end - range_start
+                    for range_start, range_end in received_ranges
+                )
+        return upload
+
+    async def set_upload_status(
+        self,
+        upload_id: int,
+        from_status: str,
+        to_status: str,
+        asset_id: Optional[int] = None,
+    ) -> int:
+        # Conditional on the current status, only one finalize request gets the upload
+        async with self.db_client() as session:
+            query = (
+                update(Upload)
+                .where(
+                    Upload.upload_id == upload_id, Upload.upload_status == from_status
+                )
+                .values(upload_status=to_status)
+            )
+            if asset_id is not None:
+                query = query.values(upload_asset_id=asset_id)
+            result = await session.execute(query)
+            await session.commit()
+        return result.rowcount
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
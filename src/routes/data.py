@@ -1,20 +1,20 @@
 import os
-from typing import cast
 import logging
-import aiofiles
-from fastapi import APIRouter, UploadFile, status, Depends, Request
+from typing import List
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    UploadFile,
+    status,
+    Depends,
+    Header,
+    Request,
+)
 from fastapi.responses import JSONResponse
-from controllers import DataController, ProcessController, NLPController
+from controllers import DataController, PipelineController, UploadController
 from utils.config_utils import get_settings, Settings
-from models import (
-    ResponseSignalEnum,
-    AssetTypeEnum,
-    ProjectModel,
-    DataChunkModel,
-    AssetModel,
-)
-from models.db_schemas import DataChunk, Asset
-from routes.schemas import ProcessRequest
+from models import ResponseSignalEnum, JobTypeEnum, JobBackendEnum, ProjectModel
+from routes.schemas import ProcessRequest, InitiateUploadRequest
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -40,15 +40,8 @@ async def upload_data(
             content={"signal": result_signal}, status_code=status.HTTP_400_BAD_REQUEST
         )
 
-    file_path, file_name = data_controller.generate_unique_filepath(
-        original_file_name=file.filename, project_id=project_id  # type: ignore
-    )
-    print(f"[INFO]: File Path: {file_path}")
-
     try:
-        async with aiofiles.open(file_path, mode="wb") as f:  # type: ignore
-            while chunk := await file.read(app_settings.FILE_DEFAULT_CHUNK_SIZE):
-                await f.write(chunk)
+        saved_file = await data_controller.save_uploaded_file(file, project_id)
     except OSError as exc:
         logger.error("Error while uploading file: %s", exc)
         return JSONResponse(
@@ -56,125 +49,332 @@ async def upload_data(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    asset_model = await AssetModel.create_instance(
-        db_client=request.app.state.db_client
+    signal, asset_record, reused_chunks = await data_controller.create_file_asset(
+        db_client=request.app.state.db_client,
+        project=project,
+        file_path=saved_file["file_path"],
+        file_name=saved_file["file_name"],
+        file_hash=saved_file["file_hash"],
+    )
+    if asset_record is None:
+        return JSONResponse(
+            content={"signal": signal}, status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+    return JSONResponse(
+        content={
+            "signal": signal,
+            "file_id": str(asset_record.asset_id),
+            "file_hash": asset_record.asset_hash,
+            "reused_chunks": reused_chunks,
+        },
+        status_code=(
+            status.HTTP_409_CONFLICT
+            if signal == ResponseSignalEnum.FILE_DUPLICATE_REJECTED.value
+            else status.HTTP_200_OK
+        ),
     )
-    asset_resource = Asset(  # type: ignore
-        asset_project_id=project.project_id,
-        asset_type=AssetTypeEnum.FILE.value,
-        asset_name=file_name,
-        asset_size=os.path.getsize(file_path),
+
+
+@data_router.post("/upload/{project_id}/bulk")
+async def upload_bulk_data(request: Request, project_id: int, files: List[UploadFile]):
+    # Plain files and zip/tar archives; their entries are written concurrently and all
+    # the new assets are inserted in one batch
+    project_model = await ProjectModel.create_instance(
+        db_client=request.app.state.db_client
     )
+    project = await project_model.get_or_create_project(project_id=project_id)
+    data_controller = DataController()
 
-    asset_record = await asset_model.create_asset(asset_resource)
+    saved_files = await data_controller.save_bulk_files(files, project_id)
+    written_files = [
+        saved_file for saved_file in saved_files if "file_path" in saved_file
+    ]
+    assets_results = await data_controller.create_file_assets(
+        db_client=request.app.state.db_client,
+        project=project,
+        saved_files=written_files,
+    )
+    for written_file, (signal, asset_record, reused_chunks) in zip(
+        written_files, assets_results
+    ):
+        written_file.update(signal=signal)
+        if asset_record is None:
+            continue
+        written_file.update(
+            file_id=str(asset_record.asset_id),
+            file_hash=asset_record.asset_hash,
+            reused_chunks=reused_chunks,
+        )
 
+    files_results = [
+        {
+            key: value
+            for key, value in saved_file.items()
+            if key not in ("file_path", "file_name")
+        }
+        for saved_file in saved_files
+    ]
+    uploaded_files = sum(
+        file_result["signal"] != ResponseSignalEnum.FILE_DUPLICATE_REJECTED.value
+        for file_result in files_results
+        if "file_id" in file_result
+    )
     return JSONResponse(
         content={
-            "signal": ResponseSignalEnum.FILE_UPLOAD_SUCCESS.value,
-            "file_id": str(asset_record.asset_id),
+            "signal": (
+                ResponseSignalEnum.BULK_UPLOAD_SUCCESS.value
+                if uploaded_files > 0
+                else ResponseSignalEnum.BULK_UPLOAD_FAILED.value
+            ),
+            "uploaded_files": uploaded_files,
+            "failed_files": len(files_results) - uploaded_files,
+            "files": files_results,
         },
-        status_code=status.HTTP_200_OK,
+        status_code=(
+            status.HTTP_200_OK if uploaded_files > 0 else status.HTTP_400_BAD_REQUEST
+        ),
     )
 
 
-@data_router.post("/process/{project_id}")
-async def process_data(
-    request: Request, project_id: int, process_request: ProcessRequest
+@data_router.post("/upload/{project_id}/resumable")
+async def initiate_resumable_upload(
+    request: Request, project_id: int, initiate_request: InitiateUploadRequest
 ):
-    chunk_size = process_request.chunk_size
-    overlap_size = process_request.overlap_size
-    do_reset = process_request.do_reset
+    project_model = await ProjectModel.create_instance(
+        db_client=request.app.state.db_client
+    )
+    project = await project_model.get_or_create_project(project_id=project_id)
+
+    is_success, content = await UploadController(request.app.state).initiate_upload(
+        project=project,
+        file_name=initiate_request.file_name,
+        file_size=initiate_request.file_size,
+        content_type=initiate_request.content_type,
+    )
+    return JSONResponse(
+        content=content,
+        status_code=(
+            status.HTTP_201_CREATED if is_success else status.HTTP_400_BAD_REQUEST
+        ),
+    )
 
+
+@data_router.get("/upload/{project_id}/resumable/{upload_id}")
+async def get_resumable_upload(request: Request, project_id: int, upload_id: str):
+    # Tells a reconnecting client which byte ranges are still missing
     project_model = await ProjectModel.create_instance(
         db_client=request.app.state.db_client
     )
-    chunk_model = await DataChunkModel.create_instance(
+    project = await project_model.get_or_create_project(project_id=project_id)
+    upload_controller = UploadController(request.app.state)
+
+    upload = await upload_controller.get_upload(project, upload_id)
+    if upload is None:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.UPLOAD_NOT_FOUND.value},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    return JSONResponse(
+        content={
+            "signal": ResponseSignalEnum.UPLOAD_RETRIEVED.value,
+            **upload_controller.get_upload_info(upload),
+        },
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@data_router.put("/upload/{project_id}/resumable/{upload_id}")
+async def upload_resumable_part(
+    request: Request,
+    project_id: int,
+    upload_id: str,
+    content_range: str = Header(...),
+):
+    # The raw body is the range in `Content-Range: bytes <first>-<last>/<size>`
+    project_model = await ProjectModel.create_instance(
         db_client=request.app.state.db_client
     )
-    asset_model = AssetModel(db_client=request.app.state.db_client)
     project = await project_model.get_or_create_project(project_id=project_id)
+    upload_controller = UploadController(request.app.state)
+
+    upload = await upload_controller.get_upload(project, upload_id)
+    if upload is None:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.UPLOAD_NOT_FOUND.value},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    is_success, content = await upload_controller.upload_part(
+        project=project,
+        upload=upload,
+        content_range=content_range,
+        part_stream=request.stream(),
+    )
+    return JSONResponse(
+        content=content,
+        status_code=status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST,
+    )
+
 
-    process_controller = ProcessController(project_id)
-    nlp_controller = NLPController(
-        vectordb_client=request.app.state.vectordb_client,
-        generation_client=request.app.state.generation_client,
-        embedding_client=request.app.state.embedding_client,
-        template_parser=request.app.state.template_parser,
+@data_router.post("/upload/{project_id}/resumable/{upload_id}/finalize")
+async def finalize_resumable_upload(request: Request, project_id: int, upload_id: str):
+    project_model = await ProjectModel.create_instance(
+        db_client=request.app.state.db_client
     )
+    project = await project_model.get_or_create_project(project_id=project_id)
+    upload_controller = UploadController(request.app.state)
 
-    project_files_ids = {}
-    if process_request.file_id is not None:
-        asset = await asset_model.get_asset_record(
-            asset_project_id=project.project_id, asset_name=process_request.file_id  # type: ignore
+    upload = await upload_controller.get_upload(project, upload_id)
+    if upload is None:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.UPLOAD_NOT_FOUND.value},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    try:
+        is_success, content = await upload_controller.finalize_upload(
+            project=project, upload=upload
+        )
+    except OSError as exc:
+        logger.error("Error while finalizing upload: %s", exc)
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.FILE_UPLOAD_FAILED.value},
+            status_code=status.HTTP_400_BAD_REQUEST,
         )
-        if asset is None:
-            return JSONResponse(
-                content={"signal": ResponseSignalEnum.FILE_ID_ERROR.value},
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
 
-        project_files_ids = {asset.asset_id: asset.asset_name}
+    if content["signal"] == ResponseSignalEnum.FILE_DUPLICATE_REJECTED.value:
+        status_code = status.HTTP_409_CONFLICT
     else:
-        project_files = await asset_model.get_all_project_assets(
-            project.project_id, asset_type=AssetTypeEnum.FILE.value  # type: ignore
+        status_code = status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST
+    return JSONResponse(content=content, status_code=status_code)
+
+
+@data_router.post("/process/{project_id}")
+async def process_data(
+    request: Request, project_id: int, process_request: ProcessRequest
+):
+    pipeline_controller = PipelineController(request.app.state)
+
+    async def run_pipeline(job=None):
+        return await pipeline_controller.process_project(
+            project_id=project_id,
+            file_id=process_request.file_id,
+            chunk_size=process_request.chunk_size,  # type: ignore
+            overlap_size=process_request.overlap_size,  # type: ignore
+            chunking_strategy=process_request.chunking_strategy,
+            do_reset=process_request.do_reset,  # type: ignore
+            incremental=process_request.incremental,  # type: ignore
+            job=job,
         )
-        project_files_ids = {
-            record.asset_id: record.asset_name for record in project_files
-        }
-        if len(project_files_ids) == 0:
-            return JSONResponse(
-                content={"signal": ResponseSignalEnum.NO_FILES_ERROR.value},
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-    if do_reset:
-        _ = await nlp_controller.reset_vectordb_collection(project)
-        _ = await chunk_model.delete_chunks_by_project_id(
-            project_id=cast(int, project.project_id)
-        )
-
-    no_chunk_records = 0
-    no_files = 0
-    for asset_id, file_name in project_files_ids.items():
-        file_content = process_controller.get_file_content(file_name)  # type: ignore
-        if file_content is None:
-            logger.error("Error while Processing file: %s", file_name)
-            continue
-        file_chunks = process_controller.process_file_content(
-            file_content=file_content,  # type: ignore
-            file_id=file_name,  # type: ignore
-            chunk_size=chunk_size,  # type: ignore
-            overlap_size=overlap_size,  # type: ignore
-        )
-
-        if file_chunks is None or len(file_chunks) == 0:
-            return JSONResponse(
-                content={"signal": ResponseSignalEnum.PROCESSING_FAILED.value},
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-        file_chunks_records = [
-            DataChunk(  # type: ignore
-                chunk_text=chunk.page_content,
-                chunk_metadata=chunk.metadata,
-                chunk_order=i + 1,
-                chunk_project_id=project.project_id,
-                chunk_asset_id=asset_id,
-            )
-            for i, chunk in enumerate(file_chunks)
-        ]
-
-        no_chunk_records += await chunk_model.insert_many_chunks(
-            chunks=file_chunks_records
-        )
-        no_files += 1
 
+    if (
+        process_request.run_as_job
+        and request.app.state.settings.JOBS_BACKEND == JobBackendEnum.POSTGRES.value
+    ):
+        is_success, content = await pipeline_controller.enqueue_project_processing(
+            project_id=project_id,
+            file_id=process_request.file_id,
+            chunk_size=process_request.chunk_size,  # type: ignore
+            overlap_size=process_request.overlap_size,  # type: ignore
+            chunking_strategy=process_request.chunking_strategy,
+            do_reset=process_request.do_reset,  # type: ignore
+            incremental=process_request.incremental,  # type: ignore
+        )
+        return JSONResponse(
+            content=content,
+            status_code=(
+                status.HTTP_202_ACCEPTED if is_success else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+    if process_request.run_as_job:
+        job = request.app.state.job_runner.submit(
+            job_type=JobTypeEnum.PROCESS.value,
+            project_id=project_id,
+            fn=run_pipeline,
+            unit="files",
+        )
+        return JSONResponse(
+            content={
+                "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+                "job_id": job.job_id,
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    is_success, content = await run_pipeline()
     return JSONResponse(
-        content={
-            "signal": ResponseSignalEnum.PROCESSING_SUCCESS.value,
-            "inserted_chunks": no_chunk_records,
-            "processed_files": no_files,
-        }
+        content=content,
+        status_code=status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST,
+    )
+
+
+@data_router.post("/ingest/{project_id}")
+async def ingest_data(
+    request: Request,
+    project_id: int,
+    process_request: ProcessRequest,
+    background_tasks: BackgroundTasks,
+):
+    # Process and index in one pass, the uploaded files are searchable when it returns
+    pipeline_controller = PipelineController(request.app.state)
+
+    if (
+        process_request.run_as_job
+        and request.app.state.settings.JOBS_BACKEND == JobBackendEnum.POSTGRES.value
+    ):
+        is_success, content = await pipeline_controller.enqueue_project_ingestion(
+            project_id=project_id,
+            file_id=process_request.file_id,
+            chunk_size=process_request.chunk_size,  # type: ignore
+            overlap_size=process_request.overlap_size,  # type: ignore
+            chunking_strategy=process_request.chunking_strategy,
+            do_reset=process_request.do_reset,  # type: ignore
+        )
+        return JSONResponse(
+            content=content,
+            status_code=(
+                status.HTTP_202_ACCEPTED if is_success else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+    if process_request.run_as_job:
+        job = request.app.state.job_runner.submit(
+            job_type=JobTypeEnum.INGEST.value,
+            project_id=project_id,
+            fn=lambda job: pipeline_controller.ingest_project(
+                project_id=project_id,
+                file_id=process_request.file_id,
+                chunk_size=process_request.chunk_size,  # type: ignore
+                overlap_size=process_request.overlap_size,  # type: ignore
+                chunking_strategy=process_request.chunking_strategy,
+                do_reset=process_request.do_reset,  # type: ignore
+                job=job,
+            ),
+            unit="chunks",
+        )
+        return JSONResponse(
+            content={
+                "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+                "job_id": job.job_id,
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    is_success, content = await pipeline_controller.ingest_project(
+        project_id=project_id,
+        file_id=process_request.file_id,
+        chunk_size=process_request.chunk_size,  # type: ignore
+        overlap_size=process_request.overlap_size,  # type: ignore
+        chunking_strategy=process_request.chunking_strategy,
+        do_reset=process_request.do_reset,  # type: ignore
+        background_tasks=background_tasks,
+    )
+    return JSONResponse(
+        content=content,
+        status_code=status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST,
     )
 
 
@@ -0,0 +1,99 @@
+import os
+import logging
+from fastapi import APIRouter, status, Request
+from fastapi.responses import JSONResponse
+from controllers import PipelineController
+from models import ResponseSignalEnum, JobBackendEnum
+
+logger = logging.getLogger("uvicorn.error")
+
+jobs_router = APIRouter(prefix="/api/v1/jobs", tags=["api_v1", "jobs"])
+
+
+def is_postgres_backend(request: Request) -> bool:
+    return request.app.state.settings.JOBS_BACKEND == JobBackendEnum.POSTGRES.value
+
+
+@jobs_router.get("/{job_id}")
+async def get_job(request: Request, job_id: str):
+    job = request.app.state.job_runner.get(job_id)
+    job_info = job.to_dict() if job is not None else None
+    if job_info is None and is_postgres_backend(request):
+        job_info = await PipelineController(request.app.state).get_queued_job_batch(
+            job_id
+        )
+
+    if job_info is None:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.JOB_NOT_FOUND.value},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    return JSONResponse(
+        content={
+            "signal": ResponseSignalEnum.JOB_RETRIEVED.value,
+            "job": job_info,
+        }
+    )
+
+
+@jobs_router.post("/{job_id}/cancel")
+async def cancel_job(request: Request, job_id: str):
+    job_runner = request.app.state.job_runner
+    job = job_runner.get(job_id)
+    if job is None and is_postgres_backend(request):
+        cancelled_jobs = await PipelineController(
+            request.app.state
+        ).cancel_queued_job_batch(job_id)
+        if cancelled_jobs is not None:
+            return JSONResponse(
+                content={
+                    "signal": (
+                        ResponseSignalEnum.JOB_CANCELLED.value
+                        if cancelled_jobs > 0
+                        else ResponseSignalEnum.JOB_NOT_CANCELLABLE.value
+                    ),
+                    "job_id": job_id,
+                    "cancelled_jobs": cancelled_jobs,
+                },
+                status_code=(
+                    status.HTTP_202_ACCEPTED
+                    if cancelled_jobs > 0
+                    else status.HTTP_409_CONFLICT
+                ),
+            )
+
+    if job is None:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.JOB_NOT_FOUND.value},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not job_runner.cancel(job_id):
+        return JSONResponse(
+            content={
+                "signal": ResponseSignalEnum.JOB_NOT_CANCELLABLE.value,
+                "job": job.to_dict(),
+            },
+            status_code=status.HTTP_409_CONFLICT,
+        )
+
+    logger.info("Cancellation requested for job %s", job_id)
+    return JSONResponse(
+        content={
+            "signal": ResponseSignalEnum.JOB_CANCELLED.value,
+            "job_id": job_id,
+        },
+        status_code=status.HTTP_202_ACCEPTED,
+    )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 import os
-from typing import cast, List
 import logging
-from fastapi import APIRouter, status, Request
-from fastapi.responses import JSONResponse
-from tqdm.auto import tqdm
+from fastapi import APIRouter, BackgroundTasks, status, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from routes.schemas import PushRequest, SearchRequest, AnswerRequest
-from controllers import NLPController
-from models import ProjectModel, DataChunkModel
-from models import ResponseSignalEnum
+from controllers import NLPController, PipelineController
+from stores.llm.wrappers import LLMClientWrapper
+from models import ProjectModel
+from models import (
+    ResponseSignalEnum,
+    StreamEventEnum,
+    JobTypeEnum,
+    JobBackendEnum,
+)
+from utils.sse_utils import format_sse_event
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -15,88 +20,95 @@ nlp_router = APIRouter(prefix="/api/v1/nlp", tags=["api_v1", "nlp"])
 
 
 @nlp_router.post("/index/push/{project_id}")
-async def index_project(request: Request, project_id: int, push_request: PushRequest):
-    project_model = await ProjectModel.create_instance(
-        db_client=request.app.state.db_client
+async def index_project(
+    request: Request,
+    project_id: int,
+    push_request: PushRequest,
+    background_tasks: BackgroundTasks,
+):
+    pipeline_controller = PipelineController(request.app.state)
+
+    if (
+        push_request.run_as_job
+        and request.app.state.settings.JOBS_BACKEND == JobBackendEnum.POSTGRES.value
+    ):
+        is_success, content = await pipeline_controller.enqueue_project_indexing(
+            project_id=project_id,
+            do_reset=push_request.do_reset,  # type: ignore
+            incremental=push_request.incremental,  # type: ignore
+        )
+        return JSONResponse(
+            content=content,
+            status_code=(
+                status.HTTP_202_ACCEPTED if is_success else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+    if push_request.run_as_job:
+        job = request.app.state.job_runner.submit(
+            job_type=JobTypeEnum.INDEX.value,
+            project_id=project_id,
+            fn=lambda job: pipeline_controller.index_project(
+                project_id=project_id,
+                do_reset=push_request.do_reset,  # type: ignore
+                incremental=push_request.incremental,  # type: ignore
+                job=job,
+            ),
+            unit="chunks",
+        )
+        return JSONResponse(
+            content={
+                "signal": ResponseSignalEnum.JOB_SUBMITTED.value,
+                "job_id": job.job_id,
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    is_success, content = await pipeline_controller.index_project(
+        project_id=project_id,
+        do_reset=push_request.do_reset,  # type: ignore
+        incremental=push_request.incremental,  # type: ignore
+        background_tasks=background_tasks,
     )
-    chunk_model = await DataChunkModel.create_instance(
-        db_client=request.app.state.db_client
+    return JSONResponse(
+        content=content,
+        status_code=status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST,
     )
 
+
+@nlp_router.get("/index/info/{project_id}")
+async def get_project_index_info(request: Request, project_id: int):
+    project_model = await ProjectModel.create_instance(
+        db_client=request.app.state.db_client
+    )
     project = await project_model.get_or_create_project(project_id=project_id)
     if not project:
         return JSONResponse(
             content={"signal": ResponseSignalEnum.PROJECT_NOT_FOUND_ERROR.value},
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-
     nlp_controller = NLPController(
         vectordb_client=request.app.state.vectordb_client,
         generation_client=request.app.state.generation_client,
         embedding_client=request.app.state.embedding_client,
         template_parser=request.app.state.template_parser,
+        answer_cache=request.app.state.answer_cache,
+        search_cache=request.app.state.search_cache,
+        single_flight=request.app.state.single_flight,
     )
 
-    has_records = True
-    page_number = 1
-    total_inserted_items_count = 0
-    idx = 1
-
-    collection_name = nlp_controller.create_collection_name(
-        project_id=cast(int, project.project_id)
-    )
-
-    _ = await request.app.state.vectordb_client.create_collection(
-        collection_name=collection_name,
-        embedding_size=request.app.state.embedding_client.embedding_size,
-        do_reset=push_request.do_reset,
-    )
-
-    _ = await request.app.state.vectordb_client.delete_vector_index(collection_name)
-
-    total_chunks_count = await chunk_model.get_total_chunks_count(
-        project_id=cast(int, project.project_id)
-    )
-
-    pbar = tqdm(total=total_chunks_count, desc="Vector Inexing", position=0)
-
-    while has_records:
-        page_chunks, total_pages = await chunk_model.get_project_chunks(
-            project_id=cast(int, project.project_id), page_number=page_number
-        )
-        if len(page_chunks) > 0:
-            page_number += 1
-        if not page_chunks or len(page_chunks) == 0:
-            has_records = False
-            break
-
-        chunk_ids = [chunk.chunk_id for chunk in page_chunks]
-        idx += len(page_chunks)
-
-        is_inserted = await nlp_controller.index_into_vectordb(
-            project=project,
-            chunks=page_chunks,
-            chunk_ids=cast(List[int], chunk_ids),
-        )
-        if not is_inserted:
-            return JSONResponse(
-                content={"signal": ResponseSignalEnum.INSERT_INTO_VECTORDB_ERROR.value},
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-        total_inserted_items_count += len(page_chunks)
-        pbar.update(len(page_chunks))
+    collection_info = await nlp_controller.get_vectordb_collection_info(project=project)
 
     return JSONResponse(
         content={
-            "signal": ResponseSignalEnum.INSERT_INTO_VECTORDB_SUCCESS.value,
-            "total_inserted_items_count": total_inserted_items_count,
-            "total_pages": total_pages,
+            "signal": ResponseSignalEnum.VECTORDB_COLLECTION_RETRIEVED.value,
+            "collection_info": collection_info,
         }
     )
 
 
-@nlp_router.get("/index/info/{project_id}")
-async def get_project_index_info(request: Request, project_id: int):
+@nlp_router.get("/index/progress/{project_id}")
+async def get_project_index_progress(request: Request, project_id: int):
     project_model = await ProjectModel.create_instance(
         db_client=request.app.state.db_client
     )
@@ -111,14 +123,17 @@ async def get_project_index_info(request: Request, project_id: int):
         generation_client=request.app.state.generation_client,
         embedding_client=request.app.state.embedding_client,
         template_parser=request.app.state.template_parser,
+        answer_cache=request.app.state.answer_cache,
+        search_cache=request.app.state.search_cache,
+        single_flight=request.app.state.single_flight,
     )
 
-    collection_info = await nlp_controller.get_vectordb_collection_info(project=project)
+    index_progress = await nlp_controller.get_vector_index_progress(project=project)
 
     return JSONResponse(
         content={
-            "signal": ResponseSignalEnum.VECTORDB_COLLECTION_RETRIEVED.value,
-            "collection_info": collection_info,
+            "signal": ResponseSignalEnum.VECTORDB_INDEX_PROGRESS_RETRIEVED.value,
+            "index_progress": index_progress,
         }
     )
 
@@ -141,10 +156,17 @@ async def search_index(
         generation_client=request.app.state.generation_client,
         embedding_client=request.app.state.embedding_client,
         template_parser=request.app.state.template_parser,
+        answer_cache=request.app.state.answer_cache,
+        search_cache=request.app.state.search_cache,
+        single_flight=request.app.state.single_flight,
     )
 
     results = await nlp_controller.search_vectordb_collection(
-        project=project, text=search_request.text, limit=search_request.limit  # type: ignore
+        project=project,
+        text=search_request.text,
+        limit=search_request.limit,  # type: ignore
+        ef_search=search_request.ef_search,
+        probes=search_request.probes,
     )
 
     if not results:
@@ -177,10 +199,17 @@ async def answer_rag(request: Request, project_id: int, answer_request: AnswerRe
         generation_client=request.app.state.generation_client,
         embedding_client=request.app.state.embedding_client,
         template_parser=request.app.state.template_parser,
+        answer_cache=request.app.state.answer_cache,
+        search_cache=request.app.state.search_cache,
+        single_flight=request.app.state.single_flight,
     )
 
     answer, full_prompt, chat_history = await nlp_controller.answer_rag_question(
-        project=project, query=answer_request.text, limit=answer_request.limit  # type: ignore
+        project=project,
+        query=answer_request.text,
+        limit=answer_request.limit,  # type: ignore
+        ef_search=answer_request.ef_search,
+        probes=answer_request.probes,
     )
 
     if not answer:
@@ -199,6 +228,121 @@ async def answer_rag(request: Request, project_id: int, answer_request: AnswerRe
     )
 
 
+@nlp_router.post("/index/answer/stream/{project_id}")
+async def answer_rag_stream(
+    request: Request, project_id: int, answer_request: AnswerRequest
+):
+    project_model = await ProjectModel.create_instance(
+        db_client=request.app.state.db_client
+    )
+    project = await project_model.get_or_create_project(project_id=project_id)
+    if not project:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.PROJECT_NOT_FOUND_ERROR.value},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    nlp_controller = NLPController(
+        vectordb_client=request.app.state.vectordb_client,
+        generation_client=request.app.state.generation_client,
+        embedding_client=request.app.state.embedding_client,
+        template_parser=request.app.state.template_parser,
+        answer_cache=request.app.state.answer_cache,
+        search_cache=request.app.state.search_cache,
+        single_flight=request.app.state.single_flight,
+    )
+
+    retrieved_documents, full_prompt, chat_history = (
+        await nlp_controller.construct_rag_prompt(
+            project=project,
+            query=answer_request.text,
+            limit=answer_request.limit,  # type: ignore
+            ef_search=answer_request.ef_search,
+            probes=answer_request.probes,
+        )
+    )
+
+    if not retrieved_documents:
+        return JSONResponse(
+            content={"signal": ResponseSignalEnum.RAG_ANSWER_ERROR.value},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    async def stream_events():
+        # Retrieval metadata goes first so clients can render sources before the answer
+        yield format_sse_event(
+            {
+                "signal": ResponseSignalEnum.RAG_ANSWER_STREAM_STARTED.value,
+                "results": [document.dict() for document in retrieved_documents],
+                "full_prompt": full_prompt,
+                "chat_history": list(chat_history),  # type: ignore
+            },
+            event=StreamEventEnum.METADATA.value,
+        )
+
+        answer_parts = []
+        try:
+            async for text in nlp_controller.stream_rag_answer(
+                full_prompt=full_prompt, chat_history=chat_history  # type: ignore
+            ):
+                if await request.is_disconnected():
+                    logger.info("Client disconnected, stopping the answer stream")
+                    return
+                answer_parts.append(text)
+                yield format_sse_event(
+                    {"text": text}, event=StreamEventEnum.TOKEN.value
+                )
+        except Exception as e:  # pylint: disable=[W0718]
+            logger.error("Error while streaming the RAG answer: %s", e)
+            yield format_sse_event(
+                {"signal": ResponseSignalEnum.RAG_ANSWER_ERROR.value},
+                event=StreamEventEnum.ERROR.value,
+            )
+            return
+
+        if not answer_parts:
+            yield format_sse_event(
+                {"signal": ResponseSignalEnum.RAG_ANSWER_ERROR.value},
+                event=StreamEventEnum.ERROR.value,
+            )
+            return
+
+        yield format_sse_event(
+            {
+                "signal": ResponseSignalEnum.RAG_ANSWER_SUCCESS.value,
+                "answer": "".join(answer_parts),
+            },
+            event=StreamEventEnum.DONE.value,
+        )
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@nlp_router.get("/stats")
+async def get_stats(request: Request):
+    embedding_client = request.app.state.embedding_client
+    stats = (
+        embedding_client.get_stats()
+        if isinstance(embedding_client, LLMClientWrapper)
+        else {}
+    )
+    if request.app.state.answer_cache is not None:
+        stats["answer_cache"] = request.app.state.answer_cache.get_stats()
+    if request.app.state.single_flight is not None:
+        stats["single_flight"] = request.app.state.single_flight.get_stats()
+    stats["jobs"] = request.app.state.job_runner.get_stats()
+
+    return JSONResponse(
+        content={
+            "signal": ResponseSignalEnum.STATS_RETRIEVED.value,
+            "stats": stats,
+        }
+    )
+
+
 def main():
     """Entry Point for the Program."""
     print(
@@ -1,2 +1,2 @@
-from routes.schemas.data import ProcessRequest
+from routes.schemas.data import ProcessRequest, InitiateUploadRequest
 from routes.schemas.nlp import PushRequest, SearchRequest, AnswerRequest
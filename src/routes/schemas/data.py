@@ -1,5 +1,5 @@
 import os
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
@@ -7,7 +7,16 @@ class ProcessRequest(BaseModel):
     file_id: Optional[str] = None
     chunk_size: Optional[int] = 100
     overlap_size: Optional[int] = 20
+    chunking_strategy: Optional[str] = None
     do_reset: Optional[int] = 0
+    run_as_job: Optional[bool] = False
+    incremental: Optional[bool] = False
+
+
+class InitiateUploadRequest(BaseModel):
+    file_name: str
+    file_size: int = Field(..., gt=0)
+    content_type: str
 
 
 def main():
@@ -1,19 +1,26 @@
 import os
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PushRequest(BaseModel):
     do_reset: Optional[int] = 0
+    run_as_job: Optional[bool] = False
+    incremental: Optional[bool] = False
 
 
 class SearchRequest(BaseModel):
     text: str
     limit: Optional[int] = 5
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1)
+
 
 class AnswerRequest(BaseModel):
     text: str
     limit: Optional[int] = 5
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1)
 
 
 def main():
@@ -0,0 +1,4 @@
+from stores.cache.semantic_answer_cache import SemanticAnswerCache, SemanticCacheEntry
+from stores.cache.cache_interface import CacheInterface
+from stores.cache.cache_enum import CacheEnum, CacheKeyEnums
+from stores.cache.cache_provider_factory import CacheProviderFactory
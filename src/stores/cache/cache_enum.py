@@ -0,0 +1,24 @@
+import os
+from enum import Enum
+
+
+class CacheEnum(Enum):
+    MEMORY = "MEMORY"
+    REDIS = "REDIS"
+
+
+class CacheKeyEnums(Enum):
+    PREFIX = "minirag"
+    SEARCH = "search"
+    VERSION = "version"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
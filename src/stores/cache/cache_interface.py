@@ -0,0 +1,40 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheInterface(ABC):
+    @abstractmethod
+    async def connect(self):
+        pass
+
+    @abstractmethod
+    async def disconnect(self):
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        pass
+
+    @abstractmethod
+    async def get_version(self, name: str) -> int:
+        pass
+
+    @abstractmethod
+    async def bump_version(self, name: str) -> int:
+        pass
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
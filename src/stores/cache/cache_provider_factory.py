@@ -0,0 +1,35 @@
+import os
+from stores.cache.providers import MemoryCacheProvider, RedisCacheProvider
+from stores.cache.cache_interface import CacheInterface
+from stores.cache.cache_enum import CacheEnum
+from utils.config_utils import get_settings, Settings
+
+
+class CacheProviderFactory:
+    def __init__(self, config: Settings = get_settings()) -> None:
+        self.config = config
+
+    def create(self, provider: str) -> CacheInterface | None:
+        if provider == CacheEnum.MEMORY.value:
+            return MemoryCacheProvider(
+                max_entries=self.config.SEARCH_CACHE_MAX_ENTRIES,
+                default_ttl_seconds=self.config.SEARCH_CACHE_TTL_SECONDS,
+            )
+        if provider == CacheEnum.REDIS.value:
+            return RedisCacheProvider(
+                url=self.config.SEARCH_CACHE_REDIS_URL,
+                default_ttl_seconds=self.config.SEARCH_CACHE_TTL_SECONDS,
+            )
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
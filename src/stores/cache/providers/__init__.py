@@ -0,0 +1,2 @@
+from .memory_cache_provider import MemoryCacheProvider
+from .redis_cache_provider import RedisCacheProvider
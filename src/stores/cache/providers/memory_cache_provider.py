@@ -0,0 +1,65 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from stores.cache.cache_interface import CacheInterface
+
+
+class MemoryCacheProvider(CacheInterface):
+    """Process-local LRU, versions are kept apart so they are never evicted."""
+
+    def __init__(
+        self, max_entries: int = 10000, default_ttl_seconds: Optional[float] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.entries: OrderedDict[str, Tuple[str, Optional[float]]] = OrderedDict()
+        self.versions: Dict[str, int] = {}
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        self.entries.clear()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        ttl_seconds = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.entries[key] = (
+            value,
+            time.monotonic() + ttl_seconds if ttl_seconds else None,
+        )
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get_version(self, name: str) -> int:
+        return self.versions.get(name, 0)
+
+    async def bump_version(self, name: str) -> int:
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return self.versions[name]
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import os
+import logging
+from typing import Optional
+from redis import asyncio as aioredis
+from stores.cache.cache_interface import CacheInterface
+from stores.cache.cache_enum import CacheKeyEnums
+
+
+class RedisCacheProvider(CacheInterface):
+    """Shared cache for several API workers, any Redis-compatible server works."""
+
+    def __init__(self, url: str, default_ttl_seconds: Optional[float] = None) -> None:
+        self.url = url
+        self.default_ttl_seconds = default_ttl_seconds
+        self.client = None
+        self.logger = logging.getLogger("uvicorn")
+
+    def get_version_key(self, name: str) -> str:
+        return f"{CacheKeyEnums.PREFIX.value}:{CacheKeyEnums.VERSION.value}:{name}"
+
+    async def connect(self):
+        self.client = aioredis.from_url(self.url, decode_responses=True)
+
+    async def disconnect(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self.client.get(key)  # type: ignore
+        except Exception as exc:  # pylint: disable=[W0718]
+            self.logger.error("Error while reading from the cache: %s", exc)
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        ttl_seconds = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            await self.client.set(  # type: ignore
+                key, value, px=int(ttl_seconds * 1000) if ttl_seconds else None
+            )
+        except Exception as exc:  # pylint: disable=[W0718]
+            self.logger.error("Error while writing to the cache: %s", exc)
+
+    async def get_version(self, name: str) -> int:
+        version = await self.client.get(self.get_version_key(name))  # type: ignore
+        return int(version) if version is not None else 0
+
+    async def bump_version(self, name: str) -> int:
+        return await self.client.incr(self.get_version_key(name))  # type: ignore
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+
+
+@dataclass
+class SemanticCacheEntry:
+    query: str
+    query_vector: np.ndarray
+    limit: int
+    answer: str
+    full_prompt: Optional[str] = None
+    chat_history: Optional[list] = None
+    chunk_ids: List[int] = field(default_factory=list)
+    # Version of the project's collection the answer was built on, None when unversioned
+    version: Optional[int] = None
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class SemanticAnswerCache:
+    """Per-project answers looked up by cosine similarity of the query embeddings."""
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.95,
+        max_entries_per_project: int = 256,
+        ttl_seconds: Optional[float] = 3600,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self.max_entries_per_project = max_entries_per_project
+        self.ttl_seconds = ttl_seconds
+        self.entries: Dict[int, OrderedDict[int, SemanticCacheEntry]] = {}
+        self.next_entry_id = 0
+        self.hits_count = 0
+        self.misses_count = 0
+        self.invalidations_count = 0
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits_count,
+            "misses": self.misses_count,
+            "invalidations": self.invalidations_count,
+            "entries": sum(len(entries) for entries in self.entries.values()),
+        }
+
+    def normalize(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def is_expired(self, entry: SemanticCacheEntry) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - entry.created_at > self.ttl_seconds
+        )
+
+    def remove_expired(self, project_id: int):
+        project_entries = self.entries.get(project_id)
+        if not project_entries:
+            return
+
+        for entry_id in [
+            entry_id
+            for entry_id, entry in project_entries.items()
+            if self.is_expired(entry)
+        ]:
+            del project_entries[entry_id]
+
+    def get(
+        self,
+        project_id: int,
+        query_vector: np.ndarray,
+        limit: int,
+        version: Optional[int] = None,
+    ) -> Optional[SemanticCacheEntry]:
+        self.remove_expired(project_id)
+        project_entries = self.entries.get(project_id)
+        # Entries of an older collection version were built on replaced or deleted chunks
+        candidates = [
+            (entry_id, entry)
+            for entry_id, entry in (project_entries or {}).items()
+            if entry.limit == limit and entry.version == version
+        ]
+        if len(candidates) == 0:
+            self.misses_count += 1
+            return None
+
+        # Entries are stored normalized, so the dot product is the cosine similarity
+        similarities = np.vstack([entry.query_vector for _, entry in candidates]) @ (
+            self.normalize(query_vector)
+        )
+        best_idx = int(np.argmax(similarities))
+        if similarities[best_idx] < self.similarity_threshold:
+            self.misses_count += 1
+            return None
+
+        entry_id, entry = candidates[best_idx]
+        project_entries.move_to_end(entry_id)  # type: ignore
+        self.hits_count += 1
+        return entry
+
+    def set(
+        self,
+        project_id: int,
+        query: str,
+        query_vector: np.ndarray,
+        limit: int,
+        answer: str,
+        full_prompt: Optional[str] = None,
+        chat_history: Optional[list] = None,
+        chunk_ids: Optional[List[int]] = None,
+        version: Optional[int] = None,
+    ):
+        project_entries = self.entries.setdefault(project_id, OrderedDict())
+        project_entries[self.next_entry_id] = SemanticCacheEntry(
+            query=query,
+            query_vector=self.normalize(query_vector),
+            limit=limit,
+            answer=answer,
+            full_prompt=full_prompt,
+            chat_history=chat_history,
+            chunk_ids=chunk_ids or [],
+            version=version,
+        )
+        self.next_entry_id += 1
+
+        while len(project_entries) > self.max_entries_per_project:
+            project_entries.popitem(last=False)
+
+    def invalidate(self, project_id: int):
+        if self.entries.pop(project_id, None) is not None:
+            self.invalidations_count += 1
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from stores.chunkers.chunker_interface import ChunkerInterface, Document
+from stores.chunkers.chunker_enum import ChunkerEnum
+from stores.chunkers.base_chunker import BaseChunker
+from stores.chunkers.chunker_provider_factory import ChunkerProviderFactory
@@ -0,0 +1,116 @@
+import os
+from abc import abstractmethod
+from typing import Iterable, Iterator, List, Optional, Sequence
+from stores.chunkers.chunker_interface import ChunkerInterface, Document
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+from stores.tokenizers.providers import CharacterTokenizer
+
+
+class BaseChunker(ChunkerInterface):
+    """Packs the segments produced by a strategy into chunks of at most `chunk_size`
+    units of the tokenizer (characters by default), each one starting with exactly the
+    last `overlap_size` units of the previous chunk. Pages are consumed one at a time and
+    every character is copied a bounded number of times, so time is linear and memory
+    is bounded by the chunk size."""
+
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        tokenizer: Optional[TokenizerInterface] = None,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+        self.overlap_size = max(0, min(overlap_size, chunk_size - 1))
+        self.tokenizer = CharacterTokenizer() if tokenizer is None else tokenizer
+        # Strategies split on characters, this keeps their pieces around one chunk long
+        self.segment_size = chunk_size * self.tokenizer.chars_per_token
+
+    @abstractmethod
+    def split_text(self, text: str) -> Iterator[str]:
+        pass
+
+    def split_pages(self, pages: Iterable[Document]) -> Iterator[Document]:
+        parts: List[str] = []
+        length, carry_length = 0, 0
+        metadata: dict = {}
+        end_metadata: dict = {}
+
+        def emit():
+            nonlocal parts, length, carry_length
+            chunk_text = "".join(parts)
+            carry_chars = self.tokenizer.get_suffix_length(
+                chunk_text, self.overlap_size
+            )
+            carry = chunk_text[len(chunk_text) - carry_chars :]
+            carry_length = self.tokenizer.count_tokens(carry) if carry else 0
+            parts, length = [carry], carry_length
+            chunk_metadata = dict(metadata)
+            end_page = end_metadata.get("page")
+            if end_page is not None and end_page != chunk_metadata.get("page"):
+                # Chunks crossing a page break record the page they end on
+                chunk_metadata["page_end"] = end_page
+            return Document(page_content=chunk_text, metadata=chunk_metadata)
+
+        for page in pages:
+            for segment in self.split_text(page.page_content):
+                # Token and character offsets into the segment, and the tokens left after
+                # them: a long segment is encoded once however many chunks it spans
+                token_offsets: Optional[Sequence[int]] = None
+                if len(segment) > self.segment_size:
+                    token_offsets = self.tokenizer.get_token_offsets(segment)
+                    segment_length = len(token_offsets)
+                else:
+                    segment_length = self.tokenizer.count_tokens(segment)
+                position, start = 0, 0
+                while start < len(segment):
+                    if length == carry_length:
+                        # First new content of this chunk decides its metadata
+                        metadata = page.metadata
+
+                    room = self.chunk_size - length
+                    if segment_length <= room:
+                        parts.append(segment[start:] if start else segment)
+                        end_metadata = page.metadata
+                        length += segment_length
+                        break
+
+                    if length > carry_length:
+                        yield emit()
+                        continue
+
+                    # Nothing but the overlap yet and the segment doesn't fit, hard-split it
+                    if token_offsets is None:
+                        token_offsets = self.tokenizer.get_token_offsets(segment)
+                    end = position + max(1, room)
+                    # The tokens of a multi-byte character share its offset: the cut goes
+                    # before a character split by `end`, or after it when it's the first
+                    while end < len(token_offsets) and token_offsets[end] <= start:
+                        end += 1
+                    if end < len(token_offsets):
+                        cut = token_offsets[end]
+                        while token_offsets[end - 1] == cut:
+                            end -= 1
+                    else:
+                        cut = len(segment)
+                    parts.append(segment[start:cut])
+                    end_metadata = page.metadata
+                    length += self.tokenizer.count_tokens(parts[-1])
+                    segment_length -= end - position
+                    position, start = end, cut
+                    yield emit()
+
+        if length > carry_length:
+            yield emit()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
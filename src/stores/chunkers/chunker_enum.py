@@ -0,0 +1,23 @@
+import os
+from enum import Enum
+
+
+class ChunkerEnum(Enum):
+    LINE = "LINE"
+    RECURSIVE = "RECURSIVE"
+    SENTENCE = "SENTENCE"
+
+
+class RecursiveChunkerEnums(Enum):
+    SEPARATORS = ["\n\n", "\n", ". ", " "]
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
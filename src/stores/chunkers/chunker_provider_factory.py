@@ -0,0 +1,50 @@
+import os
+from typing import Optional
+from stores.chunkers.providers import LineChunker, RecursiveChunker, SentenceChunker
+from stores.chunkers.chunker_interface import ChunkerInterface
+from stores.chunkers.chunker_enum import ChunkerEnum
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+from utils.config_utils import get_settings, Settings
+
+
+class ChunkerProviderFactory:
+    def __init__(self, config: Settings = get_settings()) -> None:
+        self.config = config
+
+    def create(
+        self,
+        provider: Optional[str] = None,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        tokenizer: Optional[TokenizerInterface] = None,
+    ) -> ChunkerInterface | None:
+        provider = self.config.CHUNKING_STRATEGY if provider is None else provider
+
+        if provider == ChunkerEnum.LINE.value:
+            return LineChunker(
+                chunk_size=chunk_size, overlap_size=overlap_size, tokenizer=tokenizer
+            )
+        if provider == ChunkerEnum.RECURSIVE.value:
+            return RecursiveChunker(
+                chunk_size=chunk_size, overlap_size=overlap_size, tokenizer=tokenizer
+            )
+        if provider == ChunkerEnum.SENTENCE.value:
+            return SentenceChunker(
+                chunk_size=chunk_size,
+                overlap_size=overlap_size,
+                language=self.config.CHUNKING_SENTENCE_LANGUAGE,
+                tokenizer=tokenizer,
+            )
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from .line_chunker import LineChunker
+from .recursive_chunker import RecursiveChunker
+from .sentence_chunker import SentenceChunker
@@ -0,0 +1,40 @@
+import os
+from typing import Iterator, Optional
+from stores.chunkers.base_chunker import BaseChunker
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+
+
+class LineChunker(BaseChunker):
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        splitter_tag: str = "\n",
+        tokenizer: Optional[TokenizerInterface] = None,
+    ) -> None:
+        super().__init__(
+            chunk_size=chunk_size, overlap_size=overlap_size, tokenizer=tokenizer
+        )
+        self.splitter_tag = splitter_tag
+
+    def split_text(self, text: str) -> Iterator[str]:
+        start = 0
+        while start < len(text):
+            end = text.find(self.splitter_tag, start)
+            end = len(text) if end == -1 else end
+            line = text[start:end]
+            start = end + len(self.splitter_tag)
+            # Skip blank and single-character lines (page numbers, stray bullets, ...)
+            if len(line.strip()) > 1:
+                yield line + self.splitter_tag
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
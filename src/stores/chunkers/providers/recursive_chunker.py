@@ -0,0 +1,61 @@
+import os
+from typing import Iterator, List, Optional
+from stores.chunkers.base_chunker import BaseChunker
+from stores.chunkers.chunker_enum import RecursiveChunkerEnums
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+
+
+class RecursiveChunker(BaseChunker):
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        separators: Optional[List[str]] = None,
+        tokenizer: Optional[TokenizerInterface] = None,
+    ) -> None:
+        super().__init__(
+            chunk_size=chunk_size, overlap_size=overlap_size, tokenizer=tokenizer
+        )
+        self.separators = (
+            RecursiveChunkerEnums.SEPARATORS.value if separators is None else separators
+        )
+
+    def split_text(self, text: str) -> Iterator[str]:
+        yield from self.split_with_separators(text, 0)
+
+    def split_with_separators(self, text: str, separator_idx: int) -> Iterator[str]:
+        # Pieces keep their trailing separator, so the segments re-join to the exact text
+        if len(text) <= self.segment_size or separator_idx >= len(self.separators):
+            yield text
+            return
+
+        separator = self.separators[separator_idx]
+        start = 0
+        while start < len(text):
+            if len(text) - start <= self.segment_size:
+                yield text[start:]
+                return
+
+            # Cut at the last separator that still fits, so pieces come out close to chunk_size
+            cut = text.rfind(separator, start, start + self.segment_size)
+            if cut != -1:
+                end = cut + len(separator)
+                yield text[start:end]
+            else:
+                end = text.find(separator, start + self.segment_size)
+                end = len(text) if end == -1 else end + len(separator)
+                yield from self.split_with_separators(
+                    text[start:end], separator_idx + 1
+                )
+            start = end
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import logging
+from typing import Iterator, Optional
+from nltk.tokenize import PunktSentenceTokenizer, PunktTokenizer
+from stores.chunkers.base_chunker import BaseChunker
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+
+
+class SentenceChunker(BaseChunker):
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        overlap_size: int = 20,
+        language: str = "english",
+        tokenizer: Optional[TokenizerInterface] = None,
+    ) -> None:
+        super().__init__(
+            chunk_size=chunk_size, overlap_size=overlap_size, tokenizer=tokenizer
+        )
+        self.logger = logging.getLogger("uvicorn")
+        try:
+            self.sentence_tokenizer = PunktTokenizer(language)
+        except LookupError:
+            # Punkt models aren't downloaded, the untrained tokenizer still splits on sentence ends
+            self.logger.warning(
+                "NLTK punkt model for '%s' not found, using the default sentence tokenizer",
+                language,
+            )
+            self.sentence_tokenizer = PunktSentenceTokenizer()
+
+    def split_text(self, text: str) -> Iterator[str]:
+        # Sentences run up to the next one's start so whitespace between them is kept
+        start = 0
+        for _, end in self.sentence_tokenizer.span_tokenize(text):
+            if end <= start:
+                continue
+            next_start = end
+            while next_start < len(text) and text[next_start].isspace():
+                next_start += 1
+            yield text[start:next_start]
+            start = next_start
+
+        if start < len(text):
+            yield text[start:]
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
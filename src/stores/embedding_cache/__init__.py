@@ -0,0 +1,5 @@
+from stores.embedding_cache.embedding_cache_interface import EmbeddingCacheInterface
+from stores.embedding_cache.embedding_cache_enum import EmbeddingCacheEnum
+from stores.embedding_cache.embedding_cache_provider_factory import (
+    EmbeddingCacheProviderFactory,
+)
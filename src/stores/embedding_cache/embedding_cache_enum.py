@@ -0,0 +1,23 @@
+import os
+from enum import Enum
+
+
+class EmbeddingCacheEnum(Enum):
+    POSTGRES = "POSTGRES"
+    SQLITE = "SQLITE"
+
+
+class SQLiteEmbeddingCacheEnums(Enum):
+    FILE_NAME = "embeddings.sqlite3"
+    TABLE_NAME = "embedding_cache"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List
+import numpy as np
+
+
+class EmbeddingCacheInterface(ABC):
+    @abstractmethod
+    async def connect(self):
+        pass
+
+    @abstractmethod
+    async def disconnect(self):
+        pass
+
+    @abstractmethod
+    async def get_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        text_hashes: List[str],
+    ) -> Dict[str, np.ndarray]:
+        pass
+
+    @abstractmethod
+    async def set_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        embeddings: Dict[str, np.ndarray],
+    ):
+        pass
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from stores.embedding_cache.providers import (
+    PostgresEmbeddingCacheProvider,
+    SQLiteEmbeddingCacheProvider,
+)
+from stores.embedding_cache.embedding_cache_interface import EmbeddingCacheInterface
+from stores.embedding_cache.embedding_cache_enum import EmbeddingCacheEnum
+from utils.config_utils import get_settings, Settings
+from controllers.base_controller import BaseController
+
+SessionMaker = Callable[[], AsyncSession]
+
+
+class EmbeddingCacheProviderFactory:
+    def __init__(
+        self,
+        config: Settings = get_settings(),
+        db_client: Optional[SessionMaker] = None,
+    ) -> None:
+        self.config = config
+        self.db_client = db_client
+        self.base_controller = BaseController()
+
+    def create(self, provider: str) -> EmbeddingCacheInterface | None:
+        if provider == EmbeddingCacheEnum.POSTGRES.value:
+            return PostgresEmbeddingCacheProvider(db_client=self.db_client)  # type: ignore
+        if provider == EmbeddingCacheEnum.SQLITE.value:
+            return SQLiteEmbeddingCacheProvider(
+                db_path=self.base_controller.get_database_path(
+                    db_name=self.config.EMBEDDING_CACHE_PATH
+                )
+            )
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
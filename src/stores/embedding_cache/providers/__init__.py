@@ -0,0 +1,2 @@
+from .postgres_embedding_cache_provider import PostgresEmbeddingCacheProvider
+from .sqlite_embedding_cache_provider import SQLiteEmbeddingCacheProvider
@@ -0,0 +1,100 @@
+import os
+import logging
+from typing import Callable, Dict, List
+import numpy as np
+from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from stores.embedding_cache.embedding_cache_interface import EmbeddingCacheInterface
+from models.db_schemas import EmbeddingCache
+
+SessionMaker = Callable[[], AsyncSession]
+
+
+class PostgresEmbeddingCacheProvider(EmbeddingCacheInterface):
+    def __init__(self, db_client: SessionMaker) -> None:
+        super().__init__()
+        self.db_client = db_client
+        self.logger = logging.getLogger("uvicorn")
+
+    async def connect(self):
+        # The `embedding_cache` table is managed by alembic
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def get_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        text_hashes: List[str],
+    ) -> Dict[str, np.ndarray]:
+        if len(text_hashes) == 0:
+            return {}
+
+        async with self.db_client() as session:
+            query = select(
+                EmbeddingCache.embedding_text_hash, EmbeddingCache.embedding_vector
+            ).where(
+                EmbeddingCache.embedding_model_id == model_id,
+                EmbeddingCache.embedding_size == embedding_size,
+                EmbeddingCache.embedding_document_type == document_type,
+                EmbeddingCache.embedding_text_hash.in_(text_hashes),
+            )
+            result = await session.execute(query)
+            records = result.fetchall()
+
+        return {
+            record.embedding_text_hash: np.frombuffer(
+                record.embedding_vector, dtype=np.float32
+            )
+            for record in records
+        }
+
+    async def set_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        embeddings: Dict[str, np.ndarray],
+    ):
+        if len(embeddings) == 0:
+            return 0
+
+        insert_stmt = (
+            insert(EmbeddingCache)
+            .values(
+                [
+                    {
+                        "embedding_model_id": model_id,
+                        "embedding_size": embedding_size,
+                        "embedding_document_type": document_type,
+                        "embedding_text_hash": text_hash,
+                        "embedding_vector": np.asarray(
+                            vector, dtype=np.float32
+                        ).tobytes(),
+                    }
+                    for text_hash, vector in embeddings.items()
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+
+        async with self.db_client() as session:
+            async with session.begin():
+                await session.execute(insert_stmt)
+
+        return len(embeddings)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
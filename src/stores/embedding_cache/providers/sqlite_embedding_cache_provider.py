@@ -0,0 +1,129 @@
+import os
+import asyncio
+import logging
+import sqlite3
+import threading
+from typing import Dict, List
+import numpy as np
+from stores.embedding_cache.embedding_cache_interface import EmbeddingCacheInterface
+from stores.embedding_cache.embedding_cache_enum import SQLiteEmbeddingCacheEnums
+
+
+class SQLiteEmbeddingCacheProvider(EmbeddingCacheInterface):
+    def __init__(self, db_path: str) -> None:
+        super().__init__()
+        self.db_path = os.path.join(db_path, SQLiteEmbeddingCacheEnums.FILE_NAME.value)
+        self.table_name = SQLiteEmbeddingCacheEnums.TABLE_NAME.value
+        self.connection = None
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("uvicorn")
+
+    async def connect(self):
+        self.connection = await asyncio.to_thread(self.open_connection)
+
+    def open_connection(self):
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+            "model_id TEXT NOT NULL, "
+            "embedding_size INTEGER NOT NULL, "
+            "document_type TEXT NOT NULL, "
+            "text_hash TEXT NOT NULL, "
+            "vector BLOB NOT NULL, "
+            "PRIMARY KEY (model_id, embedding_size, document_type, text_hash))"
+        )
+        connection.commit()
+        return connection
+
+    async def disconnect(self):
+        if self.connection is not None:
+            await asyncio.to_thread(self.connection.close)
+            self.connection = None
+
+    async def get_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        text_hashes: List[str],
+    ) -> Dict[str, np.ndarray]:
+        if len(text_hashes) == 0:
+            return {}
+        return await asyncio.to_thread(
+            self.select_many, model_id, embedding_size, document_type, text_hashes
+        )
+
+    def select_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        text_hashes: List[str],
+    ) -> Dict[str, np.ndarray]:
+        embeddings = {}
+        # SQLite caps the number of bound parameters per statement
+        batch_size = 500
+        with self.lock:
+            for idx in range(0, len(text_hashes), batch_size):
+                batch_hashes = text_hashes[idx : idx + batch_size]
+                placeholders = ",".join(["?"] * len(batch_hashes))
+                rows = self.connection.execute(  # type: ignore
+                    f"SELECT text_hash, vector FROM {self.table_name} "
+                    "WHERE model_id = ? AND embedding_size = ? AND document_type = ? "
+                    f"AND text_hash IN ({placeholders})",
+                    [model_id, embedding_size, document_type, *batch_hashes],
+                ).fetchall()
+                for text_hash, vector in rows:
+                    embeddings[text_hash] = np.frombuffer(vector, dtype=np.float32)
+        return embeddings
+
+    async def set_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        embeddings: Dict[str, np.ndarray],
+    ):
+        if len(embeddings) == 0:
+            return 0
+        return await asyncio.to_thread(
+            self.insert_many, model_id, embedding_size, document_type, embeddings
+        )
+
+    def insert_many(
+        self,
+        model_id: str,
+        embedding_size: int,
+        document_type: str,
+        embeddings: Dict[str, np.ndarray],
+    ):
+        with self.lock:
+            self.connection.executemany(  # type: ignore
+                f"INSERT OR IGNORE INTO {self.table_name} "
+                "(model_id, embedding_size, document_type, text_hash, vector) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        model_id,
+                        embedding_size,
+                        document_type,
+                        text_hash,
+                        np.asarray(vector, dtype=np.float32).tobytes(),
+                    )
+                    for text_hash, vector in embeddings.items()
+                ],
+            )
+            self.connection.commit()  # type: ignore
+        return len(embeddings)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
+import numpy as np
 
 
 class LLMInterface(ABC):
@@ -24,7 +25,43 @@ class LLMInterface(ABC):
         pass
 
     @abstractmethod
-    def embed_text(self, text: str | List[str], document_type: Optional[str] = None) -> list | None:
+    def embed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        pass
+
+    @abstractmethod
+    async def agenerate_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ):
+        pass
+
+    @abstractmethod
+    def astream_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        pass
+
+    @abstractmethod
+    async def aclose(self):
+        pass
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
         pass
 
     @abstractmethod
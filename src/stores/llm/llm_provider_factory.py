@@ -16,6 +16,16 @@ class LLMProviderFactory:
                 default_input_max_tokens=self.config.DEFAULT_INPUT_MAX_TOKENS,
                 default_output_max_tokens=self.config.DEFAULT_GENERATION_MAX_TOKENS,
                 default_generation_temperature=self.config.DEFAULT_GENERATION_TEMERATURE,
+                http_max_connections=self.config.LLM_HTTP_MAX_CONNECTIONS,
+                http_max_keepalive_connections=self.config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                http_keepalive_expiry=self.config.LLM_HTTP_KEEPALIVE_EXPIRY,
+                http_timeout=self.config.LLM_HTTP_TIMEOUT,
+                http_connect_timeout=self.config.LLM_HTTP_CONNECT_TIMEOUT,
+                embedding_max_batch_size=self.config.OPENAI_EMBEDDING_MAX_BATCH_SIZE,
+                embedding_max_batch_tokens=self.config.OPENAI_EMBEDDING_MAX_BATCH_TOKENS,
+                embedding_requests_per_minute=self.config.OPENAI_EMBEDDING_REQUESTS_PER_MINUTE,
+                embedding_tokens_per_minute=self.config.OPENAI_EMBEDDING_TOKENS_PER_MINUTE,
+                tokenizer_cache_dir=self.config.TOKENIZER_CACHE_DIR,
             )
         if provider == LLMEnums.COHERE.value:
             return CoHereProvider(
@@ -23,6 +33,16 @@ class LLMProviderFactory:
                 default_input_max_tokens=self.config.DEFAULT_INPUT_MAX_TOKENS,
                 default_output_max_tokens=self.config.DEFAULT_GENERATION_MAX_TOKENS,
                 default_generation_temperature=self.config.DEFAULT_GENERATION_TEMERATURE,
+                http_max_connections=self.config.LLM_HTTP_MAX_CONNECTIONS,
+                http_max_keepalive_connections=self.config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                http_keepalive_expiry=self.config.LLM_HTTP_KEEPALIVE_EXPIRY,
+                http_timeout=self.config.LLM_HTTP_TIMEOUT,
+                http_connect_timeout=self.config.LLM_HTTP_CONNECT_TIMEOUT,
+                embedding_max_batch_size=self.config.COHERE_EMBEDDING_MAX_BATCH_SIZE,
+                embedding_max_batch_tokens=self.config.COHERE_EMBEDDING_MAX_BATCH_TOKENS,
+                embedding_requests_per_minute=self.config.COHERE_EMBEDDING_REQUESTS_PER_MINUTE,
+                embedding_tokens_per_minute=self.config.COHERE_EMBEDDING_TOKENS_PER_MINUTE,
+                tokenizer_cache_dir=self.config.TOKENIZER_CACHE_DIR,
             )
 
         return None
@@ -1,8 +1,11 @@
 import os
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 import logging
+import httpx
+import numpy as np
 import cohere
 from stores.llm.llm_interface import LLMInterface
+from stores.tokenizers import get_tokenizer
 from stores.llm.llm_enum import CoHereEnums, DocumentTypeEnum
 
 
@@ -13,6 +16,16 @@ class CoHereProvider(LLMInterface):
         default_input_max_tokens: int = 1000,
         default_output_max_tokens: int = 1000,
         default_generation_temperature: float = 0.1,
+        http_max_connections: int = 100,
+        http_max_keepalive_connections: int = 20,
+        http_keepalive_expiry: float = 30.0,
+        http_timeout: float = 60.0,
+        http_connect_timeout: float = 5.0,
+        embedding_max_batch_size: int = 96,
+        embedding_max_batch_tokens: Optional[int] = None,
+        embedding_requests_per_minute: Optional[int] = 2000,
+        embedding_tokens_per_minute: Optional[int] = None,
+        tokenizer_cache_dir: Optional[str] = None,
     ) -> None:
         super().__init__()
         self.api_key = api_key
@@ -22,19 +35,50 @@ class CoHereProvider(LLMInterface):
         self.generation_model_id = None
         self.embedding_model_id = None
         self.embedding_size = None
-        self.client = cohere.Client(api_key=self.api_key)
+        self.embedding_max_batch_size = embedding_max_batch_size
+        self.embedding_max_batch_tokens = embedding_max_batch_tokens
+        self.embedding_requests_per_minute = embedding_requests_per_minute
+        self.embedding_tokens_per_minute = embedding_tokens_per_minute
+        self.tokenizer_cache_dir = tokenizer_cache_dir
+        self.tokenizer = get_tokenizer(cache_dir=self.tokenizer_cache_dir)
+        http_limits = httpx.Limits(
+            max_connections=http_max_connections,
+            max_keepalive_connections=http_max_keepalive_connections,
+            keepalive_expiry=http_keepalive_expiry,
+        )
+        http_timeouts = httpx.Timeout(http_timeout, connect=http_connect_timeout)
+        # Both clients' connection pools are ours, aclose releases them
+        self.http_client = httpx.Client(limits=http_limits, timeout=http_timeouts)
+        self.client = cohere.Client(
+            api_key=self.api_key,
+            timeout=http_timeout,
+            httpx_client=self.http_client,
+        )
+        self.async_http_client = httpx.AsyncClient(
+            limits=http_limits, timeout=http_timeouts
+        )
+        self.async_client = cohere.AsyncClient(
+            api_key=self.api_key,
+            timeout=http_timeout,
+            httpx_client=self.async_http_client,
+        )
         self.enums = CoHereEnums
         self.logger = logging.getLogger(__class__.__name__)
 
     def set_generation_model(self, model_id: str):
         self.generation_model_id = model_id
+        self.tokenizer = get_tokenizer(model_id, self.tokenizer_cache_dir)
 
     def set_embedding_model(self, model_id: str, embedding_size: int):
         self.embedding_model_id = model_id
         self.embedding_size = embedding_size
+        self.tokenizer = get_tokenizer(model_id, self.tokenizer_cache_dir)
 
     def process_text(self, text: str) -> str:
-        return text[: self.default_input_max_tokens].strip()
+        return self.tokenizer.truncate(text, self.default_input_max_tokens).strip()
+
+    def count_tokens(self, text: str) -> int:
+        return self.tokenizer.count_tokens(text)
 
     def generate_text(
         self,
@@ -53,7 +97,7 @@ class CoHereProvider(LLMInterface):
         max_output_tokens = (
             self.default_output_max_tokens
             if max_output_tokens is None
-            else self.default_output_max_tokens
+            else max_output_tokens
         )
         temprature = (
             self.default_generation_temperature if temprature is None else temprature
@@ -67,12 +111,83 @@ class CoHereProvider(LLMInterface):
             max_tokens=max_output_tokens,
         )
 
+        return self.parse_generation_response(response)
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ):
+        if not self.async_client:
+            self.logger.error("CoHere async client was not set")
+            return None
+
+        if not self.generation_model_id:
+            self.logger.error("Generation model for CoHere was not set")
+
+        max_output_tokens = (
+            self.default_output_max_tokens
+            if max_output_tokens is None
+            else max_output_tokens
+        )
+        temprature = (
+            self.default_generation_temperature if temprature is None else temprature
+        )
+
+        response = await self.async_client.chat(
+            model=self.generation_model_id,
+            chat_history=chat_history,
+            message=self.process_text(prompt),
+            temperature=temprature,
+            max_tokens=max_output_tokens,
+        )
+
+        return self.parse_generation_response(response)
+
+    async def astream_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        if not self.async_client:
+            self.logger.error("CoHere async client was not set")
+            return
+
+        if not self.generation_model_id:
+            self.logger.error("Generation model for CoHere was not set")
+
+        max_output_tokens = (
+            self.default_output_max_tokens
+            if max_output_tokens is None
+            else max_output_tokens
+        )
+        temprature = (
+            self.default_generation_temperature if temprature is None else temprature
+        )
+
+        async for event in self.async_client.chat_stream(
+            model=self.generation_model_id,
+            chat_history=chat_history,
+            message=self.process_text(prompt),
+            temperature=temprature,
+            max_tokens=max_output_tokens,
+        ):
+            if event.event_type == "text-generation" and event.text:  # type: ignore
+                yield event.text  # type: ignore
+
+    def parse_generation_response(self, response):
         if not response or not response.text:
             self.logger.error("Error while generating text with CoHere")
 
         return response.text
 
-    def embed_text(self, text: str | List[str], document_type: Optional[str] = None) -> list | None:
+    def embed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
         if not self.client:
             self.logger.error("CoHere client was not set")
             return None
@@ -84,24 +199,55 @@ class CoHereProvider(LLMInterface):
         if isinstance(text, str):
             text = [text]
 
-        input_type = (
-            CoHereEnums.DOCUMENT.value
-            if document_type == DocumentTypeEnum.DOCUMENT.value
-            else CoHereEnums.QUERY.value
+        response = self.client.embed(
+            model=self.embedding_model_id,
+            texts=[self.process_text(el) for el in text],
+            input_type=self.get_input_type(document_type),
+            embedding_types=["float"],
         )
 
-        response = self.client.embed(
+        return self.parse_embedding_response(response)
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        if not self.async_client:
+            self.logger.error("CoHere async client was not set")
+            return None
+
+        if not self.embedding_model_id:
+            self.logger.error("Embedding Model for CoHere was not set")
+            return None
+
+        if isinstance(text, str):
+            text = [text]
+
+        response = await self.async_client.embed(
             model=self.embedding_model_id,
             texts=[self.process_text(el) for el in text],
-            input_type=input_type,
+            input_type=self.get_input_type(document_type),
             embedding_types=["float"],
         )
 
+        return self.parse_embedding_response(response)
+
+    def get_input_type(self, document_type: Optional[str] = None):
+        return (
+            CoHereEnums.DOCUMENT.value
+            if document_type == DocumentTypeEnum.DOCUMENT.value
+            else CoHereEnums.QUERY.value
+        )
+
+    def parse_embedding_response(self, response) -> np.ndarray | None:
         if not response or not response.embeddings or not response.embeddings.float:  # type: ignore
             self.logger.error("Error while embedding text using CoHere")
             return None
 
-        return response.embeddings.float # type: ignore
+        return np.asarray(response.embeddings.float, dtype=np.float32)  # type: ignore
+
+    async def aclose(self):
+        await self.async_http_client.aclose()
+        self.http_client.close()
 
     def construct_prompt(self, prompt: str, role: str):
         return {"role": role, "text": prompt}
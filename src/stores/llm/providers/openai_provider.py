@@ -1,8 +1,12 @@
 import os
-from typing import Optional, List
+import base64
+from typing import Optional, List, AsyncIterator
 import logging
-from openai import OpenAI
+import httpx
+import numpy as np
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
 from stores.llm.llm_interface import LLMInterface
+from stores.tokenizers import get_tokenizer
 from stores.llm.llm_enum import OpenAIEnums
 
 
@@ -14,6 +18,16 @@ class OpenAIProvider(LLMInterface):
         default_input_max_tokens: int = 1000,
         default_output_max_tokens: int = 1000,
         default_generation_temperature: float = 0.1,
+        http_max_connections: int = 100,
+        http_max_keepalive_connections: int = 20,
+        http_keepalive_expiry: float = 30.0,
+        http_timeout: float = 60.0,
+        http_connect_timeout: float = 5.0,
+        embedding_max_batch_size: int = 2048,
+        embedding_max_batch_tokens: Optional[int] = 300000,
+        embedding_requests_per_minute: Optional[int] = 3000,
+        embedding_tokens_per_minute: Optional[int] = 1000000,
+        tokenizer_cache_dir: Optional[str] = None,
     ) -> None:
         super().__init__()
         self.api_key = api_key
@@ -24,19 +38,42 @@ class OpenAIProvider(LLMInterface):
         self.generation_model_id = None
         self.embedding_model_id = None
         self.embedding_size = None
+        self.embedding_max_batch_size = embedding_max_batch_size
+        self.embedding_max_batch_tokens = embedding_max_batch_tokens
+        self.embedding_requests_per_minute = embedding_requests_per_minute
+        self.embedding_tokens_per_minute = embedding_tokens_per_minute
+        self.tokenizer_cache_dir = tokenizer_cache_dir
+        self.tokenizer = get_tokenizer(cache_dir=self.tokenizer_cache_dir)
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=http_max_connections,
+                    max_keepalive_connections=http_max_keepalive_connections,
+                    keepalive_expiry=http_keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(http_timeout, connect=http_connect_timeout),
+            ),
+        )
         self.enums = OpenAIEnums
         self.logger = logging.getLogger(__class__.__name__)
 
     def set_generation_model(self, model_id: str):
         self.generation_model_id = model_id
+        self.tokenizer = get_tokenizer(model_id, self.tokenizer_cache_dir)
 
     def set_embedding_model(self, model_id: str, embedding_size: int):
         self.embedding_model_id = model_id
         self.embedding_size = embedding_size
+        self.tokenizer = get_tokenizer(model_id, self.tokenizer_cache_dir)
 
     def process_text(self, text: str) -> str:
-        return text[: self.default_input_max_tokens].strip()
+        return self.tokenizer.truncate(text, self.default_input_max_tokens).strip()
+
+    def count_tokens(self, text: str) -> int:
+        return self.tokenizer.count_tokens(text)
 
     def generate_text(
         self,
@@ -55,7 +92,7 @@ class OpenAIProvider(LLMInterface):
         max_output_tokens = (
             self.default_output_max_tokens
             if max_output_tokens is None
-            else self.default_output_max_tokens
+            else max_output_tokens
         )
         temprature = (
             self.default_generation_temperature if temprature is None else temprature
@@ -72,6 +109,84 @@ class OpenAIProvider(LLMInterface):
             temperature=temprature,
         )
 
+        return self.parse_generation_response(response)
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ):
+        if not self.async_client:
+            self.logger.error("OpenAI async client was not set")
+            return None
+
+        if not self.generation_model_id:
+            self.logger.error("Generation model for OpenAI was not set")
+
+        max_output_tokens = (
+            self.default_output_max_tokens
+            if max_output_tokens is None
+            else max_output_tokens
+        )
+        temprature = (
+            self.default_generation_temperature if temprature is None else temprature
+        )
+
+        chat_history.append(
+            self.construct_prompt(prompt=prompt, role=OpenAIEnums.USER.value)
+        )
+
+        response = await self.async_client.chat.completions.create(
+            model=self.generation_model_id,  # type: ignore
+            messages=chat_history,
+            max_tokens=max_output_tokens,
+            temperature=temprature,
+        )
+
+        return self.parse_generation_response(response)
+
+    async def astream_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        if not self.async_client:
+            self.logger.error("OpenAI async client was not set")
+            return
+
+        if not self.generation_model_id:
+            self.logger.error("Generation model for OpenAI was not set")
+
+        max_output_tokens = (
+            self.default_output_max_tokens
+            if max_output_tokens is None
+            else max_output_tokens
+        )
+        temprature = (
+            self.default_generation_temperature if temprature is None else temprature
+        )
+
+        chat_history.append(
+            self.construct_prompt(prompt=prompt, role=OpenAIEnums.USER.value)
+        )
+
+        stream = await self.async_client.chat.completions.create(
+            model=self.generation_model_id,  # type: ignore
+            messages=chat_history,
+            max_tokens=max_output_tokens,
+            temperature=temprature,
+            stream=True,
+        )
+
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def parse_generation_response(self, response):
         if (
             not response
             or not response.choices
@@ -86,7 +201,9 @@ class OpenAIProvider(LLMInterface):
     def construct_prompt(self, prompt: str, role: str):
         return {"role": role, "content": prompt}
 
-    def embed_text(self, text: str | List[str], document_type: Optional[str] = None) -> list | None:
+    def embed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
         if not self.client:
             self.logger.error("OpenAI client was not set")
             return None
@@ -99,9 +216,36 @@ class OpenAIProvider(LLMInterface):
             text = [text]
 
         response = self.client.embeddings.create(
-            model=self.embedding_model_id, input=text  # type: ignore
+            model=self.embedding_model_id,  # type: ignore
+            input=text,
+            encoding_format="base64",
         )
 
+        return self.parse_embedding_response(response)
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        if not self.async_client:
+            self.logger.error("OpenAI async client was not set")
+            return None
+
+        if not self.embedding_model_id:
+            self.logger.error("Embedding Model for OpenAI was not set")
+            return None
+
+        if isinstance(text, str):
+            text = [text]
+
+        response = await self.async_client.embeddings.create(
+            model=self.embedding_model_id,
+            input=text,
+            encoding_format="base64",
+        )
+
+        return self.parse_embedding_response(response)
+
+    def parse_embedding_response(self, response) -> np.ndarray | None:
         if (
             not response
             or not response.data
@@ -110,7 +254,17 @@ class OpenAIProvider(LLMInterface):
         ):
             self.logger.error("Error while embedding text with OpenAI")
             return None
-        return [el.embedding for el in response.data]
+
+        return np.vstack(
+            [
+                np.frombuffer(base64.b64decode(el.embedding), dtype=np.float32)  # type: ignore
+                for el in response.data
+            ]
+        )
+
+    async def aclose(self):
+        await self.async_client.close()
+        self.client.close()
 
 
 def main():
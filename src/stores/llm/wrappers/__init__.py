@@ -0,0 +1,4 @@
+from .llm_client_wrapper import LLMClientWrapper
+from .cached_embedding_client import CachedEmbeddingClient
+from .batched_embedding_client import BatchedEmbeddingClient
+from .rate_limited_embedding_client import RateLimitedEmbeddingClient
@@ -0,0 +1,101 @@
+import os
+import asyncio
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from stores.llm.llm_interface import LLMInterface
+from stores.llm.llm_enum import DocumentTypeEnum
+from stores.llm.wrappers.llm_client_wrapper import LLMClientWrapper
+
+
+class BatchedEmbeddingClient(LLMClientWrapper):
+    """Coalesces single-text query embeddings that arrive within `max_wait_ms` into one call."""
+
+    def __init__(
+        self, client: LLMInterface, max_batch_size: int = 32, max_wait_ms: float = 5.0
+    ) -> None:
+        super().__init__(client)
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self.flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        self.flush_tasks = set()
+        self.batches_count = 0
+        self.batched_texts_count = 0
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats["query_batching"] = {
+            "batches": self.batches_count,
+            "texts": self.batched_texts_count,
+            "average_batch_size": (
+                round(self.batched_texts_count / self.batches_count, 2)
+                if self.batches_count > 0
+                else None
+            ),
+        }
+        return stats
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        if not isinstance(text, str) or document_type != DocumentTypeEnum.QUERY.value:
+            return await self.client.aembed_text(text, document_type)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self.pending.setdefault(document_type, [])
+        pending.append((text, future))
+
+        if len(pending) >= self.max_batch_size:
+            self.flush(document_type)
+        elif document_type not in self.flush_handles:
+            self.flush_handles[document_type] = loop.call_later(
+                self.max_wait_seconds, self.flush, document_type
+            )
+
+        vector = await future
+        return None if vector is None else vector.reshape(1, -1)
+
+    def flush(self, document_type: str):
+        flush_handle = self.flush_handles.pop(document_type, None)
+        if flush_handle is not None:
+            flush_handle.cancel()
+
+        pending = self.pending.pop(document_type, [])
+        if len(pending) == 0:
+            return
+
+        task = asyncio.create_task(self.embed_batch(pending, document_type))
+        self.flush_tasks.add(task)
+        task.add_done_callback(self.flush_tasks.discard)
+
+    async def embed_batch(
+        self, pending: List[Tuple[str, asyncio.Future]], document_type: str
+    ):
+        unique_texts = list(dict.fromkeys(text for text, _ in pending))
+        self.batches_count += 1
+        self.batched_texts_count += len(pending)
+
+        try:
+            vectors = await self.client.aembed_text(unique_texts, document_type)
+        except Exception as exc:  # pylint: disable=[W0718]
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        text_vectors = dict(zip(unique_texts, vectors)) if vectors is not None else {}
+        for text, future in pending:
+            if not future.done():
+                future.set_result(text_vectors.get(text))
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
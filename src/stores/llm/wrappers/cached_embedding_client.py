@@ -0,0 +1,99 @@
+import os
+import hashlib
+import logging
+from typing import Optional, List
+import numpy as np
+from stores.llm.llm_interface import LLMInterface
+from stores.llm.llm_enum import DocumentTypeEnum
+from stores.llm.wrappers.llm_client_wrapper import LLMClientWrapper
+from stores.embedding_cache import EmbeddingCacheInterface
+
+
+class CachedEmbeddingClient(LLMClientWrapper):
+    """Serves `aembed_text` from a content-addressed cache, embedding only the misses."""
+
+    def __init__(
+        self, client: LLMInterface, embedding_cache: EmbeddingCacheInterface
+    ) -> None:
+        super().__init__(client)
+        self.embedding_cache = embedding_cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.logger = logging.getLogger("uvicorn")
+
+    def get_text_hash(self, text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        total_lookups = self.cache_hits + self.cache_misses
+        stats["embedding_cache"] = {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": (
+                round(self.cache_hits / total_lookups, 4) if total_lookups > 0 else None
+            ),
+        }
+        return stats
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        texts = [text] if isinstance(text, str) else list(text)
+        if len(texts) == 0:
+            return await self.client.aembed_text(texts, document_type)
+
+        cache_key = {
+            "model_id": self.client.embedding_model_id,  # type: ignore
+            "embedding_size": self.client.embedding_size,  # type: ignore
+            "document_type": (
+                DocumentTypeEnum.QUERY.value if document_type is None else document_type
+            ),
+        }
+        text_hashes = [self.get_text_hash(el) for el in texts]
+
+        try:
+            cached_vectors = await self.embedding_cache.get_many(
+                text_hashes=list(set(text_hashes)), **cache_key
+            )
+        except Exception as exc:
+            self.logger.error("Error while reading the embedding cache: %s", exc)
+            cached_vectors = {}
+
+        missing_texts = {}
+        for text_hash, el in zip(text_hashes, texts):
+            if text_hash not in cached_vectors:
+                missing_texts.setdefault(text_hash, el)
+
+        misses_count = sum(1 for text_hash in text_hashes if text_hash in missing_texts)
+        self.cache_misses += misses_count
+        self.cache_hits += len(texts) - misses_count
+
+        if len(missing_texts) > 0:
+            new_vectors = await self.client.aembed_text(
+                list(missing_texts.values()), document_type
+            )
+            if new_vectors is None:
+                return None
+
+            new_vectors = dict(zip(missing_texts.keys(), new_vectors))
+            try:
+                await self.embedding_cache.set_many(embeddings=new_vectors, **cache_key)
+            except Exception as exc:
+                self.logger.error("Error while writing the embedding cache: %s", exc)
+            cached_vectors.update(new_vectors)
+
+        return np.vstack(
+            [cached_vectors[text_hash] for text_hash in text_hashes]
+        ).astype(np.float32, copy=False)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import os
+from typing import Optional, List, AsyncIterator
+import numpy as np
+from stores.llm.llm_interface import LLMInterface
+
+
+class LLMClientWrapper(LLMInterface):
+    """Delegates every call to the wrapped provider; subclasses override what they decorate."""
+
+    def __init__(self, client: LLMInterface) -> None:
+        super().__init__()
+        self.client = client
+
+    def __getattr__(self, name: str):
+        # Provider attributes (enums, embedding_size, process_text, ...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def get_stats(self) -> dict:
+        if isinstance(self.client, LLMClientWrapper):
+            return self.client.get_stats()
+        return {}
+
+    def set_generation_model(self, model_id: str):
+        return self.client.set_generation_model(model_id)
+
+    def set_embedding_model(self, model_id: str, embedding_size: int):
+        return self.client.set_embedding_model(model_id, embedding_size)
+
+    def generate_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ):
+        return self.client.generate_text(
+            prompt=prompt,
+            chat_history=chat_history,
+            max_output_tokens=max_output_tokens,
+            temprature=temprature,
+        )
+
+    def embed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        return self.client.embed_text(text, document_type)
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ):
+        return await self.client.agenerate_text(
+            prompt=prompt,
+            chat_history=chat_history,
+            max_output_tokens=max_output_tokens,
+            temprature=temprature,
+        )
+
+    async def astream_text(
+        self,
+        prompt: str,
+        chat_history: list = [],
+        max_output_tokens: Optional[int] = None,
+        temprature: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        async for text in self.client.astream_text(
+            prompt=prompt,
+            chat_history=chat_history,
+            max_output_tokens=max_output_tokens,
+            temprature=temprature,
+        ):
+            yield text
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        return await self.client.aembed_text(text, document_type)
+
+    async def aclose(self):
+        return await self.client.aclose()
+
+    def count_tokens(self, text: str) -> int:
+        return self.client.count_tokens(text)
+
+    def construct_prompt(self, prompt: str, role: str):
+        return self.client.construct_prompt(prompt=prompt, role=role)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
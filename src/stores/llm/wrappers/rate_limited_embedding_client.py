@@ -0,0 +1,136 @@
+import os
+import asyncio
+import logging
+from typing import List, Optional
+import numpy as np
+from stores.llm.llm_interface import LLMInterface
+from stores.llm.wrappers.llm_client_wrapper import LLMClientWrapper
+from utils.rate_limit_utils import (
+    RateLimiter,
+    is_retryable_error,
+    get_retry_after,
+    get_backoff_delay,
+)
+
+
+class RateLimitedEmbeddingClient(LLMClientWrapper):
+    """Packs embedding inputs into provider-sized batches and sends them concurrently under a rate limit."""
+
+    def __init__(
+        self,
+        client: LLMInterface,
+        max_batch_size: int = 96,
+        max_batch_tokens: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 60.0,
+    ) -> None:
+        super().__init__(client)
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.requests_count = 0
+        self.retries_count = 0
+        self.logger = logging.getLogger("uvicorn")
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats["embedding_rate_limit"] = {
+            "requests": self.requests_count,
+            "retries": self.retries_count,
+        }
+        return stats
+
+    def pack_batches(self, texts: List[str]) -> List[List[str]]:
+        batches, batch, batch_tokens = [], [], 0
+        for text in texts:
+            text_tokens = self.count_tokens(text)
+            if batch and (
+                len(batch) >= self.max_batch_size
+                or (
+                    self.max_batch_tokens
+                    and batch_tokens + text_tokens > self.max_batch_tokens
+                )
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    async def aembed_text(
+        self, text: str | List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        texts = [text] if isinstance(text, str) else list(text)
+        if len(texts) == 0:
+            return await self.client.aembed_text(texts, document_type)
+
+        batches = self.pack_batches(texts)
+        vectors = await asyncio.gather(
+            *[self.embed_batch(batch, document_type) for batch in batches]
+        )
+
+        if any(batch_vectors is None for batch_vectors in vectors):
+            return None
+
+        return np.vstack(vectors)  # type: ignore
+
+    async def embed_batch(
+        self, texts: List[str], document_type: Optional[str] = None
+    ) -> np.ndarray | None:
+        batch_tokens = sum(self.count_tokens(text) for text in texts)
+
+        async with self.semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.rate_limiter.acquire(tokens=batch_tokens)
+                self.requests_count += 1
+                try:
+                    return await self.client.aembed_text(texts, document_type)
+                except Exception as exc:  # pylint: disable=[W0718]
+                    if attempt >= self.max_retries or not is_retryable_error(exc):
+                        raise
+
+                    delay = get_backoff_delay(
+                        attempt, self.retry_base_delay, self.retry_max_delay
+                    )
+                    retry_after = get_retry_after(exc)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+
+                    self.retries_count += 1
+                    self.logger.warning(
+                        "Embedding batch of %d texts failed (%s), retrying in %.2fs [%d/%d]",
+                        len(texts),
+                        type(exc).__name__,
+                        delay,
+                        attempt + 1,
+                        self.max_retries,
+                    )
+                    await asyncio.sleep(delay)
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from stores.loaders.loader_interface import LoaderInterface
+from stores.loaders.loader_enum import LoaderEnum
+from stores.loaders.loader_provider_factory import LoaderProviderFactory
@@ -0,0 +1,22 @@
+import os
+from enum import Enum
+
+
+class LoaderEnum(Enum):
+    TEXT = "TEXT"
+    PDF = "PDF"
+
+
+class TextLoaderEnums(Enum):
+    ENCODING = "utf-8"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
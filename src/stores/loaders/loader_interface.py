@@ -0,0 +1,25 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Iterator
+from stores.chunkers.chunker_interface import Document
+
+
+class LoaderInterface(ABC):
+    @abstractmethod
+    def get_page_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def lazy_load(self) -> Iterator[Document]:
+        pass
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
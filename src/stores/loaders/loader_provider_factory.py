@@ -0,0 +1,53 @@
+import os
+from typing import Optional
+from models import ProcessingEnum
+from stores.loaders.providers import PDFLoader, TextLoader
+from stores.loaders.loader_interface import LoaderInterface
+from stores.loaders.loader_enum import LoaderEnum
+from utils.config_utils import get_settings, Settings
+
+
+class LoaderProviderFactory:
+    def __init__(self, config: Settings = get_settings()) -> None:
+        self.config = config
+
+    def get_provider(self, file_path: str) -> Optional[str]:
+        file_ext = os.path.splitext(file_path)[-1]
+        if file_ext == ProcessingEnum.TXT.value:
+            return LoaderEnum.TEXT.value
+        if file_ext == ProcessingEnum.PDF.value:
+            return LoaderEnum.PDF.value
+
+        return None
+
+    def create(
+        self,
+        file_path: str,
+        page_start: Optional[int] = None,
+        page_end: Optional[int] = None,
+    ) -> LoaderInterface | None:
+        provider = self.get_provider(file_path)
+
+        if provider == LoaderEnum.TEXT.value:
+            return TextLoader(
+                file_path=file_path, block_size=self.config.PROCESSING_TEXT_BLOCK_SIZE
+            )
+        if provider == LoaderEnum.PDF.value:
+            return PDFLoader(
+                file_path=file_path,
+                page_start=0 if page_start is None else page_start,
+                page_end=page_end,
+            )
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
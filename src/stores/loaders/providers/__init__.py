@@ -0,0 +1,2 @@
+from .pdf_loader import PDFLoader
+from .text_loader import TextLoader
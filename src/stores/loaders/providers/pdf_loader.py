@@ -0,0 +1,50 @@
+import os
+from typing import Iterator, Optional
+import pymupdf
+from stores.loaders.loader_interface import LoaderInterface
+from stores.chunkers.chunker_interface import Document
+
+
+class PDFLoader(LoaderInterface):
+    """Extracts one PyMuPDF page at a time, only the current page's text is held in memory."""
+
+    def __init__(
+        self, file_path: str, page_start: int = 0, page_end: Optional[int] = None
+    ) -> None:
+        self.file_path = file_path
+        self.page_start = page_start
+        self.page_end = page_end
+
+    def get_page_count(self) -> int:
+        with pymupdf.open(self.file_path) as pdf:
+            return pdf.page_count
+
+    def lazy_load(self) -> Iterator[Document]:
+        with pymupdf.open(self.file_path) as pdf:
+            page_end = (
+                pdf.page_count
+                if self.page_end is None
+                else min(self.page_end, pdf.page_count)
+            )
+            for page_number in range(self.page_start, page_end):
+                page = pdf.load_page(page_number)
+                yield Document(
+                    page_content=page.get_text(),
+                    metadata={
+                        "source": self.file_path,
+                        "file_path": self.file_path,
+                        "page": page_number,
+                        "total_pages": pdf.page_count,
+                    },
+                )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+from typing import Iterator
+from stores.loaders.loader_interface import LoaderInterface
+from stores.loaders.loader_enum import TextLoaderEnums
+from stores.chunkers.chunker_interface import Document
+
+
+class TextLoader(LoaderInterface):
+    """Reads a text file in blocks of about `block_size` characters, each block is a page
+    and ends on a line boundary unless a single line is longer than the block."""
+
+    def __init__(
+        self,
+        file_path: str,
+        block_size: int = 1024 * 1024,
+        encoding: str = TextLoaderEnums.ENCODING.value,
+    ) -> None:
+        self.file_path = file_path
+        self.block_size = max(1, block_size)
+        self.encoding = encoding
+
+    def get_page_count(self) -> int:
+        # Estimated from the byte size, exact for single-byte text
+        return max(1, -(-os.path.getsize(self.file_path) // self.block_size))
+
+    def lazy_load(self) -> Iterator[Document]:
+        with open(self.file_path, "r", encoding=self.encoding) as f:
+            page_number, offset = 0, 0
+            while block := f.read(self.block_size):
+                if not block.endswith("\n"):
+                    block += f.readline(self.block_size)
+                yield Document(
+                    page_content=block,
+                    metadata={
+                        "source": self.file_path,
+                        "file_path": self.file_path,
+                        "page": page_number,
+                        "offset": offset,
+                    },
+                )
+                page_number += 1
+                offset += len(block)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
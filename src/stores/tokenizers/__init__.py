@@ -0,0 +1,6 @@
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+from stores.tokenizers.tokenizer_enum import TokenizerEnum, LengthUnitEnum
+from stores.tokenizers.tokenizer_provider_factory import (
+    TokenizerProviderFactory,
+    get_tokenizer,
+)
@@ -0,0 +1,2 @@
+from .character_tokenizer import CharacterTokenizer
+from .tiktoken_tokenizer import TiktokenTokenizer
@@ -0,0 +1,36 @@
+import os
+import math
+from typing import Sequence
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+
+
+class CharacterTokenizer(TokenizerInterface):
+    """`chars_per_token=1` measures characters, larger values give a token estimate."""
+
+    def __init__(self, chars_per_token: int = 1) -> None:
+        self.chars_per_token = chars_per_token
+
+    def count_tokens(self, text: str) -> int:
+        if self.chars_per_token == 1:
+            return len(text)
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def get_prefix_length(self, text: str, max_tokens: int) -> int:
+        return min(len(text), max(0, max_tokens) * self.chars_per_token)
+
+    def get_suffix_length(self, text: str, max_tokens: int) -> int:
+        return min(len(text), max(0, max_tokens) * self.chars_per_token)
+
+    def get_token_offsets(self, text: str) -> Sequence[int]:
+        return range(0, len(text), self.chars_per_token)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
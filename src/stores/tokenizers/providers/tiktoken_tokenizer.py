@@ -0,0 +1,53 @@
+import os
+from typing import Sequence
+import tiktoken
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+
+
+class TiktokenTokenizer(TokenizerInterface):
+    chars_per_token = 4
+
+    def __init__(self, encoding: tiktoken.Encoding) -> None:
+        self.encoding = encoding
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode_ordinary(text))
+
+    def get_prefix_length(self, text: str, max_tokens: int) -> int:
+        if max_tokens <= 0:
+            return 0
+        tokens = self.encoding.encode_ordinary(text)
+        if len(tokens) <= max_tokens:
+            return len(text)
+
+        # Only the kept tokens are decoded, a cut inside a multi-byte character drops it
+        prefix = self.encoding.decode_bytes(tokens[:max_tokens])
+        return len(prefix.decode("utf-8", errors="ignore"))
+
+    def get_suffix_length(self, text: str, max_tokens: int) -> int:
+        if max_tokens <= 0:
+            return 0
+        tokens = self.encoding.encode_ordinary(text)
+        if len(tokens) <= max_tokens:
+            return len(text)
+
+        suffix = self.encoding.decode_bytes(tokens[-max_tokens:])
+        return len(suffix.decode("utf-8", errors="ignore"))
+
+    def get_token_offsets(self, text: str) -> Sequence[int]:
+        # One encoding per text, callers slice it instead of re-encoding what is left
+        _, offsets = self.encoding.decode_with_offsets(
+            self.encoding.encode_ordinary(text)
+        )
+        return offsets
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
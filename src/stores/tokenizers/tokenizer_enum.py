@@ -0,0 +1,28 @@
+import os
+from enum import Enum
+
+
+class TokenizerEnum(Enum):
+    TIKTOKEN = "TIKTOKEN"
+    CHARACTER = "CHARACTER"
+
+
+class TiktokenEnums(Enum):
+    DEFAULT_ENCODING = "cl100k_base"
+    CACHE_DIR_ENV = "TIKTOKEN_CACHE_DIR"
+
+
+class LengthUnitEnum(Enum):
+    CHARACTERS = "CHARACTERS"
+    TOKENS = "TOKENS"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
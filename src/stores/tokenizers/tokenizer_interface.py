@@ -0,0 +1,38 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class TokenizerInterface(ABC):
+    # Rough characters per token, used to size character windows before counting
+    chars_per_token: int = 1
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        pass
+
+    @abstractmethod
+    def get_prefix_length(self, text: str, max_tokens: int) -> int:
+        """Length in characters of the longest prefix of `text` within `max_tokens`."""
+
+    @abstractmethod
+    def get_suffix_length(self, text: str, max_tokens: int) -> int:
+        """Length in characters of the longest suffix of `text` within `max_tokens`."""
+
+    @abstractmethod
+    def get_token_offsets(self, text: str) -> Sequence[int]:
+        """Character offset at which each token of `text` starts."""
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: self.get_prefix_length(text, max_tokens)]
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
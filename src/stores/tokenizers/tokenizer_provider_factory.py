@@ -0,0 +1,74 @@
+import os
+import logging
+from functools import lru_cache
+from typing import Optional
+import tiktoken
+from stores.tokenizers.providers import CharacterTokenizer, TiktokenTokenizer
+from stores.tokenizers.tokenizer_interface import TokenizerInterface
+from stores.tokenizers.tokenizer_enum import TokenizerEnum, TiktokenEnums
+from utils.config_utils import get_settings, Settings
+
+logger = logging.getLogger("uvicorn")
+
+
+@lru_cache(maxsize=None)
+def load_tiktoken_tokenizer(
+    model_id: Optional[str] = None, cache_dir: Optional[str] = None
+) -> TiktokenTokenizer:
+    # Only loaded encodings are cached, a failed load is retried on the next call
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        os.environ.setdefault(TiktokenEnums.CACHE_DIR_ENV.value, cache_dir)
+
+    encoding_name = TiktokenEnums.DEFAULT_ENCODING.value
+    if model_id:
+        try:
+            encoding_name = tiktoken.encoding_name_for_model(model_id)
+        except KeyError:
+            # Non-OpenAI models (e.g. Cohere) are approximated with the default encoding
+            pass
+    return TiktokenTokenizer(encoding=tiktoken.get_encoding(encoding_name))
+
+
+def get_tokenizer(
+    model_id: Optional[str] = None, cache_dir: Optional[str] = None
+) -> TokenizerInterface:
+    """One tokenizer per model, falls back to a ~4 characters/token estimate when the
+    encoding can't be loaded (e.g. offline without a populated cache)."""
+    try:
+        return load_tiktoken_tokenizer(model_id=model_id, cache_dir=cache_dir)
+    except Exception as exc:  # pylint: disable=[W0718]
+        logger.warning(
+            "Can't load a tokenizer for '%s' (%s), estimating tokens from characters",
+            model_id,
+            type(exc).__name__,
+        )
+        return CharacterTokenizer(chars_per_token=4)
+
+
+class TokenizerProviderFactory:
+    def __init__(self, config: Settings = get_settings()) -> None:
+        self.config = config
+
+    def create(
+        self, provider: str, model_id: Optional[str] = None
+    ) -> TokenizerInterface | None:
+        if provider == TokenizerEnum.TIKTOKEN.value:
+            return get_tokenizer(
+                model_id=model_id, cache_dir=self.config.TOKENIZER_CACHE_DIR
+            )
+        if provider == TokenizerEnum.CHARACTER.value:
+            return CharacterTokenizer()
+
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@ from stores.vectordb.vectordb_enum import (
     VectorDBEnum,
     DistanceMethodEnum,
     PgVectorDistanceMethodEnums,
+    PgVectorDistanceOperatorEnums,
     PgVectorIndexTypeEnums,
+    PgVectorInsertMethodEnums,
     PgVectorTableSchemeEnums,
 )
 from stores.vectordb.vectordb_provider_factory import VectorDBProviderFactory
@@ -2,6 +2,8 @@ import os
 import logging
 from typing import List, Optional, Callable
 import json
+import numpy as np
+from pgvector.asyncpg import register_vector
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text as sql_text
 from stores.vectordb import (
@@ -9,6 +11,8 @@ from stores.vectordb import (
     PgVectorTableSchemeEnums,
     PgVectorIndexTypeEnums,
     PgVectorDistanceMethodEnums,
+    PgVectorDistanceOperatorEnums,
+    PgVectorInsertMethodEnums,
     DistanceMethodEnum,
 )
 from models.db_schemas import RetrievedDocument
@@ -23,6 +27,13 @@ class PGVectorProvider(VectorDBInterface):
         default_vector_size: int = 786,
         distance_method: Optional[str] = None,
         index_threshold: int = 100,
+        insert_method: str = PgVectorInsertMethodEnums.COPY.value,
+        index_type: str = PgVectorIndexTypeEnums.HNSW.value,
+        ivfflat_lists: int = 100,
+        hnsw_ef_search: int = 40,
+        ivfflat_probes: int = 1,
+        maintenance_work_mem: str = "256MB",
+        max_parallel_maintenance_workers: int = 2,
     ) -> None:
         super().__init__()
         self.db_client = db_client
@@ -31,13 +42,31 @@ class PGVectorProvider(VectorDBInterface):
         self.logger = logging.getLogger("uvicorn")
         self.default_index_name = lambda x: f"{x}_vector_idx"
         self.index_threshold = index_threshold
-
+        self.insert_method = insert_method
+        self.index_type = index_type
+        self.ivfflat_lists = ivfflat_lists
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivfflat_probes = ivfflat_probes
+        self.maintenance_work_mem = maintenance_work_mem
+        self.max_parallel_maintenance_workers = max_parallel_maintenance_workers
+        self.building_indexes = set()
+        self.vector_codec_key = "pgvector_codec_registered"
+        self.insert_columns = [
+            PgVectorTableSchemeEnums.TEXT.value,
+            PgVectorTableSchemeEnums.VECTOR.value,
+            PgVectorTableSchemeEnums.METADATA.value,
+            PgVectorTableSchemeEnums.CHUNK_ID.value,
+        ]
+
+        distance_operator = PgVectorDistanceOperatorEnums.COSINE.value
         if distance_method == DistanceMethodEnum.COSINE.value:
             distance_method = PgVectorDistanceMethodEnums.COSINE.value
         elif distance_method == DistanceMethodEnum.DOT.value:
             distance_method = PgVectorDistanceMethodEnums.DOT.value
+            distance_operator = PgVectorDistanceOperatorEnums.DOT.value
 
         self.distance_method = distance_method
+        self.distance_operator = distance_operator
 
     async def connect(self):
         async with self.db_client() as session:
@@ -45,9 +74,20 @@ class PGVectorProvider(VectorDBInterface):
                 await session.execute(sql_text("CREATE EXTENSION IF NOT EXISTS vector"))
                 await session.commit()
 
-    def disconnect(self):
+    async def disconnect(self):
         pass
 
+    async def get_driver_connection(self, session: AsyncSession):
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        if not raw_connection.info.get(self.vector_codec_key):
+            await register_vector(driver_connection)
+            raw_connection.info[self.vector_codec_key] = True
+
+        return driver_connection
+
     async def is_index_existed(self, collection_name: str) -> bool:
         index_name = self.default_index_name(collection_name)
         async with self.db_client() as session:
@@ -66,11 +106,40 @@ class PGVectorProvider(VectorDBInterface):
                 )
                 return bool(result.scalar_one_or_none())
 
+    def get_score_expression(self):
+        distance_expr = f"({PgVectorTableSchemeEnums.VECTOR.value} {self.distance_operator} :vector)"
+        if self.distance_operator == PgVectorDistanceOperatorEnums.DOT.value:
+            # `<#>` returns the negative inner product
+            return f"-1 * {distance_expr}"
+        return f"1 - {distance_expr}"
+
+    async def is_index_valid(self, collection_name: str) -> bool:
+        index_name = self.default_index_name(collection_name)
+        async with self.db_client() as session:
+            async with session.begin():
+                sql_stmt = sql_text(
+                    """
+                    SELECT pg_index.indisvalid
+                    FROM pg_index
+                    JOIN pg_class ON pg_class.oid = pg_index.indexrelid
+                    WHERE pg_class.relname = :index_name
+                    """
+                )
+                result = await session.execute(sql_stmt, {"index_name": index_name})
+                return bool(result.scalar_one_or_none())
+
     async def create_vector_index(
-        self, collection_name: str, index_type: str = PgVectorIndexTypeEnums.HNSW.value
+        self, collection_name: str, index_type: Optional[str] = None
     ):
+        index_type = self.index_type if index_type is None else index_type
+        if collection_name in self.building_indexes:
+            self.logger.info(
+                "Vector index for collection %s is already being built", collection_name
+            )
+            return False
+
         is_index_existed = await self.is_index_existed(collection_name)
-        if is_index_existed:
+        if is_index_existed and await self.is_index_valid(collection_name):
             return False
 
         async with self.db_client() as session:
@@ -81,21 +150,117 @@ class PGVectorProvider(VectorDBInterface):
                 result = await session.execute(count_index_sql_stmt)
                 records_count = result.scalar_one()
 
-                if records_count < self.index_threshold:
-                    return False
+        if records_count < self.index_threshold:
+            return False
+
+        index_name = self.default_index_name(collection_name)
+        index_options = (
+            f" WITH (lists = {int(self.ivfflat_lists)})"
+            if index_type == PgVectorIndexTypeEnums.IVFFLAT.value
+            else ""
+        )
+
+        self.building_indexes.add(collection_name)
+        try:
+            async with self.db_client() as session:
+                # CONCURRENTLY can not run inside a transaction block
+                connection = await session.connection(
+                    execution_options={"isolation_level": "AUTOCOMMIT"}
+                )
+                if is_index_existed:
+                    # Left behind by a failed concurrent build
+                    await connection.execute(
+                        sql_text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+                    )
+
+                await connection.execute(
+                    sql_text(
+                        "SELECT set_config('maintenance_work_mem', :maintenance_work_mem, false), "
+                        "set_config('max_parallel_maintenance_workers', :maintenance_workers, false)"
+                    ),
+                    {
+                        "maintenance_work_mem": self.maintenance_work_mem,
+                        "maintenance_workers": str(
+                            self.max_parallel_maintenance_workers
+                        ),
+                    },
+                )
 
                 self.logger.info(
                     "START: Creating vector index for collection: %s", collection_name
                 )
-                index_name = self.default_index_name(collection_name)
-                create_index_sql_stmt = sql_text(
-                    f"CREATE INDEX {index_name} ON {collection_name} "
-                    f"USING {index_type} ({PgVectorTableSchemeEnums.VECTOR.value} {self.distance_method})"
-                )
-                await session.execute(create_index_sql_stmt)
+                try:
+                    await connection.execute(
+                        sql_text(
+                            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {collection_name} "
+                            f"USING {index_type} ({PgVectorTableSchemeEnums.VECTOR.value} {self.distance_method})"
+                            f"{index_options}"
+                        )
+                    )
+                finally:
+                    await connection.execute(sql_text("RESET maintenance_work_mem"))
+                    await connection.execute(
+                        sql_text("RESET max_parallel_maintenance_workers")
+                    )
                 self.logger.info(
                     "END: Created vector index for collection: %s", collection_name
                 )
+        except Exception as exc:
+            self.logger.error(
+                "Error while creating vector index for collection %s: %s",
+                collection_name,
+                exc,
+            )
+            return False
+        finally:
+            self.building_indexes.discard(collection_name)
+
+        return True
+
+    async def get_vector_index_progress(self, collection_name: str):
+        index_name = self.default_index_name(collection_name)
+        is_index_existed = await self.is_index_existed(collection_name)
+        is_index_valid = is_index_existed and await self.is_index_valid(collection_name)
+
+        async with self.db_client() as session:
+            async with session.begin():
+                sql_stmt = sql_text(
+                    """
+                    SELECT progress.phase, progress.blocks_total, progress.blocks_done,
+                           progress.tuples_total, progress.tuples_done
+                    FROM pg_stat_progress_create_index AS progress
+                    JOIN pg_class ON pg_class.oid = progress.relid
+                    WHERE pg_class.relname = :collection_name
+                    """
+                )
+                result = await session.execute(
+                    sql_stmt, {"collection_name": collection_name}
+                )
+                record = result.fetchone()
+
+        progress = None
+        if record is not None:
+            progress = {
+                "phase": record.phase,
+                "blocks_total": record.blocks_total,
+                "blocks_done": record.blocks_done,
+                "tuples_total": record.tuples_total,
+                "tuples_done": record.tuples_done,
+                "blocks_done_percentage": (
+                    round(100 * record.blocks_done / record.blocks_total, 2)
+                    if record.blocks_total
+                    else None
+                ),
+            }
+
+        return {
+            "index_name": index_name,
+            "is_index_existed": is_index_existed,
+            "is_index_valid": is_index_valid,
+            "is_building": record is not None
+            or collection_name in self.building_indexes,
+            "progress": progress,
+        }
 
     async def delete_vector_index(self, collection_name: str):
         index_name = self.default_index_name(collection_name)
@@ -195,6 +360,13 @@ class PGVectorProvider(VectorDBInterface):
                         ")"
                     )
                     await session.execute(create_sql)
+                    # Incremental processing deletes the vectors of changed chunks by chunk_id
+                    await session.execute(
+                        sql_text(
+                            f"CREATE INDEX {collection_name}_chunk_id_idx "
+                            f"ON {collection_name} ({PgVectorTableSchemeEnums.CHUNK_ID.value})"
+                        )
+                    )
                     await session.commit()
             return True
         return False
@@ -203,7 +375,7 @@ class PGVectorProvider(VectorDBInterface):
         self,
         collection_name: str,
         text: str,
-        vector: List,
+        vector: np.ndarray,
         record_id: int,
         metadata: dict | None = None,
     ):
@@ -222,6 +394,7 @@ class PGVectorProvider(VectorDBInterface):
 
         async with self.db_client() as session:
             async with session.begin():
+                _ = await self.get_driver_connection(session)
                 insert_sql = sql_text(
                     f"INSERT INTO {collection_name}"
                     f"({PgVectorTableSchemeEnums.TEXT.value},"
@@ -239,24 +412,20 @@ class PGVectorProvider(VectorDBInterface):
                     insert_sql,
                     {
                         "text": text,
-                        "vector": "["
-                        + ",".join([str(value) for value in vector])
-                        + "]",
+                        "vector": np.asarray(vector, dtype=np.float32),
                         "metadata": metadata_json,
                         "chunk_id": record_id,
                     },
                 )
                 await session.commit()
 
-        await self.create_vector_index(collection_name)
-
         return True
 
     async def insert_many(
         self,
         collection_name: str,
         texts: List[str],
-        vectors: List[List],
+        vectors: np.ndarray,
         record_ids: List[str],
         metadatas: List[dict] | None = None,
         batch_size: int = 50,
@@ -273,50 +442,109 @@ class PGVectorProvider(VectorDBInterface):
             return False
 
         if not metadatas or len(metadatas) == 0:
-            metadatas = [None] * len(texts)
+            metadatas = [None] * len(texts)  # type: ignore
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        record_batches = self.build_record_batches(
+            texts, vectors, metadatas, record_ids, batch_size  # type: ignore
+        )
 
         async with self.db_client() as session:
             async with session.begin():
-                for idx in range(0, len(texts), batch_size):
-                    batch_end = idx + batch_size
-                    batch_text = texts[idx:batch_end]
-                    batch_vectors = vectors[idx:batch_end]
-                    batch_metadata = metadatas[idx:batch_end]
-                    batch_record_ids = record_ids[idx:batch_end]
-
-                    for _text, _vector, _metadata, _record_id in zip(
-                        batch_text, batch_vectors, batch_metadata, batch_record_ids
-                    ):
-                        values = []
-                        metadata_json = (
-                            json.dumps(_metadata, ensure_ascii=False)
-                            if _metadata is not None
-                            else "{}"
-                        )
-                        values.append(
-                            {
-                                "text": _text,
-                                "vector": "["
-                                + ",".join([str(value) for value in _vector])
-                                + "]",
-                                "metadata": metadata_json,
-                                "chunk_id": _record_id,
-                            },
-                        )
-                        sql_stmt = sql_text(
-                            f"INSERT INTO {collection_name}"
-                            f"({PgVectorTableSchemeEnums.TEXT.value},"
-                            f"{PgVectorTableSchemeEnums.VECTOR.value},"
-                            f"{PgVectorTableSchemeEnums.METADATA.value},"
-                            f"{PgVectorTableSchemeEnums.CHUNK_ID.value}) "
-                            f"VALUES (:text, :vector, :metadata, :chunk_id)"
+                driver_connection = await self.get_driver_connection(session)
+                if self.insert_method == PgVectorInsertMethodEnums.COPY.value:
+                    async with driver_connection.transaction():
+                        for batch_records in record_batches:
+                            await driver_connection.copy_records_to_table(
+                                collection_name,
+                                records=batch_records,
+                                columns=self.insert_columns,
+                            )
+                else:
+                    for batch_records in record_batches:
+                        await self.execute_many_records(
+                            session, collection_name, batch_records
                         )
-                        await session.execute(sql_stmt, values)
 
-        await self.create_vector_index(collection_name)
         return True
 
-    async def search_by_vector(self, collection_name: str, vector: list, limit: int):
+    def build_record_batches(
+        self,
+        texts: List[str],
+        vectors: np.ndarray,
+        metadatas: List[dict | None],
+        record_ids: List[str],
+        batch_size: int,
+    ):
+        for idx in range(0, len(texts), batch_size):
+            batch_end = idx + batch_size
+            yield [
+                (
+                    _text,
+                    _vector,
+                    (
+                        json.dumps(_metadata, ensure_ascii=False)
+                        if _metadata is not None
+                        else "{}"
+                    ),
+                    _record_id,
+                )
+                for _text, _vector, _metadata, _record_id in zip(
+                    texts[idx:batch_end],
+                    vectors[idx:batch_end],
+                    metadatas[idx:batch_end],
+                    record_ids[idx:batch_end],
+                )
+            ]
+
+    async def execute_many_records(
+        self, session: AsyncSession, collection_name: str, records: List[tuple]
+    ):
+        sql_stmt = sql_text(
+            f"INSERT INTO {collection_name}"
+            f"({PgVectorTableSchemeEnums.TEXT.value},"
+            f"{PgVectorTableSchemeEnums.VECTOR.value},"
+            f"{PgVectorTableSchemeEnums.METADATA.value},"
+            f"{PgVectorTableSchemeEnums.CHUNK_ID.value}) "
+            f"VALUES (:text, :vector, :metadata, :chunk_id)"
+        )
+        await session.execute(
+            sql_stmt,
+            [
+                {
+                    "text": _text,
+                    "vector": _vector,
+                    "metadata": _metadata,
+                    "chunk_id": _record_id,
+                }
+                for _text, _vector, _metadata, _record_id in records
+            ],
+        )
+
+    async def delete_many(self, collection_name: str, record_ids: List[int]) -> bool:
+        if not await self.is_collection_existed(collection_name):
+            return True
+
+        async with self.db_client() as session:
+            async with session.begin():
+                delete_sql = sql_text(
+                    f"DELETE FROM {collection_name} "
+                    f"WHERE {PgVectorTableSchemeEnums.CHUNK_ID.value} = ANY(:record_ids)"
+                )
+                await session.execute(delete_sql, {"record_ids": list(record_ids)})
+            await session.commit()
+
+        return True
+
+    async def search_by_vector(
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ):
         is_collection_existed = await self.is_collection_existed(collection_name)
         if not is_collection_existed:
             self.logger.error(
@@ -325,21 +553,38 @@ class PGVectorProvider(VectorDBInterface):
             )
             return False
 
-        vector_str = "[" + ",".join([str(value) for value in vector]) + "]"
+        ef_search = self.hnsw_ef_search if ef_search is None else ef_search
+        probes = self.ivfflat_probes if probes is None else probes
 
         async with self.db_client() as session:
             async with session.begin():
+                _ = await self.get_driver_connection(session)
+                # HNSW never returns more than `ef_search` candidates
+                await session.execute(
+                    sql_text(
+                        "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                        "set_config('ivfflat.probes', :probes, true)"
+                    ),
+                    {"ef_search": str(max(ef_search, limit)), "probes": str(probes)},
+                )
+                # Order by the raw distance operator so the vector index can serve the scan
                 sql_stmt = sql_text(
                     f"SELECT {PgVectorTableSchemeEnums.TEXT.value} as text, "
-                    f"1 - ({PgVectorTableSchemeEnums.VECTOR.value} <=> :vector) as score "
+                    f"{PgVectorTableSchemeEnums.CHUNK_ID.value} as chunk_id, "
+                    f"{self.get_score_expression()} as score "
                     f"FROM {collection_name} "
-                    "ORDER BY score DESC "
-                    f"LIMIT {limit}"
+                    f"ORDER BY {PgVectorTableSchemeEnums.VECTOR.value} {self.distance_operator} :vector "
+                    "LIMIT :limit"
+                )
+                result = await session.execute(
+                    sql_stmt,
+                    {"vector": np.asarray(vector, dtype=np.float32), "limit": limit},
                 )
-                result = await session.execute(sql_stmt, {"vector": vector_str})
                 records = result.fetchall()
                 return [
-                    RetrievedDocument(text=record.text, score=record.score)
+                    RetrievedDocument(
+                        text=record.text, score=record.score, chunk_id=record.chunk_id
+                    )
                     for record in records
                 ]
 
@@ -1,6 +1,7 @@
 import os
 from typing import List, Optional
 import logging
+import numpy as np
 from qdrant_client import models, QdrantClient
 from stores.vectordb import VectorDBInterface
 from stores.vectordb import DistanceMethodEnum
@@ -14,12 +15,14 @@ class QDrantDBProvider(VectorDBInterface):
         default_vector_size: int = 786,
         distance_method: Optional[str] = None,
         index_threshold: int = 100,
+        hnsw_ef_search: Optional[int] = None,
     ) -> None:
         self.db_client = db_client
         self.distance_method = None
         self.client = None
         self.default_vector_size = default_vector_size
         self.index_threshold = index_threshold
+        self.hnsw_ef_search = hnsw_ef_search
 
         if distance_method == DistanceMethodEnum.COSINE.value:
             self.distance_method = models.Distance.COSINE
@@ -66,11 +69,30 @@ class QDrantDBProvider(VectorDBInterface):
             return True
         return False
 
+    async def create_vector_index(
+        self, collection_name: str, index_type: Optional[str] = None
+    ):
+        # QDrant builds and maintains its HNSW index on its own
+        return False
+
+    async def get_vector_index_progress(self, collection_name: str) -> dict | None:
+        if not await self.is_collection_existed(collection_name=collection_name):
+            return None
+
+        collection_info = self.client.get_collection(  # type: ignore
+            collection_name=collection_name
+        )
+        return {
+            "status": collection_info.status,
+            "points_count": collection_info.points_count,
+            "indexed_vectors_count": collection_info.indexed_vectors_count,
+        }
+
     async def insert_one(
         self,
         collection_name: str,
         text: str,
-        vector: list,
+        vector: np.ndarray,
         record_id: int,
         metadata: dict | None = None,
     ):
@@ -87,7 +109,7 @@ class QDrantDBProvider(VectorDBInterface):
                 records=[
                     models.Record(  # type: ignore
                         id=[record_id],  # type: ignore
-                        vector=vector,
+                        vector=np.asarray(vector, dtype=np.float32).tolist(),
                         payload={"text": text, "metadata": metadata},
                     )
                 ],
@@ -101,7 +123,7 @@ class QDrantDBProvider(VectorDBInterface):
         self,
         collection_name: str,
         texts: models.List[str],
-        vectors: models.List[list],
+        vectors: np.ndarray,
         record_ids: models.List[int],
         metadatas: models.List[dict] | None = None,
         batch_size: int = 50,
@@ -111,43 +133,67 @@ class QDrantDBProvider(VectorDBInterface):
         if record_ids is None:
             record_ids = list(range(0, len(texts)))
 
-        for i in range(0, len(texts), batch_size):
-            batch_end = i + batch_size
-            batch_text = texts[i:batch_end]
-            batch_vector = vectors[i:batch_end]
-            batch_record_ids = record_ids[i:batch_end]
-            batch_metadata = metadatas[i:batch_end]  # type: ignore
-            batch_records = [
-                models.Record(
-                    id=batch_record_ids[i],
-                    vector=batch_vector[i],
-                    payload={"text": batch_text[i], "metadata": batch_metadata[i]},
-                )
-                for i in range(len(batch_text))
-            ]
-
-            try:
-                _ = self.client.upload_records(  # type: ignore
-                    collection_name=collection_name, records=batch_records
-                )
-            except Exception as exc:
-                self.logger.error("Error while insertings batch: %s", exc)
-                return False
+        try:
+            self.client.upload_collection(  # type: ignore
+                collection_name=collection_name,
+                vectors=np.asarray(vectors, dtype=np.float32),
+                payload=[
+                    {"text": _text, "metadata": _metadata}
+                    for _text, _metadata in zip(texts, metadatas)  # type: ignore
+                ],
+                ids=record_ids,
+                batch_size=batch_size,
+            )
+        except Exception as exc:
+            self.logger.error("Error while insertings batch: %s", exc)
+            return False
+
+        return True
+
+    async def delete_many(self, collection_name: str, record_ids: List[int]) -> bool:
+        if not await self.is_collection_existed(collection_name=collection_name):
+            return True
+
+        try:
+            self.client.delete(  # type: ignore
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=record_ids),  # type: ignore
+            )
+        except Exception as exc:  # pylint: disable=[W0718]
+            self.logger.error("Error while deleting records: %s", exc)
+            return False
 
         return True
 
     async def search_by_vector(
-        self, collection_name: str, vector: list, limit: int = 5
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int = 5,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> List[RetrievedDocument] | None:
+        ef_search = self.hnsw_ef_search if ef_search is None else ef_search
         results = self.client.search(  # type: ignore
-            collection_name=collection_name, query_vector=vector, limit=limit
+            collection_name=collection_name,
+            query_vector=vector,
+            limit=limit,
+            search_params=(
+                models.SearchParams(hnsw_ef=max(ef_search, limit))
+                if ef_search is not None
+                else None
+            ),
         )
 
         if not results or len(results) == 0:
             return None
 
         return [
-            RetrievedDocument(score=result.score, text=result.payload["text"])  # type: ignore
+            RetrievedDocument(
+                score=result.score,
+                text=result.payload["text"],  # type: ignore
+                chunk_id=result.id if isinstance(result.id, int) else None,
+            )
             for result in results
         ]
 
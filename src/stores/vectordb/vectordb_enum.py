@@ -23,7 +23,12 @@ class PgVectorTableSchemeEnums(Enum):
 
 class PgVectorDistanceMethodEnums(Enum):
     COSINE = "vector_cosine_ops"
-    DOT = "vector_12_ops"
+    DOT = "vector_ip_ops"
+
+
+class PgVectorDistanceOperatorEnums(Enum):
+    COSINE = "<=>"
+    DOT = "<#>"
 
 
 class PgVectorIndexTypeEnums(Enum):
@@ -31,6 +36,11 @@ class PgVectorIndexTypeEnums(Enum):
     IVFFLAT = "ivfflat"
 
 
+class PgVectorInsertMethodEnums(Enum):
+    COPY = "copy"
+    EXECUTEMANY = "executemany"
+
+
 def main():
     """Entry Point for the Program."""
     print(
@@ -1,6 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import numpy as np
 from models.db_schemas import RetrievedDocument
 
 
@@ -35,12 +36,22 @@ class VectorDBInterface(ABC):
     ):
         pass
 
+    @abstractmethod
+    async def create_vector_index(
+        self, collection_name: str, index_type: Optional[str] = None
+    ):
+        pass
+
+    @abstractmethod
+    async def get_vector_index_progress(self, collection_name: str) -> dict | None:
+        pass
+
     @abstractmethod
     async def insert_one(
         self,
         collection_name: str,
         text: str,
-        vector: list,
+        vector: np.ndarray,
         record_id: int,
         metadata: dict | None = None,
     ):
@@ -51,16 +62,25 @@ class VectorDBInterface(ABC):
         self,
         collection_name: str,
         texts: List[str],
-        vectors: List[list],
+        vectors: np.ndarray,
         metadatas: Optional[List[dict]] = None,
         record_ids: Optional[List[int]] = None,
         batch_size: int = 50,
     ):
         pass
 
+    @abstractmethod
+    async def delete_many(self, collection_name: str, record_ids: List[int]) -> bool:
+        pass
+
     @abstractmethod
     async def search_by_vector(
-        self, collection_name: str, vector: list, limit: int
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> List[RetrievedDocument]:
         pass
 
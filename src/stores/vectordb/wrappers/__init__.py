@@ -0,0 +1 @@
+from .versioned_vectordb_client import VersionedVectorDBClient
@@ -0,0 +1,154 @@
+import os
+import logging
+from typing import List, Optional
+import numpy as np
+from stores.vectordb.vectordb_interface import VectorDBInterface
+from stores.cache.cache_interface import CacheInterface
+from models.db_schemas import RetrievedDocument
+
+
+class VersionedVectorDBClient(VectorDBInterface):
+    """Bumps a per-collection version on every write so cached reads of older versions go unused."""
+
+    def __init__(self, client: VectorDBInterface, cache: CacheInterface) -> None:
+        self.client = client
+        self.cache = cache
+        self.logger = logging.getLogger("uvicorn")
+
+    def __getattr__(self, name: str):
+        # Provider attributes (default_vector_size, distance_method, ...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def bump_version(self, collection_name: str):
+        try:
+            await self.cache.bump_version(collection_name)
+        except Exception as exc:  # pylint: disable=[W0718]
+            self.logger.error(
+                "Error while bumping the version of collection %s: %s",
+                collection_name,
+                exc,
+            )
+
+    async def get_version(self, collection_name: str) -> int:
+        return await self.cache.get_version(collection_name)
+
+    async def connect(self):
+        return await self.client.connect()
+
+    async def disconnect(self):
+        return await self.client.disconnect()
+
+    async def is_collection_existed(self, collection_name: str) -> bool:
+        return await self.client.is_collection_existed(collection_name)
+
+    async def list_all_collections(self) -> List:
+        return await self.client.list_all_collections()
+
+    async def get_collection_info(self, collection_name: str) -> dict:
+        return await self.client.get_collection_info(collection_name)
+
+    async def delete_collection(self, collection_name: str):
+        try:
+            return await self.client.delete_collection(collection_name)
+        finally:
+            await self.bump_version(collection_name)
+
+    async def create_collection(
+        self, collection_name: str, embedding_size: int, do_reset: bool = False
+    ):
+        try:
+            return await self.client.create_collection(
+                collection_name=collection_name,
+                embedding_size=embedding_size,
+                do_reset=do_reset,
+            )
+        finally:
+            if do_reset:
+                await self.bump_version(collection_name)
+
+    async def create_vector_index(
+        self, collection_name: str, index_type: Optional[str] = None
+    ):
+        return await self.client.create_vector_index(
+            collection_name=collection_name, index_type=index_type
+        )
+
+    async def get_vector_index_progress(self, collection_name: str) -> dict | None:
+        return await self.client.get_vector_index_progress(collection_name)
+
+    async def insert_one(
+        self,
+        collection_name: str,
+        text: str,
+        vector: np.ndarray,
+        record_id: int,
+        metadata: dict | None = None,
+    ):
+        try:
+            return await self.client.insert_one(
+                collection_name=collection_name,
+                text=text,
+                vector=vector,
+                record_id=record_id,
+                metadata=metadata,
+            )
+        finally:
+            await self.bump_version(collection_name)
+
+    async def insert_many(
+        self,
+        collection_name: str,
+        texts: List[str],
+        vectors: np.ndarray,
+        metadatas: Optional[List[dict]] = None,
+        record_ids: Optional[List[int]] = None,
+        batch_size: int = 50,
+    ):
+        try:
+            return await self.client.insert_many(
+                collection_name=collection_name,
+                texts=texts,
+                vectors=vectors,
+                metadatas=metadatas,
+                record_ids=record_ids,
+                batch_size=batch_size,
+            )
+        finally:
+            await self.bump_version(collection_name)
+
+    async def delete_many(self, collection_name: str, record_ids: List[int]) -> bool:
+        try:
+            return await self.client.delete_many(
+                collection_name=collection_name, record_ids=record_ids
+            )
+        finally:
+            await self.bump_version(collection_name)
+
+    async def search_by_vector(
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> List[RetrievedDocument]:
+        return await self.client.search_by_vector(
+            collection_name=collection_name,
+            vector=vector,
+            limit=limit,
+            ef_search=ef_search,
+            probes=probes,
+        )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
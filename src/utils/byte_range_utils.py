@@ -0,0 +1,55 @@
+import os
+import re
+from typing import List, Optional, Tuple
+
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+def parse_content_range(
+    content_range: str, file_size: int
+) -> Optional[Tuple[int, int]]:
+    # `bytes <first>-<last>/<size>` with an inclusive last byte, returned as [start, end)
+    match = CONTENT_RANGE_PATTERN.match(content_range.strip())
+    if match is None:
+        return None
+
+    first_byte, last_byte, total_size = (int(group) for group in match.groups())
+    if total_size != file_size or first_byte > last_byte or last_byte >= file_size:
+        return None
+
+    return first_byte, last_byte + 1
+
+
+def merge_byte_ranges(byte_ranges: List[List[int]]) -> List[List[int]]:
+    merged_ranges: List[List[int]] = []
+    for start, end in sorted(byte_ranges):
+        if merged_ranges and start <= merged_ranges[-1][1]:
+            merged_ranges[-1][1] = max(merged_ranges[-1][1], end)
+        else:
+            merged_ranges.append([start, end])
+    return merged_ranges
+
+
+def get_missing_byte_ranges(
+    byte_ranges: List[List[int]], file_size: int
+) -> List[List[int]]:
+    missing_ranges = []
+    position = 0
+    for start, end in merge_byte_ranges(byte_ranges):
+        if start > position:
+            missing_ranges.append([position, start])
+        position = max(position, end)
+    if position < file_size:
+        missing_ranges.append([position, file_size])
+    return missing_ranges
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
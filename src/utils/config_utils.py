@@ -32,6 +32,40 @@ class Settings(BaseSettings):
     FILE_ALLOWED_TYPES: List[str] = Field(...)
     FILE_MAX_SIZE: int = Field(...)
     FILE_DEFAULT_CHUNK_SIZE: int = Field(...)
+    FILE_DEDUP_POLICY_LITERAL: Optional[List[str]] = Field(None)
+    FILE_DEDUP_POLICY: str = "LINK"
+    FILE_RESUMABLE_MAX_SIZE: int = 2048
+    FILE_RESUMABLE_PART_SIZE: int = 8388608
+    FILE_BULK_MAX_SIZE: int = 1024
+    FILE_BULK_MAX_FILES: int = 10000
+    FILE_BULK_MAX_CONCURRENCY: int = 8
+
+    CHUNKING_STRATEGY_LITERAL: Optional[List[str]] = Field(None)
+    CHUNKING_STRATEGY: str = "LINE"
+    CHUNKING_SENTENCE_LANGUAGE: str = "english"
+    CHUNKING_LENGTH_UNIT: str = "CHARACTERS"
+    TOKENIZER_CACHE_DIR: Optional[str] = None
+
+    PROCESSING_MAX_WORKERS: int = 4
+    PROCESSING_MAX_CONCURRENT_FILES: int = 4
+    PROCESSING_PDF_PAGES_PER_TASK: int = 50
+    PROCESSING_TEXT_BLOCK_SIZE: int = 1048576
+
+    INGEST_QUEUE_SIZE: int = 8
+    INGEST_STORE_CONCURRENCY: int = 2
+    INGEST_INSERT_CONCURRENCY: int = 2
+
+    JOBS_MAX_CONCURRENT: int = 2
+    JOBS_MAX_FINISHED: int = 1000
+    JOBS_BACKEND_LITERAL: Optional[List[str]] = Field(None)
+    JOBS_BACKEND: str = "MEMORY"
+
+    WORKER_CONCURRENCY: int = 1
+    WORKER_POLL_INTERVAL_SECONDS: float = 1.0
+    WORKER_HEARTBEAT_SECONDS: float = 10.0
+    WORKER_LEASE_SECONDS: float = 300.0
+    WORKER_MAX_ATTEMPTS: int = 3
+    WORKER_INDEX_CHUNKS_PER_JOB: int = 5000
 
     GENERATION_MODEL_ID_LITERAL: Optional[List[str]] = Field(None)
     GENERATION_BACKEND: str
@@ -45,11 +79,61 @@ class Settings(BaseSettings):
     DEFAULT_GENERATION_MAX_TOKENS: int
     DEFAULT_GENERATION_TEMERATURE: float
 
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_HTTP_TIMEOUT: float = 60.0
+    LLM_HTTP_CONNECT_TIMEOUT: float = 5.0
+
+    EMBEDDING_CACHE_ENABLED: bool = False
+    EMBEDDING_CACHE_BACKEND: str = "POSTGRES"
+    EMBEDDING_CACHE_PATH: str = "embedding_cache"
+
+    QUERY_EMBEDDING_BATCH_ENABLED: bool = False
+    QUERY_EMBEDDING_BATCH_MAX_SIZE: int = 32
+    QUERY_EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+    EMBEDDING_MAX_RETRIES: int = 5
+    EMBEDDING_RETRY_BASE_DELAY: float = 1.0
+    EMBEDDING_RETRY_MAX_DELAY: float = 60.0
+    OPENAI_EMBEDDING_MAX_BATCH_SIZE: int = 2048
+    OPENAI_EMBEDDING_MAX_BATCH_TOKENS: Optional[int] = 300000
+    OPENAI_EMBEDDING_REQUESTS_PER_MINUTE: Optional[int] = 3000
+    OPENAI_EMBEDDING_TOKENS_PER_MINUTE: Optional[int] = 1000000
+    COHERE_EMBEDDING_MAX_BATCH_SIZE: int = 96
+    COHERE_EMBEDDING_MAX_BATCH_TOKENS: Optional[int] = None
+    COHERE_EMBEDDING_REQUESTS_PER_MINUTE: Optional[int] = 2000
+    COHERE_EMBEDDING_TOKENS_PER_MINUTE: Optional[int] = None
+
+    ANSWER_CACHE_ENABLED: bool = False
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    ANSWER_CACHE_MAX_ENTRIES_PER_PROJECT: int = 256
+    ANSWER_CACHE_TTL_SECONDS: Optional[float] = 3600
+
+    SEARCH_CACHE_ENABLED: bool = False
+    SEARCH_CACHE_BACKEND_LITERAL: Optional[List[str]] = Field(None)
+    SEARCH_CACHE_BACKEND: str = "MEMORY"
+    SEARCH_CACHE_MAX_ENTRIES: int = 10000
+    SEARCH_CACHE_TTL_SECONDS: Optional[float] = 600
+    SEARCH_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    SINGLE_FLIGHT_ENABLED: bool = False
+
     VECTOR_DB_BACKEND_LITERAL: Optional[List[str]] = Field(None)
     VECTOR_DB_BACKEND: str
     VECTOR_DB_PATH: str
     VECTOR_DB_DISTANCE_METHOD: str
     VECTOR_DB_PGVEC_INDEX_THRESHOLD: int = 100
+    VECTOR_DB_PGVEC_INSERT_METHOD_LITERAL: Optional[List[str]] = Field(None)
+    VECTOR_DB_PGVEC_INSERT_METHOD: str = "copy"
+    VECTOR_DB_PGVEC_INDEX_TYPE: str = "hnsw"
+    VECTOR_DB_PGVEC_IVFFLAT_LISTS: int = 100
+    VECTOR_DB_PGVEC_HNSW_EF_SEARCH: int = 40
+    VECTOR_DB_PGVEC_IVFFLAT_PROBES: int = 1
+    VECTOR_DB_PGVEC_MAINTENANCE_WORK_MEM: str = "256MB"
+    VECTOR_DB_PGVEC_MAX_PARALLEL_MAINTENANCE_WORKERS: int = 2
+    VECTOR_DB_INDEXING_PAGE_SIZE: int = 100
 
     DEFAULT_LANG: str
     PRIMARY_LANGUAGE: str
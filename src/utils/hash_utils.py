@@ -0,0 +1,42 @@
+import os
+import json
+import hashlib
+from typing import Optional
+
+
+def compute_file_hash(file_path: str, block_size: int = 1024 * 1024) -> Optional[str]:
+    if not os.path.exists(file_path):
+        return None
+
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while block := f.read(block_size):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def compute_chunk_hash(text: str, metadata: Optional[dict] = None) -> str:
+    # The metadata (pages, offsets) is part of what gets stored, a moved chunk is a new one
+    chunk_hash = hashlib.sha256(text.encode("utf-8"))
+    chunk_hash.update(
+        json.dumps(metadata or {}, sort_keys=True, default=str).encode("utf-8")
+    )
+    return chunk_hash.hexdigest()
+
+
+def compute_processing_hash(file_hash: str, processing_params: dict) -> str:
+    # Same file processed with other chunking parameters gives other chunks
+    return hashlib.sha256(
+        f"{file_hash}:{json.dumps(processing_params, sort_keys=True)}".encode("utf-8")
+    ).hexdigest()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
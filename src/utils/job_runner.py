@@ -0,0 +1,172 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Tuple
+from models.enums.job_enum import JobStatusEnum
+
+logger = logging.getLogger("uvicorn")
+
+FINISHED_JOB_STATUSES = {
+    JobStatusEnum.SUCCEEDED.value,
+    JobStatusEnum.FAILED.value,
+    JobStatusEnum.CANCELLED.value,
+}
+
+
+@dataclass
+class Job:
+    job_type: str
+    project_id: int
+    unit: str = "items"
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JobStatusEnum.QUEUED.value
+    processed: int = 0
+    total: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+    result: Optional[dict] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATUSES
+
+    def update_progress(
+        self,
+        processed: Optional[int] = None,
+        total: Optional[int] = None,
+        advance: int = 0,
+    ):
+        if total is not None:
+            self.total = total
+        if processed is not None:
+            self.processed = processed
+        self.processed += advance
+
+    def add_error(self, error: str):
+        self.errors.append(error)
+
+    def to_dict(self) -> dict:
+        elapsed_seconds = None
+        if self.started_at is not None:
+            elapsed_seconds = (self.finished_at or time.time()) - self.started_at
+
+        return {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "project_id": self.project_id,
+            "status": self.status,
+            "progress": {
+                "unit": self.unit,
+                "processed": self.processed,
+                "total": self.total,
+                "percent": (
+                    round(100 * self.processed / self.total, 2) if self.total else None
+                ),
+            },
+            "throughput": {
+                "elapsed_seconds": (
+                    round(elapsed_seconds, 3) if elapsed_seconds is not None else None
+                ),
+                f"{self.unit}_per_second": (
+                    round(self.processed / elapsed_seconds, 2)
+                    if elapsed_seconds
+                    else None
+                ),
+            },
+            "errors": self.errors,
+            "result": self.result,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobRunner:
+    """Runs submitted jobs as event loop tasks, at most `max_concurrent_jobs` at a time;
+    the latest `max_finished_jobs` finished jobs are kept for status queries."""
+
+    def __init__(
+        self, max_concurrent_jobs: int = 2, max_finished_jobs: int = 1000
+    ) -> None:
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrent_jobs))
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def get_stats(self) -> dict:
+        stats = {status.value: 0 for status in JobStatusEnum}
+        for job in self.jobs.values():
+            stats[job.status] += 1
+        return stats
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def submit(
+        self,
+        job_type: str,
+        project_id: int,
+        fn: Callable[[Job], Awaitable[Tuple[bool, dict]]],
+        unit: str = "items",
+    ) -> Job:
+        job = Job(job_type=job_type, project_id=project_id, unit=unit)
+        self.jobs[job.job_id] = job
+        job.task = asyncio.create_task(self.run(job, fn))
+        return job
+
+    async def run(self, job: Job, fn: Callable[[Job], Awaitable[Tuple[bool, dict]]]):
+        try:
+            async with self.semaphore:
+                job.status = JobStatusEnum.RUNNING.value
+                job.started_at = time.time()
+                is_success, job.result = await fn(job)
+                job.status = (
+                    JobStatusEnum.SUCCEEDED.value
+                    if is_success
+                    else JobStatusEnum.FAILED.value
+                )
+        except asyncio.CancelledError:
+            job.status = JobStatusEnum.CANCELLED.value
+        except Exception as exc:  # pylint: disable=[W0718]
+            logger.error("Job %s failed: %s", job.job_id, exc)
+            job.add_error(f"{type(exc).__name__}: {exc}")
+            job.status = JobStatusEnum.FAILED.value
+        finally:
+            job.finished_at = time.time()
+            self.evict_finished_jobs()
+
+    def evict_finished_jobs(self):
+        finished_jobs = [job_id for job_id, job in self.jobs.items() if job.is_finished]
+        for job_id in finished_jobs[
+            : max(0, len(finished_jobs) - self.max_finished_jobs)
+        ]:
+            del self.jobs[job_id]
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.is_finished or job.task is None:
+            return False
+        return job.task.cancel()
+
+    async def shutdown(self):
+        tasks = [job.task for job in self.jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional
+
+STAGE_DONE = None
+
+
+async def run_stage(
+    worker: Callable[[Any], Awaitable[Any]],
+    input_queue: asyncio.Queue,
+    output_queue: Optional[asyncio.Queue] = None,
+    concurrency: int = 1,
+):
+    """Runs `concurrency` consumers of `input_queue` until it yields `STAGE_DONE`, the
+    non-None results of `worker` go to `output_queue`. A bounded output queue blocks
+    the stage while the next one is behind (backpressure)."""
+
+    async def consume():
+        while True:
+            item = await input_queue.get()
+            if item is STAGE_DONE:
+                # Leave the marker for the other consumers of this stage
+                await input_queue.put(STAGE_DONE)
+                return
+
+            result = await worker(item)
+            if result is not None and output_queue is not None:
+                await output_queue.put(result)
+
+    await asyncio.gather(*[consume() for _ in range(max(1, concurrency))])
+    if output_queue is not None:
+        await output_queue.put(STAGE_DONE)
+
+
+async def run_pipeline(stages: List[Coroutine]):
+    # A failing stage cancels the others, they would wait on its queue forever
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import os
+import time
+import random
+import asyncio
+from typing import Optional
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Refills `capacity` units every `period` seconds; waiters are served in FIFO order."""
+
+    def __init__(self, capacity: int, period: float = 60.0) -> None:
+        self.capacity = capacity
+        self.refill_rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1):
+        # A single request larger than the bucket would never fit, let it drain the bucket
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            self.refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.refill_rate)
+                self.refill()
+            self.tokens -= amount
+
+
+class RateLimiter:
+    """Requests/min and tokens/min limits, 0 or None disables a limit."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        self.requests_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+
+    async def acquire(self, tokens: int = 0):
+        if self.requests_bucket is not None:
+            await self.requests_bucket.acquire(1)
+        if self.tokens_bucket is not None and tokens > 0:
+            await self.tokens_bucket.acquire(tokens)
+
+
+def get_error_status_code(exc: Exception) -> Optional[int]:
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    status_code = get_error_status_code(exc)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+
+    # Connection resets and timeouts surface without a status code
+    return isinstance(
+        exc, (ConnectionError, TimeoutError, asyncio.TimeoutError)
+    ) or any(name in type(exc).__name__ for name in ("Connection", "Timeout"))
+
+
+def get_backoff_delay(
+    attempt: int, base_delay: float = 1.0, max_delay: float = 60.0
+) -> float:
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
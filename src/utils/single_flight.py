@@ -0,0 +1,56 @@
+import os
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight execution and its result."""
+
+    def __init__(self) -> None:
+        self.in_flight: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def get_stats(self) -> dict:
+        return {
+            name: {
+                **stats,
+                "in_flight": sum(1 for key in self.in_flight if key[0] == name),
+            }
+            for name, stats in self.stats.items()
+        }
+
+    def release(self, flight_key: Tuple[str, Hashable], task: asyncio.Task):
+        if self.in_flight.get(flight_key) is task:
+            del self.in_flight[flight_key]
+
+    async def do(
+        self, name: str, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        stats = self.stats.setdefault(
+            name, {"calls": 0, "executions": 0, "coalesced": 0}
+        )
+        stats["calls"] += 1
+
+        flight_key = (name, key)
+        task = self.in_flight.get(flight_key)
+        if task is None:
+            stats["executions"] += 1
+            task = asyncio.ensure_future(fn())
+            self.in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self.release(flight_key, task))
+        else:
+            stats["coalesced"] += 1
+
+        # Shielded, so a caller that goes away doesn't cancel the others' result
+        return await asyncio.shield(task)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import os
+import json
+from typing import Optional
+
+
+def format_sse_event(data: dict, event: Optional[str] = None) -> str:
+    lines = [] if event is None else [f"event: {event}"]
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import os
+
+# Settings are read from the environment, the units under test don't connect to anything
+for name in [
+    "GH_PAT",
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "COHERE_API_KEY",
+    "WSL_PASS",
+    "POSTGRES_USERNAME",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_HOST",
+    "POSTGRES_PORT",
+    "POSTGRES_MAIN_DATABASE",
+]:
+    os.environ.setdefault(name, "5432" if name == "POSTGRES_PORT" else "test")
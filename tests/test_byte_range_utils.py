@@ -0,0 +1,55 @@
+import pytest
+from utils.byte_range_utils import (
+    get_missing_byte_ranges,
+    merge_byte_ranges,
+    parse_content_range,
+)
+
+
+@pytest.mark.parametrize(
+    "content_range, expected",
+    [
+        ("bytes 0-99/1000", (0, 100)),
+        ("bytes 900-999/1000", (900, 1000)),
+        (" bytes 5-5/1000 ", (5, 6)),
+        ("bytes 0-999/1000", (0, 1000)),
+        ("bytes 0-1000/1000", None),
+        ("bytes 0-99/2000", None),
+        ("bytes 100-99/1000", None),
+        ("bytes 0-99/*", None),
+        ("bytes */1000", None),
+        ("items 0-99/1000", None),
+        ("", None),
+    ],
+)
+def test_parse_content_range(content_range, expected):
+    assert parse_content_range(content_range, file_size=1000) == expected
+
+
+@pytest.mark.parametrize(
+    "byte_ranges, expected",
+    [
+        ([], []),
+        ([[0, 10]], [[0, 10]]),
+        ([[10, 20], [0, 10]], [[0, 20]]),
+        ([[0, 10], [5, 15], [30, 40]], [[0, 15], [30, 40]]),
+        ([[0, 100], [10, 20]], [[0, 100]]),
+        ([[20, 30], [0, 5], [5, 10], [12, 20]], [[0, 10], [12, 30]]),
+    ],
+)
+def test_merge_byte_ranges(byte_ranges, expected):
+    assert merge_byte_ranges(byte_ranges) == expected
+
+
+@pytest.mark.parametrize(
+    "byte_ranges, expected",
+    [
+        ([], [[0, 100]]),
+        ([[0, 100]], []),
+        ([[0, 40], [60, 100]], [[40, 60]]),
+        ([[10, 20], [50, 60]], [[0, 10], [20, 50], [60, 100]]),
+        ([[60, 100], [0, 30], [20, 50]], [[50, 60]]),
+    ],
+)
+def test_get_missing_byte_ranges(byte_ranges, expected):
+    assert get_missing_byte_ranges(byte_ranges, file_size=100) == expected
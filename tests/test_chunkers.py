@@ -0,0 +1,99 @@
+import pytest
+from stores.chunkers import Document
+from stores.chunkers.providers import LineChunker, RecursiveChunker, SentenceChunker
+
+TEXT = (
+    "Retrieval augmented generation grounds answers in documents. "
+    "Each document is split into chunks before it is embedded.\n\n"
+    "Chunks overlap, so a sentence cut at a boundary still appears whole once. "
+    "The overlap is measured in the same units as the chunk size!\n"
+    "Short line.\n"
+    "Another paragraph follows, with a rather long sentence that keeps going "
+    "well past the size of a single chunk so it has to be split somewhere.\n\n"
+) * 5
+
+
+def split(chunker, pages):
+    return [chunk.page_content for chunk in chunker.split_pages(pages)]
+
+
+def rebuild(chunks, overlap_size):
+    text = chunks[0]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        carry = previous[len(previous) - min(overlap_size, len(previous)) :]
+        assert chunk.startswith(carry)
+        text += chunk[len(carry) :]
+    return text
+
+
+@pytest.mark.parametrize("chunker_cls", [RecursiveChunker, SentenceChunker])
+@pytest.mark.parametrize("chunk_size, overlap_size", [(100, 20), (57, 0), (30, 29)])
+def test_chunks_rebuild_the_text(chunker_cls, chunk_size, overlap_size):
+    chunker = chunker_cls(chunk_size=chunk_size, overlap_size=overlap_size)
+    chunks = split(chunker, [Document(page_content=TEXT)])
+
+    assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+    assert rebuild(chunks, overlap_size) == TEXT
+
+
+@pytest.mark.parametrize(
+    "chunker_cls", [LineChunker, RecursiveChunker, SentenceChunker]
+)
+def test_chunks_start_with_exact_overlap(chunker_cls):
+    chunks = split(
+        chunker_cls(chunk_size=80, overlap_size=15), [Document(page_content=TEXT)]
+    )
+
+    assert len(chunks) > 1
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert len(chunk) <= 80
+        assert chunk.startswith(previous[-15:])
+
+
+def test_line_chunker_skips_blank_lines():
+    chunks = split(
+        LineChunker(chunk_size=1000, overlap_size=0),
+        [Document(page_content="first\n\n \n2\nsecond\n")],
+    )
+
+    assert chunks == ["first\nsecond\n"]
+
+
+@pytest.mark.parametrize("chunker_cls", [LineChunker, RecursiveChunker])
+def test_long_unbroken_line_is_hard_split(chunker_cls):
+    text = "x" * 100_000 + "\n"
+    chunks = split(
+        chunker_cls(chunk_size=512, overlap_size=64), [Document(page_content=text)]
+    )
+
+    assert all(len(chunk) <= 512 for chunk in chunks)
+    assert rebuild(chunks, 64) == text
+    # Each chunk adds chunk_size - overlap_size new characters
+    assert len(chunks) == -(-(len(text) - 64) // (512 - 64))
+
+
+def test_overlap_is_capped_below_chunk_size():
+    chunker = RecursiveChunker(chunk_size=10, overlap_size=50)
+    chunks = split(chunker, [Document(page_content="y" * 40)])
+
+    assert chunker.overlap_size == 9
+    assert rebuild(chunks, 9) == "y" * 40
+
+
+def test_page_end_only_on_chunks_crossing_a_page():
+    pages = [
+        Document(page_content="a" * 20 + " ", metadata={"page": 0}),
+        Document(page_content="b" * 10 + " ", metadata={"page": 1}),
+        Document(page_content="c" * 30 + " ", metadata={"page": 2}),
+    ]
+    chunks = list(RecursiveChunker(chunk_size=40, overlap_size=0).split_pages(pages))
+
+    assert [chunk.metadata for chunk in chunks] == [
+        {"page": 0, "page_end": 1},
+        {"page": 2},
+    ]
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        RecursiveChunker(chunk_size=0)
@@ -0,0 +1,111 @@
+import io
+import os
+import asyncio
+import hashlib
+import zipfile
+from types import SimpleNamespace
+import pytest
+from fastapi import UploadFile
+import controllers.data_controller as data_module
+from controllers.data_controller import DataController
+from models import ResponseSignalEnum, AssetDedupPolicyEnum
+
+
+class FakeAssetModel:
+    """Another request inserts the same content first: the insert returns nothing and
+    the winner is only found if it still exists."""
+
+    def __init__(self, winner=None):
+        self.winner = winner
+
+    async def get_assets_by_hashes(self, asset_hashes, asset_project_id=None):
+        if asset_project_id is None or self.winner is None:
+            return []
+        return [self.winner] if self.winner.asset_hash in asset_hashes else []
+
+    async def insert_many_assets(self, assets):
+        return []
+
+
+@pytest.fixture
+def saved_file(tmp_path):
+    file_path = tmp_path / "a.txt"
+    file_path.write_text("content")
+    return {"file_path": str(file_path), "file_name": "a.txt", "file_hash": "abc"}
+
+
+def create_file_assets(asset_model, saved_file, monkeypatch):
+    async def create_instance(db_client):
+        return asset_model
+
+    monkeypatch.setattr(data_module.AssetModel, "create_instance", create_instance)
+    controller = DataController()
+    controller.app_settings.FILE_DEDUP_POLICY = AssetDedupPolicyEnum.LINK.value
+    return asyncio.run(
+        controller.create_file_assets(
+            db_client=None,
+            project=SimpleNamespace(project_id=1),
+            saved_files=[saved_file],
+        )
+    )
+
+
+def test_lost_race_links_to_the_winner(saved_file, monkeypatch):
+    winner = SimpleNamespace(asset_id=5, asset_hash="abc")
+
+    results = create_file_assets(FakeAssetModel(winner), saved_file, monkeypatch)
+
+    assert results == [(ResponseSignalEnum.FILE_DUPLICATE_LINKED.value, winner, 0)]
+    assert not os.path.exists(saved_file["file_path"])
+
+
+def test_lost_race_to_a_deleted_winner_keeps_the_file(saved_file, monkeypatch):
+    results = create_file_assets(FakeAssetModel(), saved_file, monkeypatch)
+
+    assert results == [(ResponseSignalEnum.FILE_UPLOAD_FAILED.value, None, 0)]
+    assert os.path.exists(saved_file["file_path"])
+
+
+def zip_upload(entries):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, mode="w") as zip_file:
+        for entry_name, content in entries.items():
+            zip_file.writestr(entry_name, content)
+    return UploadFile(
+        file=io.BytesIO(archive.getvalue()),
+        filename="corpus.zip",
+        size=len(archive.getvalue()),
+    )
+
+
+def test_bulk_archive_keeps_allowed_entries_up_to_the_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        data_module.ProjectController,
+        "get_project_path",
+        lambda self, project_id: str(tmp_path),
+    )
+    controller = DataController()
+    controller.app_settings.FILE_BULK_MAX_FILES = 2
+    upload = zip_upload(
+        {
+            "a.txt": b"first",
+            "docs/b.txt": b"second",
+            "docs/c.txt": b"third",
+            "tool.exe": b"binary",
+            ".hidden.txt": b"hidden",
+            "__MACOSX/a.txt": b"metadata",
+        }
+    )
+
+    saved_files = asyncio.run(controller.save_bulk_files([upload], project_id=1))
+
+    saved = {f["original_file_name"]: f for f in saved_files if "file_path" in f}
+    assert sorted(saved) == ["a.txt", "docs/b.txt"]
+    assert saved["a.txt"]["file_hash"] == hashlib.sha256(b"first").hexdigest()
+    assert [f["signal"] for f in saved_files if "file_path" not in f] == [
+        ResponseSignalEnum.BULK_FILES_LIMIT_EXCEEDED.value
+    ]
+    # The archive itself is removed once its entries are extracted
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(f["file_path"]) for f in saved.values()
+    )
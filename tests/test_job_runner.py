@@ -0,0 +1,105 @@
+import asyncio
+from models.enums.job_enum import JobStatusEnum
+from utils.job_runner import JobRunner
+
+
+async def succeed(job):
+    job.update_progress(processed=0, total=4)
+    job.update_progress(advance=4)
+    return True, {"signal": "done"}
+
+
+async def wait_forever(job):
+    await asyncio.Event().wait()
+    return True, {}
+
+
+def test_job_reports_result_and_progress():
+    async def run():
+        runner = JobRunner()
+        job = runner.submit(job_type="process", project_id=1, fn=succeed)
+        await job.task
+        return job
+
+    job = asyncio.run(run())
+
+    assert job.status == JobStatusEnum.SUCCEEDED.value
+    assert job.result == {"signal": "done"}
+    assert job.to_dict()["progress"]["percent"] == 100
+
+
+def test_failing_job_records_the_error():
+    async def fail(job):
+        raise RuntimeError("broken file")
+
+    async def run():
+        runner = JobRunner()
+        job = runner.submit(job_type="process", project_id=1, fn=fail)
+        await job.task
+        return job
+
+    job = asyncio.run(run())
+
+    assert job.status == JobStatusEnum.FAILED.value
+    assert job.errors == ["RuntimeError: broken file"]
+
+
+def test_cancel_running_and_queued_jobs():
+    async def run():
+        runner = JobRunner(max_concurrent_jobs=1)
+        running = runner.submit(job_type="index", project_id=1, fn=wait_forever)
+        queued = runner.submit(job_type="index", project_id=1, fn=wait_forever)
+        await asyncio.sleep(0.01)
+        statuses = (running.status, queued.status)
+
+        assert runner.cancel(running.job_id) and runner.cancel(queued.job_id)
+        await asyncio.gather(running.task, queued.task)
+        return runner, running, queued, statuses
+
+    runner, running, queued, statuses = asyncio.run(run())
+
+    assert statuses == (JobStatusEnum.RUNNING.value, JobStatusEnum.QUEUED.value)
+    assert running.status == queued.status == JobStatusEnum.CANCELLED.value
+    assert queued.started_at is None
+    # Finished and unknown jobs can't be cancelled
+    assert not runner.cancel(running.job_id)
+    assert not runner.cancel("missing")
+
+
+def test_concurrency_is_limited():
+    async def run():
+        runner = JobRunner(max_concurrent_jobs=2)
+        jobs = [
+            runner.submit(job_type="index", project_id=1, fn=wait_forever)
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        stats = runner.get_stats()
+        await runner.shutdown()
+        return stats, jobs
+
+    stats, jobs = asyncio.run(run())
+
+    assert stats[JobStatusEnum.RUNNING.value] == 2
+    assert stats[JobStatusEnum.QUEUED.value] == 3
+    assert all(job.status == JobStatusEnum.CANCELLED.value for job in jobs)
+
+
+def test_oldest_finished_jobs_are_evicted():
+    async def run():
+        runner = JobRunner(max_concurrent_jobs=1, max_finished_jobs=2)
+        running = runner.submit(job_type="index", project_id=1, fn=wait_forever)
+        jobs = [
+            runner.submit(job_type="process", project_id=1, fn=succeed)
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.01)
+        runner.cancel(running.job_id)
+        await asyncio.gather(running.task, *[job.task for job in jobs])
+        return runner, jobs
+
+    runner, jobs = asyncio.run(run())
+
+    # The cancelled job finished first, only the two latest finished jobs remain
+    assert list(runner.jobs) == [job.job_id for job in jobs[-2:]]
+    assert runner.get(jobs[0].job_id) is None
@@ -0,0 +1,47 @@
+import asyncio
+from types import SimpleNamespace
+from controllers.nlp_controller import NLPController
+from models.db_schemas import RetrievedDocument
+
+
+class UnreachableCache:
+    """The collection version is readable but the entries' reads and writes fail."""
+
+    async def get_version(self, key):
+        return 1
+
+    async def get(self, key):
+        raise ConnectionError("cache unreachable")
+
+    async def set(self, key, value):
+        raise ConnectionError("cache unreachable")
+
+
+class FakeEmbeddingClient:
+    async def aembed_text(self, text, document_type):
+        return [[1.0, 0.0]]
+
+
+class FakeVectorDBClient:
+    default_vector_size = 2
+
+    async def search_by_vector(self, **kwargs):
+        return [RetrievedDocument(text="chunk", score=0.9, chunk_id=1)]
+
+
+def test_search_falls_back_to_the_vector_database_when_the_cache_fails():
+    nlp_controller = NLPController(
+        vectordb_client=FakeVectorDBClient(),
+        generation_client=None,
+        embedding_client=FakeEmbeddingClient(),
+        template_parser=None,
+        search_cache=UnreachableCache(),
+    )
+
+    results = asyncio.run(
+        nlp_controller.search_vectordb_collection(
+            project=SimpleNamespace(project_id=1), text="query", limit=5
+        )
+    )
+
+    assert results == [RetrievedDocument(text="chunk", score=0.9, chunk_id=1)]
@@ -0,0 +1,76 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import numpy as np
+from stores.vectordb import DistanceMethodEnum, PgVectorTableSchemeEnums
+from stores.vectordb.providers import PGVectorProvider
+
+
+class RecordingSession:
+    """Keeps the statements a search runs, the query returns one row."""
+
+    def __init__(self):
+        self.statements = []
+
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+        return SimpleNamespace(
+            fetchall=lambda: [SimpleNamespace(text="chunk", score=0.9, chunk_id=1)]
+        )
+
+
+def search(provider, session, **kwargs):
+    @asynccontextmanager
+    async def db_client():
+        yield session
+
+    async def is_collection_existed(collection_name):
+        return True
+
+    async def get_driver_connection(session):
+        return None
+
+    provider.db_client = db_client
+    provider.is_collection_existed = is_collection_existed
+    provider.get_driver_connection = get_driver_connection
+    return asyncio.run(
+        provider.search_by_vector(
+            collection_name="collection_2_1",
+            vector=np.array([1.0, 0.0], dtype=np.float32),
+            **kwargs,
+        )
+    )
+
+
+def test_search_orders_by_the_distance_operator():
+    provider = PGVectorProvider(
+        db_client=None, distance_method=DistanceMethodEnum.COSINE.value
+    )
+    session = RecordingSession()
+
+    results = search(provider, session, limit=5)
+
+    query, params = session.statements[-1]
+    # Ordering by the score expression would keep the vector index from serving it
+    vector_column = PgVectorTableSchemeEnums.VECTOR.value
+    order_by = f"ORDER BY {vector_column} {provider.distance_operator} :vector"
+    assert f"{order_by} LIMIT :limit" in query
+    assert params["limit"] == 5
+    assert [result.text for result in results] == ["chunk"]
+
+
+def test_search_settings_are_per_request_and_cover_the_limit():
+    provider = PGVectorProvider(db_client=None, hnsw_ef_search=40, ivfflat_probes=1)
+    session = RecordingSession()
+
+    search(provider, session, limit=100, probes=7)
+    _, params = session.statements[0]
+    assert params == {"ef_search": "100", "probes": "7"}
+
+    search(provider, session, limit=5, ef_search=64)
+    _, params = session.statements[2]
+    assert params == {"ef_search": "64", "probes": "1"}
@@ -0,0 +1,250 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from stores.chunkers import Document
+from utils.hash_utils import compute_chunk_hash
+import controllers.pipeline_controller as pipeline_module
+from controllers.pipeline_controller import PipelineController
+from utils.job_runner import Job
+
+
+class FakeNLPController:
+    def __init__(self, error_pages=()):
+        self.error_pages = set(error_pages)
+        self.indexed = []
+        self.embedding_seconds = 0.0
+        self.insert_seconds = 0.0
+
+    def create_collection_name(self, project_id):
+        return f"collection_{project_id}"
+
+    def invalidate_answer_cache(self, project):
+        pass
+
+    async def index_into_vectordb(self, project, chunks, chunk_ids):
+        if chunk_ids[0] in self.error_pages:
+            raise ConnectionError("vector database unreachable")
+        self.indexed.extend(chunk_ids)
+        return True
+
+    async def embed_chunks(self, chunks):
+        return [[1.0, 0.0] for _ in chunks]
+
+    async def insert_into_vectordb(self, project, chunks, chunk_ids, vectors):
+        return await self.index_into_vectordb(project, chunks, chunk_ids)
+
+    async def build_vector_index(self, project):
+        pass
+
+
+class FakeChunkModel:
+    def __init__(self, chunk_ids=None, page_size=2, mark_error=None):
+        self.chunk_ids = chunk_ids or []
+        self.page_size = page_size
+        self.mark_error = mark_error
+        self.marked = []
+        self.asset_chunks = []
+
+    async def iter_project_chunks(self, **kwargs):
+        for start in range(0, len(self.chunk_ids), self.page_size):
+            yield [
+                SimpleNamespace(chunk_id=chunk_id)
+                for chunk_id in self.chunk_ids[start : start + self.page_size]
+            ]
+
+    async def insert_many_chunks(self, chunks):
+        for chunk in chunks:
+            chunk.chunk_id = len(self.chunk_ids) + 1
+            self.chunk_ids.append(chunk.chunk_id)
+        return len(chunks)
+
+    async def mark_chunks_indexed(self, chunk_ids):
+        if self.mark_error is not None:
+            raise self.mark_error
+        self.marked.extend(chunk_ids)
+
+    async def get_asset_chunks(self, asset_id):
+        return self.asset_chunks
+
+    async def update_chunk_orders(self, chunk_orders):
+        self.chunk_orders = chunk_orders
+        return len(chunk_orders)
+
+    async def delete_chunks_by_ids(self, chunk_ids):
+        self.deleted = chunk_ids
+        return len(chunk_ids)
+
+
+class FakeProjectModel:
+    @classmethod
+    async def create_instance(cls, db_client):
+        return cls()
+
+    async def get_or_create_project(self, project_id):
+        return SimpleNamespace(project_id=project_id)
+
+
+class FakeAssetModel:
+    def __init__(self, db_client):
+        self.db_client = db_client
+
+    async def update_asset_config(self, asset_id, asset_config):
+        return 1
+
+
+class FakeProcessController:
+    project_path = None
+    texts = []
+
+    def __init__(self, project_id):
+        self.project_id = project_id
+
+    async def aprocess_file(self, file_id, **kwargs):
+        return [Document(page_content=text, metadata={}) for text in self.texts]
+
+    async def aiter_file_chunks(self, file_id, **kwargs):
+        yield [
+            Document(page_content=f"{file_id} {i}", metadata={"page": 0})
+            for i in range(3)
+        ]
+
+
+class FakeVectorDBClient:
+    default_vector_size = 2
+
+    def __init__(self):
+        self.deleted = []
+
+    async def create_collection(self, **kwargs):
+        return True
+
+    async def delete_many(self, collection_name, record_ids):
+        self.deleted.extend(record_ids)
+        return True
+
+
+@pytest.fixture
+def pipeline():
+    app_state = SimpleNamespace(
+        db_client=None,
+        vectordb_client=FakeVectorDBClient(),
+        generation_client=None,
+        embedding_client=SimpleNamespace(embedding_size=2),
+        template_parser=None,
+        answer_cache=None,
+        search_cache=None,
+        single_flight=None,
+        process_pool=None,
+    )
+    pipeline = PipelineController(app_state)
+    pipeline.app_settings.VECTOR_DB_INDEXING_PAGE_SIZE = 2
+    pipeline.app_settings.EMBEDDING_MAX_CONCURRENCY = 2
+    return pipeline
+
+
+def index_chunks(pipeline, chunk_model, job):
+    return asyncio.run(
+        pipeline.index_chunks(
+            project=SimpleNamespace(project_id=1),
+            chunk_model=chunk_model,
+            total_chunks_count=len(chunk_model.chunk_ids),
+            job=job,
+        )
+    )
+
+
+def test_index_chunks_indexes_every_page(pipeline):
+    pipeline.nlp_controller = FakeNLPController()
+    chunk_model = FakeChunkModel(chunk_ids=[1, 2, 3, 4, 5], page_size=2)
+    job = Job(job_type="index", project_id=1)
+
+    assert index_chunks(pipeline, chunk_model, job) == (True, 5)
+    assert chunk_model.marked == [1, 2, 3, 4, 5]
+    assert job.processed == 5 and job.errors == []
+
+
+def test_index_chunks_records_a_failing_page(pipeline):
+    pipeline.nlp_controller = FakeNLPController(error_pages=[3])
+    chunk_model = FakeChunkModel(chunk_ids=[1, 2, 3, 4, 5], page_size=2)
+    job = Job(job_type="index", project_id=1)
+
+    is_inserted, _ = index_chunks(pipeline, chunk_model, job)
+
+    assert not is_inserted
+    assert 3 not in chunk_model.marked and 4 not in chunk_model.marked
+    assert "ConnectionError: vector database unreachable" in job.errors
+
+
+def ingest_project(pipeline, chunk_model, monkeypatch):
+    async def get_project_files(project, file_id=None):
+        return {1: "a.txt", 2: "b.txt"}, None
+
+    monkeypatch.setattr(pipeline_module, "ProjectModel", FakeProjectModel)
+    monkeypatch.setattr(
+        pipeline_module.DataChunkModel,
+        "create_instance",
+        classmethod(lambda cls, db_client: asyncio.sleep(0, chunk_model)),
+    )
+    monkeypatch.setattr(pipeline_module, "ProcessController", FakeProcessController)
+    monkeypatch.setattr(pipeline, "get_project_files", get_project_files)
+    job = Job(job_type="ingest", project_id=1)
+    is_success, content = asyncio.run(
+        pipeline.ingest_project(project_id=1, job=job, build_vector_index=False)
+    )
+    return is_success, content, job
+
+
+def test_ingest_project_indexes_every_file(pipeline, monkeypatch):
+    pipeline.nlp_controller = FakeNLPController()
+    chunk_model = FakeChunkModel()
+
+    is_success, content, job = ingest_project(pipeline, chunk_model, monkeypatch)
+
+    assert is_success and content["indexed_chunks"] == 6
+    assert sorted(chunk_model.marked) == [1, 2, 3, 4, 5, 6]
+    assert job.errors == []
+
+
+def test_ingest_project_records_a_failing_mark_per_asset(pipeline, monkeypatch):
+    pipeline.nlp_controller = FakeNLPController()
+    chunk_model = FakeChunkModel(mark_error=ConnectionError("database unreachable"))
+
+    is_success, content, job = ingest_project(pipeline, chunk_model, monkeypatch)
+
+    assert not is_success
+    for file_result in content["files"]:
+        # Two batches per file, each failing on its own
+        assert file_result["indexed_chunks"] == 0
+        assert file_result["errors"] == ["ConnectionError: database unreachable"] * 2
+    assert "a.txt: ConnectionError: database unreachable" in job.errors
+
+
+def test_incremental_processing_writes_only_the_difference(
+    pipeline, monkeypatch, tmp_path
+):
+    (tmp_path / "a.txt").write_text("x a c")
+    monkeypatch.setattr(pipeline_module, "AssetModel", FakeAssetModel)
+    monkeypatch.setattr(pipeline_module, "ProcessController", FakeProcessController)
+    monkeypatch.setattr(FakeProcessController, "project_path", str(tmp_path))
+    monkeypatch.setattr(FakeProcessController, "texts", ["x", "a", "c"])
+    chunk_model = FakeChunkModel(chunk_ids=[1, 2, 3])
+    chunk_model.asset_chunks = [
+        (chunk_id, compute_chunk_hash(text, {}), chunk_id)
+        for chunk_id, text in [(1, "a"), (2, "b"), (3, "c")]
+    ]
+
+    file_result = asyncio.run(
+        pipeline.process_file_incremental(
+            project=SimpleNamespace(project_id=1),
+            chunk_model=chunk_model,
+            asset=SimpleNamespace(asset_id=1, asset_name="a.txt", asset_config={}),
+        )
+    )
+
+    assert file_result["inserted_chunks"] == 1
+    assert file_result["kept_chunks"] == 2
+    assert file_result["deleted_chunks"] == 1
+    # "b" is gone with its vector, "a" moved after the new "x", "c" kept its place
+    assert chunk_model.deleted == [2]
+    assert pipeline.app_state.vectordb_client.deleted == [2]
+    assert chunk_model.chunk_orders == [(1, 2)]
@@ -0,0 +1,119 @@
+import time
+import random
+import asyncio
+from types import SimpleNamespace
+import pytest
+from utils.rate_limit_utils import (
+    RateLimiter,
+    TokenBucket,
+    get_backoff_delay,
+    get_retry_after,
+    is_retryable_error,
+)
+
+
+def test_full_bucket_does_not_wait():
+    async def run():
+        bucket = TokenBucket(capacity=100, period=60)
+        start_time = time.monotonic()
+        for _ in range(10):
+            await bucket.acquire(10)
+        return time.monotonic() - start_time, bucket.tokens
+
+    elapsed, tokens = asyncio.run(run())
+
+    assert elapsed < 0.05
+    assert tokens < 1
+
+
+def test_empty_bucket_waits_for_the_refill():
+    async def run():
+        # 1000 units per second
+        bucket = TokenBucket(capacity=100, period=0.1)
+        await bucket.acquire(100)
+        start_time = time.monotonic()
+        await bucket.acquire(50)
+        return time.monotonic() - start_time
+
+    assert 0.04 <= asyncio.run(run()) < 0.5
+
+
+def test_request_larger_than_the_bucket_drains_it():
+    async def run():
+        bucket = TokenBucket(capacity=10, period=60)
+        await asyncio.wait_for(bucket.acquire(1000), timeout=1)
+        return bucket.tokens
+
+    assert asyncio.run(run()) < 1
+
+
+def test_waiters_are_served_in_order():
+    async def run():
+        bucket = TokenBucket(capacity=10, period=0.01)
+        served = []
+
+        async def acquire(name):
+            await bucket.acquire(10)
+            served.append(name)
+
+        await asyncio.gather(*[acquire(name) for name in "abcd"])
+        return served
+
+    assert asyncio.run(run()) == list("abcd")
+
+
+def test_rate_limiter_disabled_limits():
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=None)
+
+    assert limiter.requests_bucket is None and limiter.tokens_bucket is None
+    asyncio.run(asyncio.wait_for(limiter.acquire(tokens=10**9), timeout=1))
+
+
+@pytest.mark.parametrize("attempt", range(8))
+def test_backoff_delay_is_jittered_and_capped(attempt):
+    random.seed(attempt)
+    delays = [
+        get_backoff_delay(attempt, base_delay=0.5, max_delay=10) for _ in range(200)
+    ]
+
+    assert all(0 <= delay <= min(10, 0.5 * 2**attempt) for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_delay_grows_with_attempts():
+    random.seed(0)
+    first = [get_backoff_delay(0) for _ in range(500)]
+    fifth = [get_backoff_delay(4) for _ in range(500)]
+
+    assert max(first) <= 1 < max(fifth)
+    assert sum(fifth) / len(fifth) > 4 * sum(first) / len(first)
+
+
+def http_error(status_code, headers=None):
+    error = Exception("http error")
+    error.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+    return error
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (http_error(429), True),
+        (http_error(503), True),
+        (http_error(400), False),
+        (http_error(401), False),
+        (ConnectionError("reset"), True),
+        (TimeoutError(), True),
+        (type("APITimeoutError", (Exception,), {})(), True),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_is_retryable_error(error, expected):
+    assert is_retryable_error(error) is expected
+
+
+def test_get_retry_after():
+    assert get_retry_after(http_error(429, {"retry-after": "2.5"})) == 2.5
+    assert get_retry_after(http_error(429, {"retry-after": "soon"})) is None
+    assert get_retry_after(http_error(429)) is None
+    assert get_retry_after(ValueError()) is None
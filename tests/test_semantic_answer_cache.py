@@ -0,0 +1,96 @@
+import time
+import numpy as np
+from stores.cache import SemanticAnswerCache
+
+
+def vector(*values):
+    return np.array(values, dtype=np.float32)
+
+
+def test_similar_query_hits_and_distant_one_misses():
+    cache = SemanticAnswerCache(similarity_threshold=0.95)
+    cache.set(project_id=1, query="q", query_vector=vector(1, 0), limit=5, answer="a")
+
+    hit = cache.get(project_id=1, query_vector=vector(10, 0.5), limit=5)
+    assert hit is not None and hit.answer == "a"
+    assert cache.get(project_id=1, query_vector=vector(0, 1), limit=5) is None
+    assert cache.get_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "invalidations": 0,
+        "entries": 1,
+    }
+
+
+def test_entries_are_per_project_and_limit():
+    cache = SemanticAnswerCache()
+    cache.set(project_id=1, query="q", query_vector=vector(1, 0), limit=5, answer="a")
+
+    assert cache.get(project_id=2, query_vector=vector(1, 0), limit=5) is None
+    assert cache.get(project_id=1, query_vector=vector(1, 0), limit=10) is None
+
+
+def test_entries_of_another_collection_version_miss():
+    cache = SemanticAnswerCache()
+    cache.set(
+        project_id=1,
+        query="q",
+        query_vector=vector(1, 0),
+        limit=5,
+        answer="a",
+        version=3,
+    )
+
+    assert (
+        cache.get(project_id=1, query_vector=vector(1, 0), limit=5, version=4) is None
+    )
+    hit = cache.get(project_id=1, query_vector=vector(1, 0), limit=5, version=3)
+    assert hit is not None and hit.answer == "a"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticAnswerCache(max_entries_per_project=2)
+    cache.set(
+        project_id=1, query="x", query_vector=vector(1, 0, 0), limit=5, answer="x"
+    )
+    cache.set(
+        project_id=1, query="y", query_vector=vector(0, 1, 0), limit=5, answer="y"
+    )
+    # Reading x makes y the least recently used
+    assert cache.get(project_id=1, query_vector=vector(1, 0, 0), limit=5) is not None
+    cache.set(
+        project_id=1, query="z", query_vector=vector(0, 0, 1), limit=5, answer="z"
+    )
+
+    assert cache.get(project_id=1, query_vector=vector(0, 1, 0), limit=5) is None
+    assert cache.get(project_id=1, query_vector=vector(1, 0, 0), limit=5) is not None
+    assert cache.get(project_id=1, query_vector=vector(0, 0, 1), limit=5) is not None
+
+
+def test_expired_entries_are_not_returned():
+    cache = SemanticAnswerCache(ttl_seconds=0.01)
+    cache.set(project_id=1, query="q", query_vector=vector(1, 0), limit=5, answer="a")
+    time.sleep(0.02)
+
+    assert cache.get(project_id=1, query_vector=vector(1, 0), limit=5) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_no_ttl_keeps_entries():
+    cache = SemanticAnswerCache(ttl_seconds=None)
+    cache.set(project_id=1, query="q", query_vector=vector(1, 0), limit=5, answer="a")
+    cache.entries[1][0].created_at -= 10**6
+
+    assert cache.get(project_id=1, query_vector=vector(1, 0), limit=5) is not None
+
+
+def test_invalidate_drops_only_the_project():
+    cache = SemanticAnswerCache()
+    cache.set(project_id=1, query="q", query_vector=vector(1, 0), limit=5, answer="a")
+    cache.set(project_id=2, query="q", query_vector=vector(1, 0), limit=5, answer="b")
+    cache.invalidate(project_id=1)
+    cache.invalidate(project_id=3)
+
+    assert cache.get(project_id=1, query_vector=vector(1, 0), limit=5) is None
+    assert cache.get(project_id=2, query_vector=vector(1, 0), limit=5).answer == "b"
+    assert cache.get_stats()["invalidations"] == 1
@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    async def run():
+        single_flight = SingleFlight()
+        executions = 0
+
+        async def compute():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(
+            *[single_flight.do("search", "query", compute) for _ in range(5)]
+        )
+        return single_flight, executions, results
+
+    single_flight, executions, results = asyncio.run(run())
+
+    assert executions == 1
+    assert results == ["answer"] * 5
+    assert single_flight.get_stats() == {
+        "search": {"calls": 5, "executions": 1, "coalesced": 4, "in_flight": 0}
+    }
+
+
+def test_different_keys_and_names_run_separately():
+    async def run():
+        single_flight = SingleFlight()
+
+        async def compute(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        return await asyncio.gather(
+            single_flight.do("search", "a", lambda: compute(1)),
+            single_flight.do("search", "b", lambda: compute(2)),
+            single_flight.do("answer", "a", lambda: compute(3)),
+        )
+
+    assert asyncio.run(run()) == [1, 2, 3]
+
+
+def test_finished_call_runs_again():
+    async def run():
+        single_flight = SingleFlight()
+        executions = 0
+
+        async def compute():
+            nonlocal executions
+            executions += 1
+            return executions
+
+        first = await single_flight.do("search", "query", compute)
+        second = await single_flight.do("search", "query", compute)
+        return single_flight, first, second
+
+    single_flight, first, second = asyncio.run(run())
+
+    assert (first, second) == (1, 2)
+    assert single_flight.in_flight == {}
+
+
+def test_error_reaches_every_caller_and_is_not_kept():
+    async def run():
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            *[single_flight.do("search", "query", fail) for _ in range(3)],
+            return_exceptions=True,
+        )
+        return single_flight, results
+
+    single_flight, results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.in_flight == {}
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def run():
+        single_flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        leaving = asyncio.create_task(single_flight.do("search", "query", compute))
+        staying = asyncio.create_task(single_flight.do("search", "query", compute))
+        await asyncio.sleep(0.01)
+        leaving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leaving
+        return await staying
+
+    assert asyncio.run(run()) == "answer"
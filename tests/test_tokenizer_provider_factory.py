@@ -0,0 +1,24 @@
+import tiktoken
+from stores.tokenizers import get_tokenizer
+from stores.tokenizers.providers import CharacterTokenizer, TiktokenTokenizer
+from stores.tokenizers.tokenizer_provider_factory import load_tiktoken_tokenizer
+
+
+def test_failed_load_is_retried_on_the_next_call(monkeypatch):
+    encodings = iter([ConnectionError("offline"), object()])
+
+    def get_encoding(encoding_name):
+        encoding = next(encodings)
+        if isinstance(encoding, Exception):
+            raise encoding
+        return encoding
+
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    load_tiktoken_tokenizer.cache_clear()
+    try:
+        assert isinstance(get_tokenizer(model_id="gpt-4o"), CharacterTokenizer)
+        tokenizer = get_tokenizer(model_id="gpt-4o")
+        assert isinstance(tokenizer, TiktokenTokenizer)
+        assert get_tokenizer(model_id="gpt-4o") is tokenizer
+    finally:
+        load_tiktoken_tokenizer.cache_clear()
@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from controllers.worker_controller import WorkerController
+from models.enums.job_enum import JobStatusEnum
+
+
+class FakeJobModel:
+    """Keeps the job's owner like the jobs table, updates from other workers match nothing."""
+
+    def __init__(self, owner="worker-1"):
+        self.owner = owner
+        self.calls = []
+
+    async def update_job_progress(self, **kwargs):
+        return JobStatusEnum.RUNNING.value
+
+    async def finish_job(self, job_id, worker_id, job_status, result=None, error=None):
+        self.calls.append(("finish", worker_id, job_status, error))
+        return int(worker_id == self.owner)
+
+    async def requeue_job(self, job_id, worker_id, error):
+        self.calls.append(("requeue", worker_id, error))
+        return int(worker_id == self.owner)
+
+
+class FakePipelineController:
+    def __init__(self, error=None):
+        self.error = error
+        self.finalized = []
+
+    async def run_queued_job(self, queued_job, job):
+        if self.error is not None:
+            raise self.error
+        return True, {"signal": "done"}
+
+    async def finalize_queued_job(self, queued_job):
+        self.finalized.append(queued_job.job_id)
+
+
+@pytest.fixture
+def worker():
+    app_state = SimpleNamespace(
+        db_client=None,
+        vectordb_client=None,
+        generation_client=None,
+        embedding_client=None,
+        template_parser=None,
+        answer_cache=None,
+        search_cache=None,
+        single_flight=None,
+        process_pool=None,
+    )
+    return WorkerController(app_state, worker_id="worker-1")
+
+
+def queued_job(attempts=1):
+    return SimpleNamespace(
+        job_id=7, job_type="index", job_project_id=1, job_attempts=attempts
+    )
+
+
+def test_finished_job_is_finalized(worker):
+    job_model = FakeJobModel()
+    worker.pipeline_controller = FakePipelineController()
+    asyncio.run(worker.run_job(job_model, queued_job()))
+
+    assert job_model.calls == [
+        ("finish", "worker-1", JobStatusEnum.SUCCEEDED.value, None)
+    ]
+    assert worker.pipeline_controller.finalized == [7]
+
+
+def test_job_lost_to_another_worker_is_not_finalized(worker):
+    job_model = FakeJobModel(owner="worker-2")
+    worker.pipeline_controller = FakePipelineController()
+    asyncio.run(worker.run_job(job_model, queued_job()))
+
+    assert job_model.calls[0][:2] == ("finish", "worker-1")
+    assert worker.pipeline_controller.finalized == []
+
+
+def test_failed_job_is_requeued_then_failed(worker):
+    job_model = FakeJobModel()
+    worker.pipeline_controller = FakePipelineController(ConnectionError("reset"))
+    asyncio.run(worker.run_job(job_model, queued_job(attempts=1)))
+    asyncio.run(
+        worker.run_job(
+            job_model, queued_job(attempts=worker.app_settings.WORKER_MAX_ATTEMPTS)
+        )
+    )
+
+    assert job_model.calls == [
+        ("requeue", "worker-1", "ConnectionError: reset"),
+        (
+            "finish",
+            "worker-1",
+            JobStatusEnum.FAILED.value,
+            "ConnectionError: reset",
+        ),
+    ]
+    assert worker.pipeline_controller.finalized == []
+
+
+def test_exhausted_job_is_failed_without_running(worker):
+    job_model = FakeJobModel()
+    worker.pipeline_controller = FakePipelineController(AssertionError("ran"))
+    asyncio.run(
+        worker.run_job(
+            job_model, queued_job(attempts=worker.app_settings.WORKER_MAX_ATTEMPTS + 1)
+        )
+    )
+
+    assert job_model.calls == [
+        ("finish", "worker-1", JobStatusEnum.FAILED.value, "Attempts exhausted")
+    ]
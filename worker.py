@@ -0,0 +1,55 @@
+import os
+import socket
+import signal
+import asyncio
+import argparse
+import logging
+from fastapi import FastAPI
+from main import lifespan
+from controllers import WorkerController
+from utils import get_settings
+
+logger = logging.getLogger("uvicorn")
+
+
+async def run_workers(concurrency: int):
+    # Same clients as the API (database, vector DB, LLMs, process pool) without serving HTTP
+    app = FastAPI(lifespan=lifespan)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    async with lifespan(app):
+        worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        await asyncio.gather(
+            *[
+                WorkerController(app.state, worker_id=f"{worker_id}-{i}").run(
+                    stop_event
+                )
+                for i in range(max(1, concurrency))
+            ]
+        )
+    logger.info("Worker %s stopped", worker_id)
+
+
+def main():
+    """Entry Point for the Program."""
+    parser = argparse.ArgumentParser(
+        description="Run processing and indexing jobs from the Postgres jobs queue."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Jobs run at the same time by this process (default: WORKER_CONCURRENCY)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    concurrency = args.concurrency or get_settings().WORKER_CONCURRENCY
+    asyncio.run(run_workers(concurrency))
+
+
+if __name__ == "__main__":
+    main()